@@ -6,6 +6,10 @@ Pandoc GUI 最小化入口点（修复版本）
 
 import sys
 import os
+import time
+
+# 进程开始执行入口文件的时间，打包后的程序在此之前完成解压，供启动耗时记录使用
+_START_TIME = time.time()
 
 # 获取应用程序路径
 if getattr(sys, 'frozen', False):
@@ -38,6 +42,9 @@ else:
     src_path = os.path.join(current_dir, 'src')
     sys.path.insert(0, src_path)
 
+from utils import startup_trace
+startup_trace.mark('main_start', _START_TIME)
+
 # 修复网络检查问题 - 创建一个简单的版本检查函数
 def simple_check_expiration():
     """简单的过期检查，避免网络问题"""
@@ -57,67 +64,85 @@ def simple_check_expiration():
     
     return local_time < EXPIRATION_DATE
 
-try:
-    # 尝试导入PyQt5
-    from PyQt5.QtWidgets import QApplication, QMessageBox
-    from PyQt5.QtCore import Qt
-    from PyQt5.QtGui import QIcon
-    print("PyQt5 import successful")
-    
-    # 尝试直接导入模块，不使用包结构
-    import importlib.util
-    
-    # 加载main_window.py
-    main_window_path = os.path.join(os.path.dirname(__file__), 'src', 'ui', 'main_window.py')
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        main_window_path = os.path.join(sys._MEIPASS, 'src', 'ui', 'main_window.py')
-    
-    print(f"Loading main_window from: {main_window_path}")
-    
-    spec = importlib.util.spec_from_file_location("main_window", main_window_path)
-    main_window_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(main_window_module)
-    
-    PandocGUI = main_window_module.PandocGUI
-    print("PandocGUI class loaded successfully")
-    
-    # 创建应用程序
-    app = QApplication(sys.argv)
-    print("QApplication created")
-    
-    # 执行简单的过期检查（避免网络问题）
-    if not simple_check_expiration():
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.critical(None, "版本过期", "当前版本已过期，请联系开发者获取最新版。")
-        sys.exit(1)
+def main():
+    """创建应用程序并显示主窗口"""
+    try:
+        # 尝试导入PyQt5
+        from PyQt5.QtWidgets import QApplication, QMessageBox
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QIcon
+        print("PyQt5 import successful")
+        startup_trace.mark('pyqt_imported')
     
-    # 创建主窗口
-    window = PandocGUI()
-    print("PandocGUI window created")
-    window.show()
+        # 尝试直接导入模块，不使用包结构
+        import importlib.util
     
-    # 运行应用程序
-    sys.exit(app.exec_())
+        # 加载main_window.py
+        main_window_path = os.path.join(os.path.dirname(__file__), 'src', 'ui', 'main_window.py')
+        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+            main_window_path = os.path.join(sys._MEIPASS, 'src', 'ui', 'main_window.py')
     
-except ImportError as e:
-    print(f"Import error: {e}")
-    print(f"Current working directory: {os.getcwd()}")
-    print(f"sys.path: {sys.path}")
+        print(f"Loading main_window from: {main_window_path}")
     
-    try:
-        app = QApplication(sys.argv)
-        QMessageBox.critical(None, "Import Error", f"Failed to import required modules:\n{e}\n\nPlease ensure all dependencies are installed.")
-    except:
-        pass
-    sys.exit(1)
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
+        spec = importlib.util.spec_from_file_location("main_window", main_window_path)
+        main_window_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(main_window_module)
     
-    try:
+        PandocGUI = main_window_module.PandocGUI
+        print("PandocGUI class loaded successfully")
+        startup_trace.mark('modules_imported')
+    
+        # 创建应用程序
         app = QApplication(sys.argv)
-        QMessageBox.critical(None, "Error", f"An error occurred:\n{e}")
-    except:
-        pass
-    sys.exit(1)
\ No newline at end of file
+        print("QApplication created")
+        startup_trace.mark('qapplication_created')
+    
+        # 设置了 PANDOC_GUI_STALL_WATCHDOG 时检测主线程卡顿
+        if os.environ.get('PANDOC_GUI_STALL_WATCHDOG'):
+            from utils import stall_watchdog
+            stall_watchdog.install()
+    
+        # 执行简单的过期检查（避免网络问题）
+        if not simple_check_expiration():
+            from PyQt5.QtWidgets import QMessageBox
+            QMessageBox.critical(None, "版本过期", "当前版本已过期，请联系开发者获取最新版。")
+            sys.exit(1)
+        startup_trace.mark('expiry_checked')
+    
+        # 创建主窗口
+        window = PandocGUI()
+        print("PandocGUI window created")
+        startup_trace.mark('window_created')
+        window.show()
+        startup_trace.mark('window_shown')
+        startup_trace.watch_first_paint(window)
+    
+        # 运行应用程序
+        sys.exit(app.exec_())
+    
+    except ImportError as e:
+        print(f"Import error: {e}")
+        print(f"Current working directory: {os.getcwd()}")
+        print(f"sys.path: {sys.path}")
+    
+        try:
+            app = QApplication(sys.argv)
+            QMessageBox.critical(None, "Import Error", f"Failed to import required modules:\n{e}\n\nPlease ensure all dependencies are installed.")
+        except:
+            pass
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+    
+        try:
+            app = QApplication(sys.argv)
+            QMessageBox.critical(None, "Error", f"An error occurred:\n{e}")
+        except:
+            pass
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+测量 PandocConverter 的批量转换吞吐量
+生成固定随机种子的合成语料（普通文本、表格、图片、中文、深层嵌套列表），
+按 语料大小 × 输出格式 × 并发数 × 转换后端 × 是否使用参考文档 组合逐项测量，
+输出每项的 files/s、MB/s、延迟 p50/p95 和 pandoc 子进程的峰值内存 (JSON)，
+并可与保存的基线比较，超过阈值时以退出码1报告性能回退。
+
+用法:
+    python benchmark_conversion.py --output result.json
+    python benchmark_conversion.py --sizes 10k,1m,100m --formats docx --jobs 1,4
+    python benchmark_conversion.py --save-baseline baseline.json
+    python benchmark_conversion.py --baseline baseline.json --threshold 0.2
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import zlib
+import random
+import struct
+import argparse
+import itertools
+import tempfile
+import threading
+import subprocess
+import statistics
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+sys.path.insert(0, SRC_DIR)
+
+try:
+    import resource
+except ImportError:
+    # Windows 没有 resource 模块，不记录子进程峰值内存
+    resource = None
+
+from core.pandoc_converter import PandocConverter, DEFAULT_MAX_WORKERS
+from core.capabilities import get_output_extension
+from core.conversion_cache import get_pandoc_version
+from cli import find_pandoc, load_layout_config, prepare_reference_doc
+
+
+# 语料类型
+SHAPES = ['prose', 'tables', 'images', 'cjk', 'nested_lists']
+
+# 默认的测量组合
+DEFAULT_SIZES = '10k,1m'
+DEFAULT_FORMATS = 'docx,html'
+DEFAULT_BACKENDS = 'subprocess'
+
+# 生成语料使用的随机种子，相同种子生成的语料完全相同
+DEFAULT_SEED = 20240501
+
+# 每个语料文件在一次测量中重复转换的次数
+DEFAULT_REPEAT = 2
+
+# 吞吐量下降或 p95 延迟上升超过此比例时视为性能回退
+DEFAULT_THRESHOLD = 0.15
+
+# 测量结果格式版本，基线版本不同时不做比较
+RESULT_VERSION = 1
+
+_SIZE_UNITS = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+
+_WORDS = (
+    'pandoc document format convert template style paragraph heading table figure '
+    'reference output input markdown layout section chapter note list item value '
+    'performance memory process batch worker latency throughput server cache'
+).split()
+
+# 常用汉字，用于生成中文段落
+_CJK_CHARS = (
+    '的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主发年动'
+    '同工也能下过子说产种面而方后多定行学法所民得经十三之进着等部度家电力里如水化高自'
+    '二理起小物现实加量都两体制机当使点从业本去把性好应开它合还因由其些然前外天政四日'
+    '那社义事平形相全表间样与关各重新线内数正心反你明看原又么利比或但质气第向道命此变'
+)
+_CJK_PUNCTUATION = '，，，、。；：'
+
+
+def parse_size(text):
+    """解析 10k、1m、100m 形式的大小，返回字节数"""
+    text = text.strip().lower()
+    unit = _SIZE_UNITS.get(text[-1:], 1)
+    number = text[:-1] if text[-1:] in _SIZE_UNITS else text
+    return int(float(number) * unit)
+
+
+def format_size(size):
+    """把字节数格式化为 10k、1m 形式"""
+    for suffix, unit in (('g', 1024 ** 3), ('m', 1024 ** 2), ('k', 1024)):
+        if size >= unit and size % unit == 0:
+            return f'{size // unit}{suffix}'
+    return str(size)
+
+
+def percentile(values, percent):
+    """计算百分位数 (最近秩法)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _png_bytes(width, height, color):
+    """生成纯色PNG图片"""
+    def chunk(kind, data):
+        return (struct.pack('>I', len(data)) + kind + data
+                + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+    row = b'\x00' + bytes(color) * width
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b''))
+
+
+def _sentence(rng, words=12):
+    text = ' '.join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _prose_block(rng, index):
+    lines = [f'## Section {index}', '']
+    for _ in range(rng.randint(2, 4)):
+        lines.append(' '.join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 6))))
+        lines.append('')
+    if index % 5 == 0:
+        lines += ['```python', f'def step_{index}(value):', '    return value * 2', '```', '']
+    return '\n'.join(lines) + '\n'
+
+
+def _tables_block(rng, index):
+    columns = rng.randint(3, 6)
+    lines = [f'Table {index}: {_sentence(rng, 5)}', '']
+    lines.append('| ' + ' | '.join(f'Col {c + 1}' for c in range(columns)) + ' |')
+    lines.append('|' + '---|' * columns)
+    for _ in range(rng.randint(5, 15)):
+        cells = [rng.choice(_WORDS) if c == 0 else f'{rng.uniform(0, 1000):.2f}' for c in range(columns)]
+        lines.append('| ' + ' | '.join(cells) + ' |')
+    return '\n'.join(lines) + '\n\n'
+
+
+def _images_block(rng, index):
+    image = f'images/figure_{index % 8}.png'
+    return f'![Figure {index}: {_sentence(rng, 4)}]({image})\n\n{_sentence(rng, 16)}\n\n'
+
+
+def _cjk_block(rng, index):
+    lines = [f'## 第{index}节', '']
+    for _ in range(rng.randint(2, 4)):
+        parts = []
+        for _ in range(rng.randint(3, 6)):
+            parts.append(''.join(rng.choice(_CJK_CHARS) for _ in range(rng.randint(8, 20))))
+            parts.append(rng.choice(_CJK_PUNCTUATION))
+        lines.append(''.join(parts).rstrip('，、；：') + '。')
+        lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+def _nested_lists_block(rng, index):
+    lines = [f'List {index}', '']
+    depth = 0
+    for _ in range(rng.randint(10, 30)):
+        depth = max(0, min(8, depth + rng.choice((-1, 0, 1, 1))))
+        marker = '-' if depth % 2 == 0 else '1.'
+        lines.append('    ' * depth + f'{marker} {_sentence(rng, rng.randint(3, 8))}')
+    return '\n'.join(lines) + '\n\n'
+
+
+_BLOCK_GENERATORS = {
+    'prose': _prose_block,
+    'tables': _tables_block,
+    'images': _images_block,
+    'cjk': _cjk_block,
+    'nested_lists': _nested_lists_block,
+}
+
+
+def generate_document(path, shape, size, seed=DEFAULT_SEED):
+    """生成一个合成Markdown文档
+
+    文件大小达到 size 字节后停止写入，相同参数生成的内容完全相同。
+
+    Args:
+        path: 输出文件路径
+        shape: 语料类型，见 SHAPES
+        size: 目标大小 (字节)
+        seed: 随机种子
+
+    Returns:
+        int: 实际写入的字节数
+    """
+    rng = random.Random(f'{seed}:{shape}:{size}')
+    generate_block = _BLOCK_GENERATORS[shape]
+    written = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(f'# Benchmark {shape} {format_size(size)}\n\n')
+        for index in itertools.count(1):
+            if written >= size:
+                break
+            block = generate_block(rng, index)
+            f.write(block)
+            written += len(block.encode('utf-8'))
+    return os.path.getsize(path)
+
+
+def generate_corpus(corpus_dir, sizes, shapes=SHAPES, seed=DEFAULT_SEED):
+    """生成各类型和大小的语料，已存在的文件直接复用
+
+    Args:
+        corpus_dir: 语料目录
+        sizes: 目标大小列表 (字节)
+        shapes: 语料类型列表
+        seed: 随机种子
+
+    Returns:
+        dict: 目标大小到 [(语料类型, 文件路径, 字节数), ...] 的映射
+    """
+    image_dir = os.path.join(corpus_dir, 'images')
+    os.makedirs(image_dir, exist_ok=True)
+    for index in range(8):
+        image_path = os.path.join(image_dir, f'figure_{index}.png')
+        if not os.path.exists(image_path):
+            color = ((index * 37) % 256, (index * 71) % 256, (index * 113) % 256)
+            with open(image_path, 'wb') as f:
+                f.write(_png_bytes(64 + index * 16, 48 + index * 8, color))
+
+    corpus = {}
+    for size in sizes:
+        documents = []
+        for shape in shapes:
+            path = os.path.join(corpus_dir, f'{shape}_{format_size(size)}_{seed}.md')
+            if not os.path.exists(path):
+                generate_document(path, shape, size, seed)
+            documents.append((shape, path, os.path.getsize(path)))
+        corpus[size] = documents
+    return corpus
+
+
+def _peak_child_rss():
+    """已结束的子进程中的最大常驻内存 (字节)，平台不支持时返回None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux 以KB为单位，macOS 以字节为单位
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_cell(cell, documents, pandoc_path, output_dir):
+    """在当前进程中执行一项测量
+
+    Args:
+        cell: 测量参数，包含 format、jobs、backend、template、repeat
+        documents: [(语料类型, 文件路径, 字节数), ...]
+        pandoc_path: pandoc路径
+        output_dir: 输出目录
+
+    Returns:
+        dict: 测量结果
+    """
+    extension = get_output_extension(cell['format'])
+    jobs = []
+    for round_index in range(cell['repeat']):
+        for shape, input_file, _ in documents:
+            jobs.append({
+                'input_file': input_file,
+                'output_file': os.path.join(output_dir, f'{shape}_{round_index}.{extension}'),
+                'template_file': cell['template'],
+                'output_format': cell['format'],
+            })
+    input_bytes = sum(size for _, _, size in documents) * cell['repeat']
+
+    converter = PandocConverter(pandoc_path, backend=cell['backend'])
+    start_times = {}
+    lock = threading.Lock()
+    latencies = []
+    failures = []
+
+    def on_start(job):
+        with lock:
+            start_times[job['output_file']] = time.perf_counter()
+
+    start = time.perf_counter()
+    try:
+        for job, success, message in converter.convert_many(jobs, cell['jobs'], on_start=on_start):
+            latencies.append(time.perf_counter() - start_times[job['output_file']])
+            if not success:
+                failures.append(f"{os.path.basename(job['input_file'])}: {message.strip()[:200]}")
+    finally:
+        converter.close()
+    elapsed = time.perf_counter() - start
+
+    peak_rss = _peak_child_rss()
+    return {
+        'files': len(jobs),
+        'failed': len(failures),
+        'input_bytes': input_bytes,
+        'seconds': round(elapsed, 4),
+        'files_per_second': round(len(jobs) / elapsed, 3),
+        'mb_per_second': round(input_bytes / 1024 ** 2 / elapsed, 3),
+        'latency_p50_ms': round(statistics.median(latencies) * 1000, 2),
+        'latency_p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'peak_child_rss_mb': round(peak_rss / 1024 ** 2, 1) if peak_rss else None,
+        'errors': failures[:5],
+    }
+
+
+def measure_cell(cell, documents, pandoc_path):
+    """在独立的进程中执行一项测量，使子进程峰值内存只统计本项启动的pandoc进程"""
+    with tempfile.TemporaryDirectory(prefix='pandoc_gui_bench_') as output_dir:
+        request = json.dumps({
+            'cell': cell, 'documents': documents,
+            'pandoc': pandoc_path, 'output_dir': output_dir,
+        })
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--run-cell'],
+            input=request, capture_output=True, text=True, encoding='utf-8'
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"测量进程失败:\n{result.stderr.strip()}")
+    return json.loads(result.stdout)
+
+
+def cell_id(cell):
+    """测量项的标识，用于与基线对应"""
+    reference = 'ref' if cell['template'] else 'noref'
+    return f"{cell['size']}/{cell['format']}/j{cell['jobs']}/{cell['backend']}/{reference}"
+
+
+def build_cells(sizes, formats, jobs_levels, backends, template, repeat):
+    """生成所有测量组合，参考文档只对docx输出测量"""
+    cells = []
+    for size, output_format, jobs, backend in itertools.product(sizes, formats, jobs_levels, backends):
+        templates = [None, template] if output_format == 'docx' and template else [None]
+        for template_file in templates:
+            cells.append({
+                'size': format_size(size),
+                'format': output_format,
+                'jobs': jobs,
+                'backend': backend,
+                'template': template_file,
+                'repeat': repeat,
+            })
+    return cells
+
+
+def compare_with_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """与基线比较
+
+    Args:
+        results: 本次测量结果
+        baseline: 基线测量结果
+        threshold: 允许的性能下降比例
+
+    Returns:
+        list: 性能回退的测量项，每项包含 id、metric、baseline、current
+    """
+    if baseline.get('version') != RESULT_VERSION:
+        return []
+
+    baseline_cells = {cell['id']: cell for cell in baseline.get('cells', [])}
+    regressions = []
+    for cell in results['cells']:
+        old = baseline_cells.get(cell['id'])
+        if old is None:
+            continue
+        if cell['files_per_second'] < old['files_per_second'] * (1 - threshold):
+            regressions.append({'id': cell['id'], 'metric': 'files_per_second',
+                                'baseline': old['files_per_second'],
+                                'current': cell['files_per_second']})
+        if cell['latency_p95_ms'] > old['latency_p95_ms'] * (1 + threshold):
+            regressions.append({'id': cell['id'], 'metric': 'latency_p95_ms',
+                                'baseline': old['latency_p95_ms'],
+                                'current': cell['latency_p95_ms']})
+    return regressions
+
+
+def _split(text):
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='测量批量转换吞吐量')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='语料大小，如 10k,1m,100m')
+    parser.add_argument('--shapes', default=','.join(SHAPES), help='语料类型')
+    parser.add_argument('--formats', default=DEFAULT_FORMATS, help='输出格式')
+    parser.add_argument('--jobs', default=f'1,{DEFAULT_MAX_WORKERS}', help='并发数')
+    parser.add_argument('--backends', default=DEFAULT_BACKENDS, help='转换后端，subprocess 和/或 server')
+    parser.add_argument('--preset', default='default', help='参考文档使用的预设模板')
+    parser.add_argument('--no-reference', action='store_true', help='不测量使用参考文档的组合')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='每个语料文件的转换次数')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='生成语料的随机种子')
+    parser.add_argument('--corpus-dir', help='语料目录，默认使用临时目录；指定后可复用已生成的语料')
+    parser.add_argument('--pandoc', help='pandoc可执行文件路径')
+    parser.add_argument('--output', help='结果写入的JSON文件，默认输出到标准输出')
+    parser.add_argument('--baseline', help='与之比较的基线结果文件')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='允许的性能下降比例，默认 0.15')
+    parser.add_argument('--save-baseline', help='把本次结果保存为基线')
+    parser.add_argument('--run-cell', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_cell:
+        request = json.load(sys.stdin)
+        result = run_cell(request['cell'], request['documents'], request['pandoc'], request['output_dir'])
+        print(json.dumps(result, ensure_ascii=False))
+        return 0
+
+    pandoc_path = find_pandoc(args.pandoc)
+    if not pandoc_path:
+        print("找不到pandoc，请通过 --pandoc 或 PANDOC_PATH 环境变量指定", file=sys.stderr)
+        return 2
+
+    try:
+        sizes = [parse_size(size) for size in _split(args.sizes)]
+        jobs_levels = [max(1, int(jobs)) for jobs in _split(args.jobs)]
+    except ValueError as e:
+        parser.error(str(e))
+    shapes = _split(args.shapes)
+    unknown = [shape for shape in shapes if shape not in _BLOCK_GENERATORS]
+    if unknown:
+        parser.error(f"未知的语料类型: {', '.join(unknown)}")
+
+    template = None
+    if not args.no_reference:
+        template = prepare_reference_doc(load_layout_config(args.preset))
+
+    corpus_context = tempfile.TemporaryDirectory(prefix='pandoc_gui_corpus_') if not args.corpus_dir else None
+    corpus_dir = args.corpus_dir or corpus_context.name
+    try:
+        generate_start = time.perf_counter()
+        corpus = generate_corpus(corpus_dir, sizes, shapes, args.seed)
+        print(f"语料已就绪 ({time.perf_counter() - generate_start:.1f}s)", file=sys.stderr)
+
+        cells = []
+        for cell in build_cells(sizes, _split(args.formats), jobs_levels, _split(args.backends),
+                                template, max(1, args.repeat)):
+            documents = corpus[parse_size(cell['size'])]
+            result = measure_cell(cell, documents, pandoc_path)
+            entry = {'id': cell_id(cell), **{k: v for k, v in cell.items() if k != 'template'},
+                     'reference_doc': bool(cell['template']), **result}
+            cells.append(entry)
+            print(f"{entry['id']:<36} {entry['files_per_second']:8.2f} files/s "
+                  f"{entry['mb_per_second']:8.2f} MB/s  p95 {entry['latency_p95_ms']:9.1f} ms",
+                  file=sys.stderr)
+    finally:
+        if corpus_context is not None:
+            corpus_context.cleanup()
+
+    report = {
+        'version': RESULT_VERSION,
+        'seed': args.seed,
+        'shapes': shapes,
+        'pandoc_version': get_pandoc_version(pandoc_path),
+        'cpu_count': os.cpu_count(),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'cells': cells,
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != RESULT_VERSION:
+            print("基线结果的格式版本不同，未做比较", file=sys.stderr)
+        regressions = compare_with_baseline(report, baseline, args.threshold)
+        report['regressions'] = regressions
+        for regression in regressions:
+            print(f"✗ 性能回退 {regression['id']} {regression['metric']}: "
+                  f"{regression['baseline']} -> {regression['current']}", file=sys.stderr)
+        if regressions:
+            exit_code = 1
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
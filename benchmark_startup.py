@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+测量程序从启动到主窗口首次绘制的耗时
+使用 offscreen 平台在无界面环境中多次启动程序，通过 PANDOC_GUI_STARTUP_TRACE
+记录各启动阶段的时间戳，输出每个阶段耗时的中位数和 p95 (JSON)。
+
+用法:
+    python benchmark_startup.py --runs 20
+    python benchmark_startup.py --entry dist/Pandoc-GUI.exe --output startup.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 默认的入口文件
+DEFAULT_ENTRY = os.path.join(ROOT_DIR, 'src', 'main.py')
+
+# 默认的启动次数
+DEFAULT_RUNS = 10
+
+# 单次启动的最长等待时间 (秒)
+DEFAULT_TIMEOUT = 60.0
+
+# 启动阶段的顺序，与 src/main.py 和 app_minimal_fixed.py 中记录的阶段一致
+PHASES = [
+    'main_start',
+    'pyqt_imported',
+    'modules_imported',
+    'qapplication_created',
+    'expiry_checked',
+    'window_created',
+    'window_shown',
+    'expiry_check_started',
+    'first_paint',
+]
+
+
+def percentile(values, percent):
+    """计算百分位数 (最近秩法)
+
+    Args:
+        values: 数值列表
+        percent: 百分位 (0-100)
+
+    Returns:
+        float: 百分位数，列表为空时返回None
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values):
+    """汇总一组耗时 (毫秒)"""
+    return {
+        'median': round(statistics.median(values), 2),
+        'p95': round(percentile(values, 95), 2),
+        'min': round(min(values), 2),
+        'max': round(max(values), 2),
+        'runs': len(values),
+    }
+
+
+def build_command(entry):
+    """生成启动命令，.py 文件使用当前解释器运行，其他文件 (打包后的程序) 直接运行"""
+    if entry.endswith('.py'):
+        return [sys.executable, entry]
+    return [entry]
+
+
+def run_once(entry, timeout=DEFAULT_TIMEOUT, cache_dir=None):
+    """启动一次程序并读取各阶段的时间戳
+
+    Args:
+        entry: 入口文件或打包后的程序
+        timeout: 最长等待时间 (秒)
+        cache_dir: 应用缓存目录（可选），用于测量没有缓存时的冷启动
+
+    Returns:
+        dict: 阶段名到启动后经过时间 (毫秒) 的映射，另含进程退出前的总耗时 'exit'
+    """
+    fd, trace_path = tempfile.mkstemp(suffix='.jsonl', prefix='startup_trace_')
+    os.close(fd)
+
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    env['PANDOC_GUI_STARTUP_TRACE'] = trace_path
+    env['PANDOC_GUI_STARTUP_EXIT'] = '1'
+    if cache_dir:
+        env['PANDOC_GUI_CACHE_DIR'] = cache_dir
+
+    try:
+        start = time.time()
+        result = subprocess.run(
+            build_command(entry), env=env, cwd=os.path.dirname(os.path.abspath(entry)),
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout
+        )
+        exit_ms = (time.time() - start) * 1000
+
+        with open(trace_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    finally:
+        os.remove(trace_path)
+
+    timings = {}
+    for record in records:
+        for phase, timestamp in record['marks']:
+            # 打包后的程序可能有启动器进程，同名阶段只取最早的一次
+            timings.setdefault(phase, (timestamp - start) * 1000)
+
+    if 'first_paint' not in timings:
+        stderr = result.stderr.decode('utf-8', errors='replace').strip()
+        raise RuntimeError(f"程序没有完成首次绘制 (退出码 {result.returncode})\n{stderr}")
+
+    timings['exit'] = exit_ms
+    return timings
+
+
+def run_benchmark(entry, runs=DEFAULT_RUNS, timeout=DEFAULT_TIMEOUT, cold=False):
+    """多次启动程序并汇总各阶段耗时
+
+    Args:
+        entry: 入口文件或打包后的程序
+        runs: 启动次数
+        timeout: 单次启动的最长等待时间 (秒)
+        cold: 每次启动使用新的空缓存目录
+
+    Returns:
+        dict: 测量结果，phases 为各阶段距启动的耗时，intervals 为相邻阶段之间的耗时
+    """
+    samples = []
+    for _ in range(runs):
+        if cold:
+            with tempfile.TemporaryDirectory(prefix='pandoc_gui_cache_') as cache_dir:
+                samples.append(run_once(entry, timeout, cache_dir))
+        else:
+            samples.append(run_once(entry, timeout))
+
+    names = [name for name in PHASES if all(name in sample for sample in samples)]
+    extra = sorted({name for sample in samples for name in sample} - set(PHASES) - {'exit'})
+    names += [name for name in extra if all(name in sample for sample in samples)]
+    names.sort(key=lambda name: statistics.median(sample[name] for sample in samples))
+
+    phases = {name: summarize([sample[name] for sample in samples]) for name in names}
+    phases['exit'] = summarize([sample['exit'] for sample in samples])
+
+    intervals = {}
+    previous = 'launch'
+    for name in names:
+        values = [sample[name] - (sample[previous] if previous != 'launch' else 0.0)
+                  for sample in samples]
+        intervals[f'{previous}->{name}'] = summarize(values)
+        previous = name
+
+    return {
+        'entry': os.path.relpath(entry, ROOT_DIR) if entry.startswith(ROOT_DIR) else entry,
+        'runs': runs,
+        'cold': cold,
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'unit': 'ms',
+        'phases': phases,
+        'intervals': intervals,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='测量程序启动到主窗口首次绘制的耗时')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='启动次数')
+    parser.add_argument('--entry', default=DEFAULT_ENTRY, help='入口文件或打包后的程序')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='单次启动的最长等待时间 (秒)')
+    parser.add_argument('--cold', action='store_true', help='每次启动使用新的空缓存目录')
+    parser.add_argument('--output', help='结果写入的JSON文件，默认输出到标准输出')
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error('--runs 必须大于0')
+
+    try:
+        report = run_benchmark(os.path.abspath(args.entry), args.runs, args.timeout, args.cold)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        print(f"测量失败: {e}", file=sys.stderr)
+        return 1
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+测量参考文档模板生成各阶段的耗时
+对 TemplateManager 中的每个预设模板，分别测量排版配置对话框的应用模板与收集配置、
+python-docx 的 create_template_file 与 doc.save，以及直接改写XML的模板生成器，
+输出各阶段耗时的中位数 (JSON)。界面部分使用 offscreen 平台，不需要显示器。
+可选输出 cProfile 统计和 tracemalloc 峰值内存，并可与保存的基线比较。
+
+用法:
+    python benchmark_templates.py --runs 10
+    python benchmark_templates.py --profile templates.pstats --tracemalloc
+    python benchmark_templates.py --baseline templates_baseline.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import pstats
+import argparse
+import cProfile
+import statistics
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from core.config_manager import ConfigManager, TEMPLATE_MODES
+from core.template_manager import TemplateManager, PRESET_ALIASES, PRESET_SETTINGS
+import core.ooxml_template as ooxml_template
+
+
+# 默认的重复测量次数
+DEFAULT_RUNS = 5
+
+# 总耗时上升超过此比例时视为性能回退
+DEFAULT_THRESHOLD = 0.2
+
+# 测量结果格式版本，基线版本不同时不做比较
+RESULT_VERSION = 1
+
+# 作为比较基准的模板生成器
+BASELINE_ENGINE = 'python-docx'
+
+
+def _timed(phases, name, func, *args):
+    """执行函数并把耗时 (秒) 记入 phases"""
+    start = time.perf_counter()
+    result = func(*args)
+    phases[name] = time.perf_counter() - start
+    return result
+
+
+def run_python_docx(config, mode):
+    """使用python-docx逐项构建模板
+
+    Returns:
+        tuple: (各阶段耗时字典, 生成的字节数)
+    """
+    phases = {}
+    config_manager = ConfigManager()
+    config_manager.config = config
+    doc = _timed(phases, 'create_template_file', config_manager.create_template_file, mode)
+    buffer = io.BytesIO()
+    _timed(phases, 'doc_save', doc.save, buffer)
+    return phases, buffer.tell()
+
+
+def run_ooxml(config, mode):
+    """直接改写内置参考文档的XML部件生成模板
+
+    Returns:
+        tuple: (各阶段耗时字典, 生成的字节数)
+    """
+    phases = {}
+    engine = ooxml_template.get_template_engine()
+    data = _timed(phases, 'build', engine.build, config, mode == 'showcase')
+    return phases, len(data)
+
+
+# 参与比较的模板生成器，新的生成器在此注册即可与python-docx基准比较
+TEMPLATE_ENGINES = {
+    'python-docx': run_python_docx,
+    'ooxml': run_ooxml,
+}
+
+
+class DialogHarness:
+    """在 offscreen 平台上创建排版配置对话框，测量应用预设模板和收集配置的耗时"""
+
+    def __init__(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+
+        self.app = QApplication.instance() or QApplication([])
+        start = time.perf_counter()
+        from ui.format_config import FormatConfigDialog
+        self.import_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.dialog = FormatConfigDialog()
+        self.init_seconds = time.perf_counter() - start
+
+    def run(self, preset):
+        """应用预设模板并收集配置
+
+        Returns:
+            tuple: (各阶段耗时字典, 配置字典)
+        """
+        phases = {}
+        dialog = self.dialog
+        _timed(phases, 'apply_template', dialog.template_manager.apply_template, preset, dialog.widgets)
+        config = _timed(phases, 'collect_config', dialog.config_manager.collect_config, dialog.widgets)
+        return phases, config
+
+
+def _summarize(samples):
+    """汇总多次测量的各阶段耗时 (毫秒)"""
+    phases = {}
+    for name in samples[0]:
+        values = [sample[name] * 1000 for sample in samples]
+        phases[name] = {
+            'median': round(statistics.median(values), 3),
+            'min': round(min(values), 3),
+            'max': round(max(values), 3),
+        }
+    totals = [sum(sample.values()) * 1000 for sample in samples]
+    return phases, round(statistics.median(totals), 3)
+
+
+def measure_peak_memory(func, *args):
+    """使用tracemalloc测量函数执行期间的峰值内存 (KB)"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def run_benchmark(presets, engines, modes, runs=DEFAULT_RUNS, gui=True, trace_memory=False):
+    """测量各预设模板生成参考文档的耗时
+
+    Args:
+        presets: 预设模板名称列表
+        engines: 模板生成器名称列表，见 TEMPLATE_ENGINES
+        modes: 导出方式列表，见 TEMPLATE_MODES
+        runs: 每项的重复测量次数
+        gui: 是否测量排版配置对话框中应用模板和收集配置的耗时
+        trace_memory: 是否额外测量各生成器的峰值内存
+
+    Returns:
+        dict: 测量结果
+    """
+    report = {
+        'version': RESULT_VERSION,
+        'runs': runs,
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'unit': 'ms',
+    }
+
+    # 首次使用时解析内置参考文档的耗时单独记录
+    ooxml_template._default_engine = None
+    start = time.perf_counter()
+    ooxml_template.get_template_engine()
+    report['ooxml_engine_init_ms'] = round((time.perf_counter() - start) * 1000, 3)
+
+    harness = None
+    if gui:
+        harness = DialogHarness()
+        report['dialog_import_ms'] = round(harness.import_seconds * 1000, 3)
+        report['dialog_init_ms'] = round(harness.init_seconds * 1000, 3)
+
+    template_manager = TemplateManager()
+    results = []
+    for preset in presets:
+        config = template_manager.get_preset_config(preset)
+        if harness is not None:
+            samples = []
+            for _ in range(runs):
+                phases, config = harness.run(preset)
+                samples.append(phases)
+            phases, total = _summarize(samples)
+            results.append({'id': f'{preset}/dialog', 'preset': preset, 'engine': 'dialog',
+                            'mode': None, 'phases': phases, 'total_ms': total})
+
+        for engine_name in engines:
+            engine = TEMPLATE_ENGINES[engine_name]
+            for mode in modes:
+                # 预热一次，排除首次导入模块的耗时
+                _, size = engine(config, mode)
+                samples = [engine(config, mode)[0] for _ in range(runs)]
+                phases, total = _summarize(samples)
+                entry = {'id': f'{preset}/{engine_name}/{mode}', 'preset': preset,
+                         'engine': engine_name, 'mode': mode, 'phases': phases,
+                         'total_ms': total, 'bytes': size}
+                if trace_memory:
+                    entry['peak_memory_kb'] = measure_peak_memory(engine, config, mode)
+                results.append(entry)
+
+    # 各生成器相对python-docx的加速比
+    baseline_totals = {(r['preset'], r['mode']): r['total_ms']
+                       for r in results if r['engine'] == BASELINE_ENGINE}
+    for entry in results:
+        base = baseline_totals.get((entry['preset'], entry['mode']))
+        if base and entry['engine'] not in (BASELINE_ENGINE, 'dialog') and entry['total_ms'] > 0:
+            entry['speedup_vs_python_docx'] = round(base / entry['total_ms'], 2)
+
+    report['results'] = results
+    return report
+
+
+def compare_with_baseline(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """与基线比较，返回总耗时上升超过阈值的测量项"""
+    if baseline.get('version') != RESULT_VERSION:
+        return []
+    baseline_totals = {entry['id']: entry['total_ms'] for entry in baseline.get('results', [])}
+    regressions = []
+    for entry in report['results']:
+        old = baseline_totals.get(entry['id'])
+        if old is not None and entry['total_ms'] > old * (1 + threshold):
+            regressions.append({'id': entry['id'], 'baseline': old, 'current': entry['total_ms']})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='测量参考文档模板生成各阶段的耗时')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='每项的重复测量次数')
+    parser.add_argument('--presets', help='预设模板，逗号分隔，默认测量所有预设')
+    parser.add_argument('--engines', default=','.join(TEMPLATE_ENGINES), help='模板生成器')
+    parser.add_argument('--modes', default=','.join(TEMPLATE_MODES), help='导出方式')
+    parser.add_argument('--no-gui', action='store_true', help='不测量排版配置对话框')
+    parser.add_argument('--tracemalloc', action='store_true', help='测量各生成器的峰值内存')
+    parser.add_argument('--profile', help='把cProfile统计保存到此文件，并输出耗时最多的函数')
+    parser.add_argument('--profile-top', type=int, default=25, help='输出耗时最多的函数数量')
+    parser.add_argument('--output', help='结果写入的JSON文件，默认输出到标准输出')
+    parser.add_argument('--baseline', help='与之比较的基线结果文件')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='允许的耗时上升比例，默认 0.2')
+    args = parser.parse_args()
+
+    if args.presets:
+        presets = [PRESET_ALIASES.get(p.strip(), p.strip()) for p in args.presets.split(',')]
+    else:
+        presets = list(PRESET_SETTINGS)
+    engines = [e.strip() for e in args.engines.split(',') if e.strip()]
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    template_manager = TemplateManager()
+    unknown = ([p for p in presets if template_manager.get_preset_config(p) is None]
+               + [e for e in engines if e not in TEMPLATE_ENGINES]
+               + [m for m in modes if m not in TEMPLATE_MODES])
+    if unknown:
+        parser.error(f"未知的参数值: {', '.join(unknown)}")
+    if args.runs < 1:
+        parser.error('--runs 必须大于0')
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    report = run_benchmark(presets, engines, modes, args.runs, not args.no_gui, args.tracemalloc)
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        stats = pstats.Stats(args.profile, stream=sys.stderr)
+        stats.sort_stats('cumulative').print_stats(args.profile_top)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != RESULT_VERSION:
+            print("基线结果的格式版本不同，未做比较", file=sys.stderr)
+        regressions = compare_with_baseline(report, baseline, args.threshold)
+        report['regressions'] = regressions
+        for regression in regressions:
+            print(f"✗ 性能回退 {regression['id']}: "
+                  f"{regression['baseline']} ms -> {regression['current']} ms", file=sys.stderr)
+        if regressions:
+            exit_code = 1
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+测试共用的fixture
+"""
+
+import os
+import sys
+import stat
+import itertools
+
+import pytest
+
+
+@pytest.fixture
+def fake_pandoc(tmp_path, monkeypatch):
+    """安装模拟的pandoc脚本
+
+    返回函数 install(script, directory=None)：把脚本写入目录中名为 pandoc 的可执行文件，
+    返回 (目录, pandoc路径)。未指定目录时每次使用 tmp_path 下新的目录，指定已有目录时
+    替换其中的pandoc。缓存目录同时指向 tmp_path，测试之间不共享缓存。
+    模拟的pandoc依靠shebang运行，Windows上跳过这些测试。
+    """
+    if os.name == 'nt':
+        pytest.skip('模拟的pandoc脚本依赖shebang，Windows上无法直接运行')
+    monkeypatch.setenv('PANDOC_GUI_CACHE_DIR', str(tmp_path / 'cache'))
+    counter = itertools.count()
+
+    def install(script, directory=None):
+        if directory is None:
+            directory = str(tmp_path / f'workspace{next(counter)}')
+            os.makedirs(directory)
+        pandoc = os.path.join(directory, 'pandoc')
+        with open(pandoc, 'w', encoding='utf-8') as f:
+            f.write(f'#!{sys.executable}\n' + script)
+        os.chmod(pandoc, os.stat(pandoc).st_mode | stat.S_IEXEC)
+        return directory, pandoc
+
+    return install
@@ -0,0 +1,13 @@
+"""
+命令行入口，支持以 `python -m src` 方式运行
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+
+sys.exit(main())
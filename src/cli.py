@@ -0,0 +1,397 @@
+"""
+Pandoc GUI 命令行入口
+无需图形界面即可批量转换文档、生成参考文档模板，适用于CI和定时任务。
+不创建QApplication，也不执行联网的过期检查。
+
+用法示例：
+    python -m src convert docs/ -t docx -j 4 --preset academic
+    python -m src template --preset report -o report.docx
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import threading
+
+# 添加当前目录到路径，以便导入模块
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.pandoc_converter import PandocConverter, DEFAULT_MAX_WORKERS
+from core.conversion_cache import ConversionCache
+from core.conversion_metrics import JsonlMetricsSink, PrometheusTextfileSink
+from core.pandoc_log import WarningSummary
+from core.config_manager import ConfigManager, TEMPLATE_MODES, TEMPLATE_MODE_STYLES
+from core.template_manager import (
+    TemplateManager, PRESET_ALIASES, PRESET_SETTINGS, get_default_config
+)
+from core.reference_doc_cache import CONFIG_HASH_PREFIX
+from core.capabilities import get_output_extension
+from core.rts_profiles import RTS_PROFILES
+from utils.file_utils import (
+    discover_input_files, find_output_conflicts, generate_output_path,
+    get_file_name_without_extension, path_key, OUTPUT_SUFFIX
+)
+
+# 退出码
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+def find_pandoc(pandoc_path=None):
+    """查找pandoc可执行文件
+
+    依次使用命令行参数、PANDOC_PATH 环境变量、项目自带的pandoc和系统PATH中的pandoc。
+
+    Args:
+        pandoc_path: 命令行指定的路径（可选）
+
+    Returns:
+        str: pandoc路径，找不到时返回None
+    """
+    if pandoc_path:
+        return pandoc_path
+    if os.environ.get('PANDOC_PATH'):
+        return os.environ['PANDOC_PATH']
+
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    bundled = os.path.join(root_dir, 'pandoc', 'pandoc.exe' if os.name == 'nt' else 'pandoc')
+    if os.path.exists(bundled):
+        return bundled
+    return shutil.which('pandoc')
+
+
+def _merge_config(base, overrides):
+    """把部分配置合并到完整配置上，返回合并后的base"""
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge_config(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def load_layout_config(preset=None, config_file=None):
+    """根据预设模板名称或JSON配置文件获取排版配置
+
+    JSON配置的结构与排版配置对话框收集的配置相同，可以只包含需要修改的项，
+    其余项使用默认值。
+
+    Args:
+        preset: 预设模板名称（可选）
+        config_file: JSON配置文件路径（可选），优先于预设模板
+
+    Returns:
+        dict: 排版配置字典
+
+    Raises:
+        ValueError: 预设模板不存在或配置文件格式错误
+    """
+    if config_file:
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                overrides = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"无法读取配置文件 {config_file}：{e}") from e
+        if not isinstance(overrides, dict):
+            raise ValueError(f"配置文件 {config_file} 的内容必须是JSON对象")
+        return _merge_config(get_default_config(), overrides)
+
+    config = TemplateManager().get_preset_config(preset or 'default')
+    if config is None:
+        raise ValueError(f"预设模板不存在：{preset}")
+    return config
+
+
+def prepare_reference_doc(config, mode=TEMPLATE_MODE_STYLES):
+    """生成参考文档并放入缓存
+
+    Returns:
+        str: 可作为 template_file 传给转换器的配置哈希
+    """
+    config_manager = ConfigManager()
+    config_manager.config = config
+    config_manager.get_template_bytes(mode=mode)
+    return CONFIG_HASH_PREFIX + config_manager.get_config_hash(mode)
+
+
+def collect_jobs(inputs, output_format, output_dir=None, template_file=None):
+    """根据输入路径生成转换任务
+
+    目录会被递归遍历。指定输出目录时保持输入目录的相对结构，
+    否则输出文件与输入文件放在同一目录，文件名加 _converted 后缀。
+    遍历目录时跳过之前转换生成的输出：带 _converted 后缀的文件、输出目录中的文件，
+    以及本批次中其他文件的输出文件。
+
+    Args:
+        inputs: 输入文件或目录路径列表
+        output_format: pandoc输出格式
+        output_dir: 输出目录（可选）
+        template_file: 模板文件路径或配置哈希（可选）
+
+    Returns:
+        list: 传给 convert_many 的任务字典列表
+
+    Raises:
+        ValueError: 多个输入文件对应同一个输出文件（如 a.md 和 a.rst），
+                    或输出文件会覆盖某个输入文件
+    """
+    extension = get_output_extension(output_format)
+    jobs = []
+    seen = set()
+    discovered = set()
+
+    output_root = os.path.join(path_key(output_dir), '') if output_dir else None
+
+    for path in inputs:
+        is_dir = os.path.isdir(path)
+        root = path if is_dir else os.path.dirname(path)
+        # 输出目录是遍历目录的子目录时，其中的文件是之前转换生成的输出
+        skip_root = None
+        if is_dir and output_root:
+            root_dir = os.path.join(path_key(path), '')
+            if output_root != root_dir and output_root.startswith(root_dir):
+                skip_root = output_root
+        for input_file in discover_input_files([path]):
+            input_file = os.path.abspath(input_file)
+            if input_file in seen:
+                continue
+            if is_dir:
+                if skip_root and path_key(input_file).startswith(skip_root):
+                    continue
+                discovered.add(input_file)
+            seen.add(input_file)
+
+            if output_dir:
+                relative_dir = os.path.relpath(os.path.dirname(input_file), os.path.abspath(root))
+                name = get_file_name_without_extension(input_file)
+                output_file = os.path.normpath(
+                    os.path.join(output_dir, relative_dir, f"{name}.{extension}")
+                )
+            else:
+                output_file = generate_output_path(input_file, extension, OUTPUT_SUFFIX)
+
+            jobs.append({
+                'input_file': input_file,
+                'output_file': output_file,
+                'template_file': template_file,
+                'output_format': output_format,
+            })
+
+    # 遍历目录找到的文件是本批次其他文件的输出时，是之前转换生成的，跳过
+    output_keys = {path_key(job['output_file']) for job in jobs}
+    jobs = [job for job in jobs
+            if job['input_file'] not in discovered or path_key(job['input_file']) not in output_keys]
+
+    conflicts = find_output_conflicts([(job['input_file'], job['output_file']) for job in jobs])
+    if conflicts:
+        raise ValueError("以下输入文件的输出路径冲突，请分别转换或指定不同的输出目录：\n  "
+                         + "\n  ".join(f"{path}：{reason}" for path, reason in conflicts.items()))
+    return jobs
+
+
+def run_convert(args):
+    """执行 convert 子命令"""
+    pandoc_path = find_pandoc(args.pandoc)
+    if not pandoc_path:
+        print("找不到pandoc，请通过 --pandoc 或 PANDOC_PATH 环境变量指定", file=sys.stderr)
+        return EXIT_USAGE
+
+    template_file = args.template
+    if args.preset or args.config:
+        try:
+            config = load_layout_config(args.preset, args.config)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            return EXIT_USAGE
+        template_start = time.perf_counter()
+        template_file = prepare_reference_doc(config)
+        if not args.quiet and not args.json:
+            print(f"参考文档已就绪 ({time.perf_counter() - template_start:.3f}s)")
+
+    try:
+        jobs = collect_jobs(args.inputs, args.to, args.output_dir, template_file)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+    if not jobs:
+        print("没有找到可转换的文件", file=sys.stderr)
+        return EXIT_USAGE
+
+    for job in jobs:
+        os.makedirs(os.path.dirname(job['output_file']) or '.', exist_ok=True)
+
+    metrics = []
+    if args.metrics_jsonl:
+        metrics.append(JsonlMetricsSink(args.metrics_jsonl))
+    if args.metrics_prom:
+        metrics.append(PrometheusTextfileSink(args.metrics_prom))
+
+    converter = PandocConverter(
+        pandoc_path,
+        cache=None if args.no_cache else ConversionCache(),
+        backend=args.backend,
+        profile=args.profile,
+        metrics=metrics
+    )
+
+    max_workers = max(1, args.jobs)
+    cancel_event = threading.Event()
+    start_times = {}
+    results = []
+    warning_summary = WarningSummary()
+
+    def on_start(job):
+        start_times[job['input_file']] = time.perf_counter()
+
+    batch_start = time.perf_counter()
+    try:
+        for job, success, message in converter.convert_many(
+            jobs, max_workers, cancel_event=cancel_event, on_start=on_start,
+            warning_summary=warning_summary
+        ):
+            duration = time.perf_counter() - start_times.get(job['input_file'], batch_start)
+            results.append({
+                'input': job['input_file'],
+                'output': job['output_file'],
+                'success': success,
+                'seconds': round(duration, 4),
+                'message': message,
+            })
+            if not args.quiet and not args.json:
+                mark = '✓' if success else '✗'
+                print(f"{mark} {job['input_file']} -> {job['output_file']} ({duration:.3f}s)")
+                if not success:
+                    print(f"  {message}")
+    except KeyboardInterrupt:
+        cancel_event.set()
+        print("已取消", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    finally:
+        converter.close()
+
+    total = time.perf_counter() - batch_start
+    succeeded = sum(1 for result in results if result['success'])
+    failed = len(results) - succeeded
+    durations = sorted(result['seconds'] for result in results)
+
+    if args.json:
+        summary = {
+            'files': len(results),
+            'succeeded': succeeded,
+            'failed': failed,
+            'jobs': max_workers,
+            'total_seconds': round(total, 4),
+            'files_per_second': round(len(results) / total, 2) if total > 0 else None,
+            'warnings': warning_summary.to_list(),
+            'results': results,
+        }
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        median = durations[len(durations) // 2] if durations else 0
+        slowest = durations[-1] if durations else 0
+        rate = len(results) / total if total > 0 else 0
+        print(
+            f"共 {len(results)} 个文件：成功 {succeeded}，失败 {failed}，"
+            f"并发 {max_workers}，总用时 {total:.3f}s，"
+            f"单个文件中位数 {median:.3f}s，最慢 {slowest:.3f}s，{rate:.1f} 个/秒"
+        )
+        warnings_text = warning_summary.format()
+        if warnings_text:
+            print(warnings_text)
+
+    return EXIT_OK if failed == 0 else EXIT_FAILED
+
+
+def run_template(args):
+    """执行 template 子命令"""
+    try:
+        config = load_layout_config(args.preset, args.config)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+
+    config_manager = ConfigManager()
+    config_manager.config = config
+
+    start = time.perf_counter()
+    data = config_manager.get_template_bytes(mode=args.mode)
+    elapsed = time.perf_counter() - start
+
+    try:
+        with open(args.output, 'wb') as f:
+            f.write(data)
+    except OSError as e:
+        print(f"模板导出失败：{e}", file=sys.stderr)
+        return EXIT_FAILED
+
+    if not args.quiet:
+        print(f"模板已导出：{args.output} ({len(data)} 字节，{elapsed:.3f}s)")
+    return EXIT_OK
+
+
+def build_parser():
+    """创建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Pandoc GUI 命令行工具：批量转换文档、生成参考文档模板'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    preset_names = list(PRESET_ALIASES) + list(PRESET_SETTINGS)
+
+    convert_parser = subparsers.add_parser('convert', help='转换文件或目录')
+    convert_parser.add_argument('inputs', nargs='+', help='输入文件或目录，目录会被递归遍历')
+    convert_parser.add_argument('-t', '--to', default='docx', help='输出格式，默认为docx')
+    convert_parser.add_argument('-o', '--output-dir', help='输出目录，默认与输入文件相同')
+    convert_parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_MAX_WORKERS,
+                                help=f'并发转换数，默认为CPU核心数 ({DEFAULT_MAX_WORKERS})')
+    template_group = convert_parser.add_mutually_exclusive_group()
+    template_group.add_argument('--template', help='参考文档路径')
+    template_group.add_argument('--preset', choices=preset_names, help='使用预设模板生成参考文档')
+    template_group.add_argument('--config', help='使用JSON排版配置生成参考文档')
+    convert_parser.add_argument('--profile', choices=list(RTS_PROFILES), help='pandoc性能配置')
+    convert_parser.add_argument('--backend', choices=['subprocess', 'server'], default='subprocess',
+                                help='转换后端，默认为每个文件启动一个pandoc进程')
+    convert_parser.add_argument('--no-cache', action='store_true', help='不使用转换缓存')
+    convert_parser.add_argument('--pandoc', help='pandoc可执行文件路径')
+    convert_parser.add_argument('--json', action='store_true', help='以JSON格式输出结果和用时')
+    convert_parser.add_argument('--metrics-jsonl', metavar='PATH',
+                                help='把每个文件的耗时、CPU时间、峰值内存等指标追加写入JSONL文件')
+    convert_parser.add_argument('--metrics-prom', metavar='PATH',
+                                help='把汇总的转换指标写入Prometheus textfile')
+    convert_parser.add_argument('-q', '--quiet', action='store_true', help='只输出汇总信息')
+    convert_parser.set_defaults(func=run_convert)
+
+    template_parser = subparsers.add_parser('template', help='生成参考文档模板')
+    source_group = template_parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--preset', choices=preset_names, help='预设模板名称')
+    source_group.add_argument('--config', help='JSON排版配置文件')
+    template_parser.add_argument('-o', '--output', required=True, help='输出的docx文件路径')
+    template_parser.add_argument('--mode', choices=list(TEMPLATE_MODES), default=TEMPLATE_MODE_STYLES,
+                                 help='导出内容，styles 只包含样式，showcase 包含示例内容')
+    template_parser.add_argument('-q', '--quiet', action='store_true', help='不输出提示信息')
+    template_parser.set_defaults(func=run_template)
+
+    return parser
+
+
+def main(argv=None):
+    """命令行主函数
+
+    Args:
+        argv: 命令行参数列表（可选），默认使用 sys.argv
+
+    Returns:
+        int: 退出码
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+应用数据目录模块
+统一管理缓存等持久化数据的存放位置
+"""
+
+import os
+
+
+# 应用目录名称
+APP_DIR_NAME = 'Pandoc-GUI'
+
+
+def get_cache_dir(*parts):
+    """获取应用缓存目录，不存在时自动创建
+
+    可通过环境变量 PANDOC_GUI_CACHE_DIR 指定缓存根目录。
+
+    Args:
+        *parts: 缓存根目录下的子目录名称
+
+    Returns:
+        str: 缓存目录路径
+    """
+    base_dir = os.environ.get('PANDOC_GUI_CACHE_DIR')
+    if not base_dir:
+        if os.name == 'nt':
+            root = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+            base_dir = os.path.join(root, APP_DIR_NAME, 'cache')
+        else:
+            root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            base_dir = os.path.join(root, APP_DIR_NAME.lower())
+
+    cache_dir = os.path.join(base_dir, *parts)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
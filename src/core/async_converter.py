@@ -0,0 +1,271 @@
+"""
+异步Pandoc转换器模块
+基于asyncio子进程的转换功能，支持超时、取消和并发限制
+"""
+
+import os
+import time
+import signal
+import asyncio
+
+from core.pandoc_converter import PandocConverter, DEFAULT_MAX_WORKERS, format_failure_message
+from core.pandoc_log import StderrCapture, MAX_LINE_CHARS
+
+
+class AsyncPandocConverter:
+    """异步Pandoc转换器
+
+    与 PandocConverter.convert_file 使用相同的命令构建和缓存逻辑，
+    但转换在asyncio子进程中执行，不需要为每个转换占用一个线程。
+    """
+
+    def __init__(self, pandoc_path=None, cache=None, max_concurrency=None, timeout=None,
+                 profile=None, memory_limit=None, metrics=None):
+        """
+        Args:
+            pandoc_path: Pandoc可执行文件路径
+            cache: 转换缓存（可选）
+            max_concurrency: 同时运行的pandoc子进程上限，默认为CPU核心数
+            timeout: 默认的单个任务超时时间 (秒)，为None时不限制
+            profile: 默认的性能配置名称（可选）
+            memory_limit: pandoc最大堆内存（可选）
+            metrics: 转换指标的记录器或记录器列表（可选），与 PandocConverter 相同
+        """
+        self.converter = PandocConverter(
+            pandoc_path, cache=cache, profile=profile, memory_limit=memory_limit, metrics=metrics
+        )
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency or DEFAULT_MAX_WORKERS)
+        # 信号量在使用它的事件循环中创建，同一个转换器可以先后在多个事件循环中使用
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    @property
+    def pandoc_path(self):
+        return self.converter.pandoc_path
+
+    def _get_semaphore(self):
+        """获取当前事件循环中限制并发子进程数的信号量"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def convert_file(self, input_file, output_file, template_file=None,
+                           input_format=None, extra_args=None, timeout=None, profile=None,
+                           output_format=None):
+        """
+        转换文件格式
+
+        任务被取消时会终止对应的pandoc子进程，并继续抛出 CancelledError。
+
+        Args:
+            input_file: 输入文件路径
+            output_file: 输出文件路径
+            template_file: 模板文件路径（可选）
+            input_format: 输入格式（可选）
+            extra_args: 附加的pandoc命令行参数（可选）
+            timeout: 本任务的超时时间 (秒)，默认使用构造时指定的超时时间
+            profile: 性能配置名称（可选）
+            output_format: 输出格式（可选）
+
+        Returns:
+            ConversionResult: 可以按 (success, message) 解包，另带耗时、退出码、
+                              输入输出大小和警告等指标；asyncio子进程无法取得CPU时间和峰值内存
+        """
+        start = time.perf_counter()
+        success, message, metrics = await self._convert_file(
+            input_file, output_file, template_file, input_format, extra_args, timeout, profile,
+            output_format
+        )
+        # 读取文件大小和写入指标记录可能阻塞，放到线程中执行
+        return await asyncio.to_thread(
+            self.converter.record_result, success, message, start, input_file, output_file,
+            output_format, **metrics
+        )
+
+    async def _convert_file(self, input_file, output_file, template_file, input_format,
+                            extra_args, timeout, profile, output_format):
+        """
+        执行转换
+
+        Returns:
+            tuple: (success, message, metrics)，metrics 为传给 ConversionResult 的指标字典
+        """
+        converter = self.converter
+        error, cmd, reference_doc = converter.build_command(
+            input_file, output_file, template_file, input_format, extra_args, profile,
+            output_format
+        )
+        if error:
+            return False, error, {}
+
+        timeout = self.timeout if timeout is None else timeout
+
+        # 计算缓存键需要读取整个输入文件，放到线程中执行以免阻塞事件循环
+        cache_key = None
+        if converter.cache is not None:
+            cache_key = await asyncio.to_thread(
+                converter.get_cache_key, cmd, input_file, output_file, reference_doc
+            )
+            if cache_key and await asyncio.to_thread(converter.cache.fetch, cache_key, output_file):
+                return True, f"转换成功（缓存）：{os.path.basename(output_file)}", {'backend': 'cache'}
+
+        if cache_key:
+            cmd = converter.with_resource_log(cmd)
+
+        async with self._get_semaphore():
+            # 在POSIX上使用独立的进程组，终止时可以连同pdf引擎等子进程一起结束
+            spawn_time = time.perf_counter()
+            spawn = asyncio.ensure_future(asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=(os.name == 'posix')
+            ))
+            try:
+                process = await asyncio.shield(spawn)
+            except asyncio.CancelledError:
+                # 取消时子进程可能正在启动，等待启动完成后将其终止
+                try:
+                    await self._wait_uninterrupted(spawn)
+                finally:
+                    if not spawn.cancelled() and spawn.exception() is None:
+                        await self._kill(spawn.result())
+                raise
+            except OSError as e:
+                return False, f"发生错误：\n{str(e)}", {'backend': 'subprocess'}
+
+            capture = StderrCapture(keep_info=not cache_key or '--verbose' in (extra_args or []))
+            try:
+                await asyncio.wait_for(self._drain(process, capture), timeout)
+            except asyncio.TimeoutError:
+                await self._kill(process)
+                return False, f"转换超时：超过 {timeout} 秒未完成", {
+                    'backend': 'subprocess', 'wall_time': time.perf_counter() - spawn_time,
+                    'warnings': capture.warnings,
+                }
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+
+        metrics = {
+            'backend': 'subprocess', 'returncode': process.returncode,
+            'wall_time': time.perf_counter() - spawn_time, 'warnings': capture.warnings,
+        }
+        if process.returncode != 0:
+            return False, format_failure_message(process.returncode, capture.format_message()), metrics
+
+        if cache_key and not converter.embeds_local_files(capture):
+            await asyncio.to_thread(converter.cache.store, cache_key, output_file)
+
+        return True, f"转换成功：{os.path.basename(output_file)}", metrics
+
+    async def _drain(self, process, capture):
+        """逐行解析pandoc标准错误输出并等待进程退出"""
+        while True:
+            try:
+                line = await process.stderr.readline()
+            except ValueError:
+                # 单行超过读取缓冲区上限，已被丢弃
+                continue
+            if not line:
+                break
+            capture.feed(line[:MAX_LINE_CHARS * 4].decode('utf-8', errors='replace'))
+        await process.wait()
+
+    async def _kill(self, process):
+        """终止pandoc子进程并等待其退出"""
+        if process.returncode is None:
+            try:
+                if os.name == 'posix':
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass
+        # 等待退出时推迟取消，避免留下僵尸进程；关闭事件循环时等待进程退出的任务
+        # 本身也可能被取消，此时重新等待
+        cancelled = False
+        while process.returncode is None:
+            try:
+                await self._wait_uninterrupted(asyncio.ensure_future(process.wait()))
+            except asyncio.CancelledError:
+                cancelled = True
+        if cancelled:
+            raise asyncio.CancelledError()
+
+    @staticmethod
+    async def _wait_uninterrupted(future):
+        """等待future完成，期间收到的取消请求（可能不止一次）推迟到完成后再抛出"""
+        cancelled = False
+        while not future.done():
+            try:
+                await asyncio.wait([future])
+            except asyncio.CancelledError:
+                cancelled = True
+        if cancelled:
+            raise asyncio.CancelledError()
+
+    async def convert_many(self, jobs, timeout=None, profile=None):
+        """
+        并发批量转换文件
+
+        由 max_concurrency 个工作协程依次从jobs中取出任务，只在有空闲的工作协程时
+        才取下一个任务，不会为所有任务一次性创建协程；调用方处理结果较慢时，
+        工作协程在结果队列写满后等待。单个任务失败或超时不会中断整个批次。
+        提前停止迭代时，未完成的任务会被取消并终止其子进程。
+
+        Args:
+            jobs: 可迭代的转换任务，格式与 PandocConverter.convert_many 相同
+            timeout: 单个任务的超时时间 (秒)
+            profile: 性能配置名称（可选），应用于未单独指定配置的任务
+
+        Yields:
+            tuple: (job, success, message)，按完成顺序产出
+        """
+        async def run(job):
+            try:
+                if isinstance(job, dict):
+                    kwargs = dict(job)
+                    kwargs.setdefault('timeout', timeout)
+                    kwargs.setdefault('profile', profile)
+                    result = await self.convert_file(**kwargs)
+                else:
+                    result = await self.convert_file(*job, timeout=timeout, profile=profile)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                result = False, f"发生错误：\n{str(e)}"
+            return (job,) + tuple(result)
+
+        job_iter = iter(jobs)
+        results = asyncio.Queue(maxsize=self.max_concurrency)
+
+        async def worker():
+            error = None
+            try:
+                for job in job_iter:
+                    await results.put(await run(job))
+            except Exception as e:
+                # 读取任务时出错，如jobs生成器抛出异常
+                error = e
+            # 工作协程结束的标记，出错时为异常对象
+            await results.put(error)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.max_concurrency)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                result = await results.get()
+                if isinstance(result, Exception):
+                    raise result
+                if result is None:
+                    remaining -= 1
+                else:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,256 @@
+"""
+Pandoc能力探测模块
+查询pandoc实际支持的读写格式和扩展，并按可执行文件缓存到磁盘，
+之后启动时无需再次调用pandoc
+"""
+
+import os
+import json
+import hashlib
+import threading
+import subprocess
+
+from core.app_dirs import get_cache_dir
+
+
+# 常用输出格式，探测结果中存在时排在列表前面；也是尚未探测时使用的默认列表
+COMMON_OUTPUT_FORMATS = [
+    'markdown', 'docx', 'pdf', 'html', 'epub', 'odt',
+    'plain', 'rst', 'json', 'latex', 'jats', 'pptx'
+]
+
+# pandoc --list-output-formats 不列出pdf：pdf通过这些格式的写出器加pdf引擎生成，
+# 支持其中任意一种时在输出格式列表中保留pdf
+PDF_ROUTE_FORMATS = {'latex', 'beamer', 'context', 'html', 'html5', 'ms', 'typst'}
+
+# 尚未探测时使用的默认输入格式列表
+COMMON_INPUT_FORMATS = [
+    'markdown', 'docx', 'html', 'epub', 'odt', 'rst', 'json', 'latex', 'jats'
+]
+
+# 输出格式到文件扩展名的映射，未列出的格式直接使用格式名作为扩展名
+OUTPUT_EXTENSIONS = {
+    'markdown': 'md', 'markdown_strict': 'md', 'markdown_phpextra': 'md',
+    'markdown_mmd': 'md', 'markdown_github': 'md', 'gfm': 'md',
+    'commonmark': 'md', 'commonmark_x': 'md', 'markua': 'md',
+    'plain': 'txt', 'ansi': 'txt',
+    'latex': 'tex', 'beamer': 'tex', 'context': 'tex',
+    'html4': 'html', 'html5': 'html', 'revealjs': 'html', 'slidy': 'html',
+    's5': 'html', 'slideous': 'html', 'dzslides': 'html', 'chunkedhtml': 'zip',
+    'epub2': 'epub', 'epub3': 'epub',
+    'jats': 'xml', 'jats_archiving': 'xml', 'jats_articleauthoring': 'xml',
+    'jats_publishing': 'xml', 'docbook': 'xml', 'docbook4': 'xml',
+    'docbook5': 'xml', 'tei': 'xml', 'opendocument': 'xml',
+    'asciidoc': 'adoc', 'asciidoc_legacy': 'adoc', 'asciidoctor': 'adoc',
+    'mediawiki': 'wiki', 'dokuwiki': 'wiki', 'zimwiki': 'wiki', 'xwiki': 'wiki',
+    'typst': 'typ', 'texinfo': 'texi', 'native': 'hs', 'man': '1',
+    'csljson': 'json', 'bibtex': 'bib', 'biblatex': 'bib', 'haddock': 'txt',
+    'jira': 'txt', 'vimdoc': 'txt',
+}
+
+# 缓存格式版本，修改缓存内容结构时需要递增
+CACHE_VERSION = 1
+
+# 内存中的能力注册表，键为 (路径, 大小, 修改时间)
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get_output_extension(output_format):
+    """获取输出格式对应的文件扩展名
+
+    Args:
+        output_format: pandoc输出格式名称
+
+    Returns:
+        str: 不带点号的扩展名
+    """
+    return OUTPUT_EXTENSIONS.get(output_format, output_format)
+
+
+def _get_signature(pandoc_path):
+    """获取pandoc可执行文件的标识 (路径, 大小, 修改时间)，文件不存在时返回None"""
+    try:
+        stat = os.stat(pandoc_path)
+    except (OSError, TypeError):
+        return None
+    return (os.path.abspath(pandoc_path), stat.st_size, stat.st_mtime_ns)
+
+
+def _get_cache_file(signature):
+    """获取能力缓存文件路径"""
+    name = hashlib.sha1(signature[0].encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir('capabilities'), f'{name}.json')
+
+
+def _run_lines(pandoc_path, *args):
+    """运行pandoc并按行返回标准输出"""
+    result = subprocess.run(
+        [pandoc_path] + list(args), capture_output=True, text=True, check=True
+    )
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def probe_capabilities(pandoc_path):
+    """调用pandoc探测其能力
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        dict: 包含 version、input_formats、output_formats 和 extensions 的字典
+
+    Raises:
+        OSError, subprocess.CalledProcessError: pandoc无法运行
+    """
+    version_lines = _run_lines(pandoc_path, '--version')
+
+    extensions = {}
+    for line in _run_lines(pandoc_path, '--list-extensions'):
+        # 每行形如 "+smart" 或 "-east_asian_line_breaks"，表示markdown下的默认开关
+        if line[0] in '+-':
+            extensions[line[1:]] = line[0] == '+'
+
+    return {
+        'version': version_lines[0] if version_lines else '',
+        'input_formats': _run_lines(pandoc_path, '--list-input-formats'),
+        'output_formats': _run_lines(pandoc_path, '--list-output-formats'),
+        'extensions': extensions,
+    }
+
+
+def load_capabilities(pandoc_path):
+    """从内存或磁盘缓存读取pandoc能力，不会调用pandoc
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        dict: 能力信息，尚未探测或缓存已失效时返回None
+    """
+    signature = _get_signature(pandoc_path)
+    if signature is None:
+        return None
+
+    with _registry_lock:
+        if signature in _registry:
+            return _registry[signature]
+
+    try:
+        with open(_get_cache_file(signature), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # pandoc被替换或升级后，大小和修改时间会变化，缓存随之失效
+    if data.get('cache_version') != CACHE_VERSION or tuple(data.get('signature', ())) != signature:
+        return None
+
+    capabilities = data.get('capabilities')
+    with _registry_lock:
+        _registry[signature] = capabilities
+    return capabilities
+
+
+def get_capabilities(pandoc_path):
+    """获取pandoc能力，缓存不存在时探测并写入磁盘缓存
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        dict: 能力信息，pandoc无法运行时返回None
+    """
+    capabilities = load_capabilities(pandoc_path)
+    if capabilities is not None:
+        return capabilities
+
+    signature = _get_signature(pandoc_path)
+    if signature is None:
+        return None
+
+    try:
+        capabilities = probe_capabilities(pandoc_path)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    with _registry_lock:
+        _registry[signature] = capabilities
+
+    # 先写入临时文件再替换，避免多个进程同时写入时产生损坏的缓存
+    cache_file = _get_cache_file(signature)
+    temp_file = f'{cache_file}.{os.getpid()}.tmp'
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'cache_version': CACHE_VERSION,
+                'signature': list(signature),
+                'capabilities': capabilities
+            }, f, ensure_ascii=False)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+    return capabilities
+
+
+def probe_in_background(pandoc_path, callback=None):
+    """在后台线程中获取pandoc能力
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+        callback: 完成后调用的函数（可选），参数为能力信息或None，在后台线程中调用
+
+    Returns:
+        threading.Thread: 已启动的后台线程
+    """
+    def run():
+        capabilities = get_capabilities(pandoc_path)
+        if callback is not None:
+            callback(capabilities)
+
+    thread = threading.Thread(target=run, name='pandoc-capability-probe', daemon=True)
+    thread.start()
+    return thread
+
+
+def _order_formats(available, common):
+    """常用格式排在前面，其余格式按字母顺序排列"""
+    available = set(available)
+    ordered = [fmt for fmt in common if fmt in available]
+    ordered.extend(sorted(available.difference(ordered)))
+    return ordered
+
+
+def get_output_formats(pandoc_path):
+    """获取pandoc支持的输出格式，不会调用pandoc
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        list: 输出格式列表，尚未探测时返回常用格式列表；
+              支持latex、html等可以生成pdf的格式时包含pdf
+    """
+    capabilities = load_capabilities(pandoc_path)
+    if not capabilities:
+        return list(COMMON_OUTPUT_FORMATS)
+    available = set(capabilities['output_formats'])
+    if PDF_ROUTE_FORMATS.intersection(available):
+        available.add('pdf')
+    return _order_formats(available, COMMON_OUTPUT_FORMATS)
+
+
+def get_input_formats(pandoc_path):
+    """获取pandoc支持的输入格式，不会调用pandoc
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        list: 输入格式列表，尚未探测时返回常用格式列表
+    """
+    capabilities = load_capabilities(pandoc_path)
+    if not capabilities:
+        return list(COMMON_INPUT_FORMATS)
+    return _order_formats(capabilities['input_formats'], COMMON_INPUT_FORMATS)
@@ -3,12 +3,20 @@
 处理配置的加载、保存和应用
 """
 
-from PyQt5.QtGui import QFont, QColor
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn
+import io
+
+from core.reference_doc_cache import config_hash, get_reference_doc_cache
+
+
+# 模板导出方式：仅样式时正文为空，适合作为pandoc的 --reference-doc；
+# 完整示例会写入展示所有样式的预置内容，便于在Word中查看效果
+TEMPLATE_MODE_STYLES = 'styles'
+TEMPLATE_MODE_SHOWCASE = 'showcase'
+
+TEMPLATE_MODES = {
+    TEMPLATE_MODE_STYLES: '仅样式（用作参考文档）',
+    TEMPLATE_MODE_SHOWCASE: '完整示例文档',
+}
 
 
 class ConfigManager:
@@ -75,8 +83,20 @@ class ConfigManager:
         if 'page_settings' in config:
             widgets['page'].load_config(config['page_settings'])
     
-    def create_template_file(self):
-        """根据当前配置创建模板文件"""
+    def create_template_file(self, mode=TEMPLATE_MODE_SHOWCASE):
+        """根据当前配置创建模板文件
+        
+        使用python-docx逐项构建文档，速度较慢，导出模板时优先使用 get_template_bytes。
+        
+        Args:
+            mode: 导出方式，TEMPLATE_MODE_STYLES 只包含样式和页面设置，
+                  TEMPLATE_MODE_SHOWCASE 额外写入预置内容
+            
+        Returns:
+            docx.Document: 模板文档
+        """
+        from docx import Document
+        
         # 创建一个新文档
         doc = Document()
         
@@ -87,12 +107,55 @@ class ConfigManager:
         self.apply_style_settings_to_doc(doc)
         
         # 添加预置内容
-        self.add_preset_content(doc)
+        if mode == TEMPLATE_MODE_SHOWCASE:
+            self.add_preset_content(doc)
         
         return doc
     
+    def get_config_hash(self, mode=TEMPLATE_MODE_STYLES):
+        """获取当前配置的规范哈希，可作为转换时的 --reference-doc 参数
+        
+        Args:
+            mode: 导出方式，默认为仅样式
+        """
+        return config_hash(self.config, mode=mode)
+    
+    def get_template_bytes(self, cache=None, mode=TEMPLATE_MODE_STYLES):
+        """获取当前配置对应的模板文件内容
+        
+        配置未变化时直接返回缓存的内容，不会重新生成文档。
+        
+        Args:
+            cache: 参考文档缓存（可选），默认使用全局缓存
+            mode: 导出方式，默认为仅样式
+            
+        Returns:
+            bytes: docx文件内容
+        """
+        cache = cache or get_reference_doc_cache()
+        return cache.get_or_create(
+            self.get_config_hash(mode), lambda: self._build_template_bytes(mode)
+        )
+    
+    def _build_template_bytes(self, mode=TEMPLATE_MODE_STYLES):
+        """生成模板文件并返回其内容
+        
+        优先直接改写内置参考文档的XML部件，无法使用时回退到python-docx逐项构建。
+        """
+        try:
+            from core.ooxml_template import build_template_bytes
+            return build_template_bytes(self.config, mode == TEMPLATE_MODE_SHOWCASE)
+        except (ImportError, ValueError):
+            pass
+        
+        buffer = io.BytesIO()
+        self.create_template_file(mode).save(buffer)
+        return buffer.getvalue()
+    
     def apply_page_settings_to_doc(self, doc):
         """将页面设置应用到文档"""
+        from docx.shared import Inches
+        
         section = doc.sections[0] if doc.sections else doc.add_section()
         
         # 获取页面设置
@@ -122,6 +185,11 @@ class ConfigManager:
     
     def apply_style_settings_to_doc(self, doc):
         """将样式设置应用到文档"""
+        from docx.shared import Pt
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+        from docx.enum.style import WD_STYLE_TYPE
+        from docx.oxml.ns import qn
+        
         # 应用基础文本与段落样式
         basic_text = self.config.get('basic_text', {})
         
@@ -193,7 +261,13 @@ class ConfigManager:
                     heading_style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
     
     def add_preset_content(self, doc):
-        """添加预置内容，完整展示所有配置的样式项"""
+        """添加预置内容，完整展示所有配置的样式项
+        
+        修改预置内容后需要调用 core.ooxml_template.regenerate_base_module 更新内置参考文档。
+        """
+        from docx.shared import Inches, RGBColor
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+        
         # 添加文档标题
         title = doc.add_heading('文档标题', level=1)
         title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
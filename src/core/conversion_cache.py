@@ -0,0 +1,248 @@
+"""
+转换缓存模块
+基于内容寻址的磁盘缓存，避免对未变化的输入重复调用pandoc
+"""
+
+import os
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+
+from core.app_dirs import get_cache_dir
+from core.capabilities import load_capabilities
+
+
+# 缓存默认容量上限 (字节)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# 缓存键格式版本，修改键的组成方式时需要递增
+CACHE_KEY_VERSION = b'pandoc-gui-conversion-cache-v2'
+
+# 读取文件计算哈希时的块大小
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# pandoc版本缓存，键为 (路径, 大小, 修改时间)
+_pandoc_versions = {}
+_pandoc_versions_lock = threading.Lock()
+
+
+def get_pandoc_version(pandoc_path):
+    """获取pandoc版本信息
+
+    优先使用能力探测的缓存结果；否则按可执行文件的路径、大小和修改时间缓存，
+    同一个二进制只查询一次。
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        str: `pandoc --version` 输出的第一行，失败时返回空字符串
+    """
+    capabilities = load_capabilities(pandoc_path)
+    if capabilities:
+        return capabilities['version']
+
+    try:
+        stat = os.stat(pandoc_path)
+    except OSError:
+        return ''
+
+    signature = (os.path.abspath(pandoc_path), stat.st_size, stat.st_mtime_ns)
+    with _pandoc_versions_lock:
+        if signature in _pandoc_versions:
+            return _pandoc_versions[signature]
+
+    try:
+        result = subprocess.run(
+            [pandoc_path, '--version'], capture_output=True, text=True, check=True
+        )
+        version = result.stdout.splitlines()[0].strip() if result.stdout else ''
+    except (subprocess.CalledProcessError, OSError):
+        version = ''
+
+    with _pandoc_versions_lock:
+        _pandoc_versions[signature] = version
+    return version
+
+
+def _update_hash_with_file(digest, file_path):
+    """将文件内容分块写入哈希对象"""
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+
+class ConversionCache:
+    """转换结果缓存
+
+    缓存键由输入文件内容、pandoc命令选项、选项中引用的文件内容、参考文档内容和
+    pandoc版本共同决定。
+    缓存条目以键名保存在缓存目录下，按最近使用时间 (文件修改时间) 进行LRU淘汰。
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 缓存目录，默认使用应用缓存目录下的 conversions 子目录
+            max_bytes: 缓存容量上限 (字节)
+        """
+        self.cache_dir = cache_dir or get_cache_dir('conversions')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def make_key(self, input_file, options, reference_doc=None, pandoc_version='',
+                 option_files=None):
+        """计算缓存键
+
+        Args:
+            input_file: 输入文件路径
+            options: pandoc命令选项列表，不应包含随调用变化的输入/输出路径
+            reference_doc: 参考文档路径（可选）
+            pandoc_version: pandoc版本信息
+            option_files: 选项中引用的文件路径列表（可选），如CSS、参考文献和过滤器，
+                          其内容参与计算
+
+        Returns:
+            str: 十六进制的SHA-256缓存键
+        """
+        digest = hashlib.sha256(CACHE_KEY_VERSION)
+        digest.update(b'\0version\0' + pandoc_version.encode('utf-8'))
+        for option in options:
+            digest.update(b'\0option\0' + str(option).encode('utf-8'))
+
+        digest.update(b'\0input\0')
+        _update_hash_with_file(digest, input_file)
+
+        if reference_doc:
+            digest.update(b'\0reference-doc\0')
+            _update_hash_with_file(digest, reference_doc)
+
+        for path in option_files or []:
+            digest.update(b'\0option-file\0' + str(path).encode('utf-8') + b'\0')
+            _update_hash_with_file(digest, path)
+
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        """获取缓存条目的存放路径"""
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def fetch(self, key, output_file):
+        """查找缓存并生成输出文件
+
+        Args:
+            key: 缓存键
+            output_file: 输出文件路径
+
+        Returns:
+            bool: 是否命中缓存
+        """
+        entry_path = self._entry_path(key)
+        try:
+            # 总是复制而不是硬链接，之后改写输出文件不会影响缓存条目
+            shutil.copyfile(entry_path, output_file)
+            # 更新修改时间作为LRU的最近使用时间
+            os.utime(entry_path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key, output_file):
+        """将转换输出保存到缓存
+
+        Args:
+            key: 缓存键
+            output_file: 已生成的输出文件路径
+        """
+        entry_path = self._entry_path(key)
+        entry_dir = os.path.dirname(entry_path)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        # 先写入临时文件再替换，避免并发读取到不完整的条目
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as dst, open(output_file, 'rb') as src:
+                shutil.copyfileobj(src, dst, HASH_CHUNK_SIZE)
+            size = os.path.getsize(temp_path)
+
+            with self._lock:
+                replaced = os.path.getsize(entry_path) if os.path.exists(entry_path) else 0
+                os.replace(temp_path, entry_path)
+                if self._total_bytes is not None:
+                    self._total_bytes += size - replaced
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        self._evict()
+
+    def _scan_entries(self):
+        """扫描所有缓存条目
+
+        Returns:
+            list: [(最近使用时间, 大小, 路径), ...]
+        """
+        entries = []
+        for sub_dir in os.scandir(self.cache_dir):
+            if not sub_dir.is_dir():
+                continue
+            for entry in os.scandir(sub_dir.path):
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        """超出容量上限时，按最近最少使用顺序淘汰条目"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan_entries())
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            for _, size, path in sorted(self._scan_entries()):
+                if self._total_bytes <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    self._total_bytes -= size
+                except OSError:
+                    pass
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            for _, _, path in self._scan_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
+
+    def stats(self):
+        """获取缓存统计信息
+
+        Returns:
+            dict: 命中次数、未命中次数和当前占用大小
+        """
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan_entries())
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -0,0 +1,226 @@
+"""
+转换指标模块
+记录每个转换任务的耗时、CPU时间、峰值内存、输入输出大小和pandoc警告，
+并可追加写入JSONL日志或Prometheus textfile
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+
+
+class ConversionResult(tuple):
+    """转换结果
+
+    可以像 (success, message) 元组一样解包和比较，同时带有本次转换的指标。
+    没有测量到的指标为None。
+
+    Attributes:
+        success: 是否成功
+        message: 提示信息
+        input_file: 输入文件路径
+        output_file: 输出文件路径
+        output_format: 输出格式，未指定时为输出文件的扩展名
+        backend: 实际使用的转换方式，'subprocess'、'server' 或 'cache'
+        returncode: pandoc进程的退出码
+        wall_time: 耗时 (秒)，子进程方式为从启动到退出的时间
+        user_time: pandoc进程的用户态CPU时间 (秒)
+        system_time: pandoc进程的内核态CPU时间 (秒)
+        peak_rss: pandoc进程的峰值常驻内存 (字节)
+        input_bytes: 输入文件大小 (字节)
+        output_bytes: 输出文件大小 (字节)
+        warnings: 合并计数后的pandoc警告，core.pandoc_log.PandocWarning 列表
+    """
+
+    FIELDS = (
+        'input_file', 'output_file', 'output_format', 'backend', 'returncode',
+        'wall_time', 'user_time', 'system_time', 'peak_rss',
+        'input_bytes', 'output_bytes', 'warnings',
+    )
+
+    def __new__(cls, success, message, **metrics):
+        unknown = set(metrics) - set(cls.FIELDS)
+        if unknown:
+            raise TypeError(f"未知的指标: {', '.join(sorted(unknown))}")
+        result = super().__new__(cls, (success, message))
+        for field in cls.FIELDS:
+            setattr(result, field, metrics.get(field))
+        if result.warnings is None:
+            result.warnings = []
+        return result
+
+    @property
+    def success(self):
+        return self[0]
+
+    @property
+    def message(self):
+        return self[1]
+
+    @property
+    def cpu_time(self):
+        """用户态和内核态CPU时间之和 (秒)"""
+        if self.user_time is None or self.system_time is None:
+            return None
+        return self.user_time + self.system_time
+
+    def to_dict(self):
+        """转换为可序列化为JSON的字典"""
+        record = {'success': self.success, 'message': self.message}
+        for field in self.FIELDS:
+            record[field] = getattr(self, field)
+        record['warnings'] = [warning.to_dict() for warning in self.warnings]
+        return record
+
+    def __repr__(self):
+        return f"ConversionResult(success={self.success!r}, message={self.message!r})"
+
+
+def peak_rss_bytes(rusage):
+    """从 resource.struct_rusage 中取出峰值常驻内存 (字节)
+
+    Linux 上 ru_maxrss 以KB为单位，macOS 上以字节为单位。
+    """
+    if sys.platform == 'darwin':
+        return rusage.ru_maxrss
+    return rusage.ru_maxrss * 1024
+
+
+class JsonlMetricsSink:
+    """把每个转换结果作为一行JSON追加写入文件"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: 日志文件路径
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, result):
+        """追加一条转换记录"""
+        record = {'time': round(time.time(), 3), **result.to_dict()}
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+def _format_value(value):
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _file_mode(mode=0o644):
+    """按当前umask计算新建文件的权限
+
+    进程的umask只能在设置新值时读出，读出后立即恢复。
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return mode & ~umask
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusTextfileSink:
+    """按输出格式和转换方式汇总转换指标，写入Prometheus textfile
+
+    文件供 node_exporter 的 textfile collector 读取，每次记录后整体替换，
+    读取方不会看到写了一半的内容。collector 通常以其他用户运行，文件权限与
+    普通新建文件相同（0644 去掉umask），而不是临时文件的0600。计数从本进程开始记录时算起。
+    """
+
+    PREFIX = 'pandoc_gui_conversion'
+
+    def __init__(self, path):
+        """
+        Args:
+            path: 输出文件路径，通常以 .prom 结尾
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._peak_rss = {}
+        self._mode = _file_mode()
+
+    def _add(self, name, labels, value):
+        if value is None:
+            return
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def record(self, result):
+        """累加一条转换记录并重写文件"""
+        output_format = result.output_format or 'unknown'
+        backend = result.backend or 'unknown'
+        status = 'success' if result.success else 'failure'
+        labels = (('format', output_format), ('backend', backend))
+
+        with self._lock:
+            self._add('total', labels + (('status', status),), 1)
+            self._add('wall_seconds_total', labels, result.wall_time)
+            self._add('cpu_seconds_total', labels + (('mode', 'user'),), result.user_time)
+            self._add('cpu_seconds_total', labels + (('mode', 'system'),), result.system_time)
+            self._add('input_bytes_total', labels, result.input_bytes)
+            self._add('output_bytes_total', labels, result.output_bytes)
+            for warning in result.warnings:
+                self._add('warnings_total', labels + (('type', warning.type),), warning.count)
+            if result.peak_rss is not None:
+                self._peak_rss[labels] = max(self._peak_rss.get(labels, 0), result.peak_rss)
+            self._write()
+
+    def render(self):
+        """生成textfile内容"""
+        descriptions = {
+            'total': ('counter', 'Number of conversion jobs.'),
+            'wall_seconds_total': ('counter', 'Wall-clock seconds spent in conversions.'),
+            'cpu_seconds_total': ('counter', 'CPU seconds used by pandoc processes.'),
+            'input_bytes_total': ('counter', 'Bytes read from input files.'),
+            'output_bytes_total': ('counter', 'Bytes written to output files.'),
+            'warnings_total': ('counter', 'Warnings reported by pandoc.'),
+        }
+        lines = []
+        for name, (kind, help_text) in descriptions.items():
+            samples = sorted((labels, value) for (key, labels), value in self._counters.items()
+                             if key == name)
+            if not samples:
+                continue
+            lines.append(f'# HELP {self.PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {self.PREFIX}_{name} {kind}')
+            for labels, value in samples:
+                lines.append(f'{self.PREFIX}_{name}{self._format_labels(labels)} {_format_value(value)}')
+
+        if self._peak_rss:
+            lines.append(f'# HELP {self.PREFIX}_peak_rss_bytes Largest peak RSS of a pandoc process.')
+            lines.append(f'# TYPE {self.PREFIX}_peak_rss_bytes gauge')
+            for labels, value in sorted(self._peak_rss.items()):
+                lines.append(f'{self.PREFIX}_peak_rss_bytes{self._format_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _format_labels(labels):
+        return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels) + '}'
+
+    def _write(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.chmod(temp_path, self._mode)
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
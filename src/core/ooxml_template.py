@@ -0,0 +1,534 @@
+"""
+OOXML模板生成模块
+直接改写内置参考文档中的 styles.xml 和分节属性生成docx模板，
+生成过程不需要加载python-docx
+"""
+
+import io
+import copy
+import zlib
+import base64
+import struct
+import zipfile
+import threading
+
+from lxml import etree
+
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+STYLES_PART = 'word/styles.xml'
+DOCUMENT_PART = 'word/document.xml'
+
+# 以下子元素顺序与 WordprocessingML schema 一致，新增元素时按此顺序插入
+STYLE_CHILD_ORDER = [
+    'name', 'aliases', 'basedOn', 'next', 'link', 'autoRedefine', 'hidden', 'uiPriority',
+    'semiHidden', 'unhideWhenUsed', 'qFormat', 'locked', 'personal', 'personalCompose',
+    'personalReply', 'rsid', 'pPr', 'rPr', 'tblPr', 'trPr', 'tcPr', 'tblStylePr',
+]
+
+PPR_CHILD_ORDER = [
+    'pStyle', 'keepNext', 'keepLines', 'pageBreakBefore', 'framePr', 'widowControl',
+    'numPr', 'suppressLineNumbers', 'pBdr', 'shd', 'tabs', 'suppressAutoHyphens',
+    'kinsoku', 'wordWrap', 'overflowPunct', 'topLinePunct', 'autoSpaceDE', 'autoSpaceDN',
+    'bidi', 'adjustRightInd', 'snapToGrid', 'spacing', 'ind', 'contextualSpacing',
+    'mirrorIndents', 'suppressOverlap', 'jc', 'textDirection', 'textAlignment',
+    'textboxTightWrap', 'outlineLvl', 'divId', 'cnfStyle', 'rPr', 'sectPr', 'pPrChange',
+]
+
+RPR_CHILD_ORDER = [
+    'rStyle', 'rFonts', 'b', 'bCs', 'i', 'iCs', 'caps', 'smallCaps', 'strike', 'dstrike',
+    'outline', 'shadow', 'emboss', 'imprint', 'noProof', 'snapToGrid', 'vanish',
+    'webHidden', 'color', 'spacing', 'w', 'kern', 'position', 'sz', 'szCs', 'highlight',
+    'u', 'effect', 'bdr', 'shd', 'fitText', 'vertAlign', 'rtl', 'cs', 'em', 'lang',
+    'eastAsianLayout', 'specVanish', 'oMath',
+]
+
+SECTPR_CHILD_ORDER = [
+    'headerReference', 'footerReference', 'footnotePr', 'endnotePr', 'type', 'pgSz',
+    'pgMar', 'paperSrc', 'pgBorders', 'lnNumType', 'pgNumType', 'cols', 'formProt',
+    'vAlign', 'noEndnote', 'titlePg', 'textDirection', 'bidi', 'rtlGutter', 'docGrid',
+    'printerSettings', 'sectPrChange',
+]
+
+# 页面尺寸 (英寸)
+PAGE_SIZES = {
+    'A4': (8.27, 11.69),
+    'A3': (11.69, 16.54),
+    'A5': (5.83, 8.27),
+    'Letter': (8.5, 11.0),
+}
+
+# 正文对齐方式：配置中的序号到 w:jc 取值
+BODY_ALIGNMENTS = {0: 'left', 1: 'center', 2: 'right'}
+
+# 标题对齐方式：配置中的名称到 w:jc 取值
+HEADING_ALIGNMENTS = {'左对齐': 'left', '居中对齐': 'center', '右对齐': 'right'}
+
+# 长度单位换算，取整方式与python-docx一致，保证生成的数值相同
+EMU_PER_INCH = 914400
+EMU_PER_PT = 12700
+EMU_PER_TWIP = 635
+
+_ZIP_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+_ZIP_CENTRAL_HEADER = struct.Struct('<4s6H3L5H2L')
+_ZIP_END_RECORD = struct.Struct('<4s4H2LH')
+
+# 默认的全局生成器实例
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def _w(tag):
+    """WordprocessingML 命名空间下的完整标签名"""
+    return f'{{{W_NS}}}{tag}'
+
+
+def inches_to_twips(inches):
+    return round(int(inches * EMU_PER_INCH) / EMU_PER_TWIP)
+
+
+def pt_to_twips(pt):
+    return round(int(pt * EMU_PER_PT) / EMU_PER_TWIP)
+
+
+def pt_to_half_points(pt):
+    return int(int(pt * EMU_PER_PT) / EMU_PER_PT * 2)
+
+
+def _get_or_add(parent, tag, order):
+    """获取子元素，不存在时按schema顺序插入一个新元素"""
+    child = parent.find(_w(tag))
+    if child is not None:
+        return child
+
+    child = etree.Element(_w(tag))
+    successors = {_w(name) for name in order[order.index(tag) + 1:]}
+    for index, sibling in enumerate(parent):
+        if sibling.tag in successors:
+            parent.insert(index, child)
+            break
+    else:
+        parent.append(child)
+    return child
+
+
+def _set_font_name(rPr, name):
+    """设置西文字体，与python-docx的 font.name 相同"""
+    rFonts = _get_or_add(rPr, 'rFonts', RPR_CHILD_ORDER)
+    rFonts.set(_w('ascii'), name)
+    rFonts.set(_w('hAnsi'), name)
+
+
+def _set_bool(rPr, tag, value):
+    """设置开关属性，True写为无值元素，False写为 w:val="0" """
+    element = _get_or_add(rPr, tag, RPR_CHILD_ORDER)
+    if value:
+        element.attrib.pop(_w('val'), None)
+    else:
+        element.set(_w('val'), '0')
+
+
+def _apply_font(style, info, default_font='宋体', default_size=12):
+    """将字体、字号、粗体和斜体应用到样式"""
+    rPr = _get_or_add(style, 'rPr', STYLE_CHILD_ORDER)
+    _set_font_name(rPr, info.get('font', default_font))
+    _get_or_add(rPr, 'sz', RPR_CHILD_ORDER).set(
+        _w('val'), str(pt_to_half_points(info.get('size', default_size)))
+    )
+    _set_bool(rPr, 'b', info.get('bold', False))
+    _set_bool(rPr, 'i', info.get('italic', False))
+
+
+def _set_alignment(style, value):
+    _get_or_add(_get_or_add(style, 'pPr', STYLE_CHILD_ORDER), 'jc', PPR_CHILD_ORDER).set(
+        _w('val'), value
+    )
+
+
+def apply_normal_style(style, basic_text):
+    """将基础文本与段落配置应用到正文 (Normal) 样式元素"""
+    if 'body' in basic_text:
+        _apply_font(style, basic_text['body'])
+
+    if 'char' in basic_text:
+        char_info = basic_text['char']
+        chinese_font = char_info.get('chinese_font', '宋体')
+        english_font = char_info.get('english_font', 'Times New Roman')
+        rPr = _get_or_add(style, 'rPr', STYLE_CHILD_ORDER)
+        _set_font_name(rPr, chinese_font)
+        rFonts = _get_or_add(rPr, 'rFonts', RPR_CHILD_ORDER)
+        rFonts.set(_w('eastAsia'), chinese_font)
+        rFonts.set(_w('ascii'), english_font)
+        rFonts.set(_w('hAnsi'), english_font)
+        rFonts.set(_w('cs'), char_info.get('number_font', 'Times New Roman'))
+
+    if 'format' in basic_text:
+        format_info = basic_text['format']
+        pPr = _get_or_add(style, 'pPr', STYLE_CHILD_ORDER)
+
+        # 假设12pt为一个字符宽度
+        ind = _get_or_add(pPr, 'ind', PPR_CHILD_ORDER)
+        ind.attrib.pop(_w('hanging'), None)
+        ind.set(_w('firstLine'), str(pt_to_twips(format_info.get('first_line_indent', 2) * 12)))
+
+        spacing = _get_or_add(pPr, 'spacing', PPR_CHILD_ORDER)
+        line = int(format_info.get('line_spacing', 1.5) * 240 * EMU_PER_TWIP)
+        spacing.set(_w('line'), str(round(line / EMU_PER_TWIP)))
+        spacing.set(_w('lineRule'), 'auto')
+        spacing.set(_w('before'), str(pt_to_twips(format_info.get('paragraph_spacing', 6))))
+
+        # 默认两端对齐
+        _set_alignment(style, BODY_ALIGNMENTS.get(format_info.get('alignment', 3), 'both'))
+
+
+def apply_heading_style(style, heading_info):
+    """将标题配置应用到标题样式元素"""
+    _apply_font(style, heading_info)
+    _set_alignment(style, HEADING_ALIGNMENTS.get(heading_info.get('align', '左对齐'), 'both'))
+
+
+def get_block_width(sectPr):
+    """版心宽度 (twips)，即页面宽度减去左右页边距"""
+    pgSz = sectPr.find(_w('pgSz'))
+    pgMar = sectPr.find(_w('pgMar'))
+    return int(pgSz.get(_w('w'))) - int(pgMar.get(_w('left'))) - int(pgMar.get(_w('right')))
+
+
+def apply_table_width(tbl, block_width):
+    """按版心宽度平均设置表格列宽，与python-docx的 add_table 相同"""
+    columns = tbl.findall(f"{_w('tblGrid')}/{_w('gridCol')}")
+    if not columns:
+        return
+    width = str(round(block_width * EMU_PER_TWIP // len(columns) / EMU_PER_TWIP))
+    for column in columns:
+        column.set(_w('w'), width)
+    for tcW in tbl.iterfind(f"{_w('tr')}/{_w('tc')}/{_w('tcPr')}/{_w('tcW')}"):
+        if tcW.get(_w('type')) == 'dxa':
+            tcW.set(_w('w'), width)
+
+
+def apply_page_settings(sectPr, page_settings):
+    """将页面设置应用到分节属性元素"""
+    pgSz = _get_or_add(sectPr, 'pgSz', SECTPR_CHILD_ORDER)
+    page_size = page_settings.get('size', 'A4')
+    if page_size in PAGE_SIZES:
+        width, height = PAGE_SIZES[page_size]
+        pgSz.set(_w('w'), str(inches_to_twips(width)))
+        pgSz.set(_w('h'), str(inches_to_twips(height)))
+
+    # 1表示横向，只交换宽高
+    if page_settings.get('orientation', 0) == 1:
+        width, height = pgSz.get(_w('w')), pgSz.get(_w('h'))
+        pgSz.set(_w('w'), height)
+        pgSz.set(_w('h'), width)
+
+    margins = page_settings.get('margins', {})
+    pgMar = _get_or_add(sectPr, 'pgMar', SECTPR_CHILD_ORDER)
+    for side, default in (('top', 2.54), ('bottom', 2.54), ('left', 3.17), ('right', 3.17)):
+        pgMar.set(_w(side), str(inches_to_twips(margins.get(side, default) / 2.54)))
+
+
+class _Deflated:
+    """已压缩的内容片段"""
+
+    __slots__ = ('data', 'compressed')
+
+    def __init__(self, data, final=False):
+        self.data = data
+        # 每个片段使用独立的压缩器并在结尾字节对齐，压缩结果可以直接拼接成一个deflate流
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        self.compressed = compressor.compress(data) + compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class _PartSkeleton:
+    """可替换部分元素的XML部件
+
+    部件被拆分为固定片段和可替换的元素槽位，固定片段只序列化和压缩一次，
+    生成时只需处理被修改的元素。
+    """
+
+    def __init__(self, xml, slots):
+        """
+        Args:
+            xml: 部件的原始XML内容
+            slots: {槽位名称: 元素} 的映射函数，参数为解析后的根元素
+        """
+        root = etree.fromstring(xml)
+        self.nsmap = root.nsmap
+        self.root_tag = root.tag
+        self.templates = {}
+        self.originals = {}
+
+        markers = []
+        for index, (name, element) in enumerate(slots(root).items()):
+            marker = etree.Comment(f'slot-{index}')
+            marker.tail = element.tail
+            element.addprevious(marker)
+            element.getparent().remove(element)
+            element.tail = None
+            self.templates[name] = element
+            self.originals[name] = _Deflated(self._serialize(element))
+            markers.append((name, f'<!--slot-{index}-->'.encode('ascii')))
+
+        data = etree.tostring(root, encoding='UTF-8', xml_declaration=True, standalone=True)
+        self.chunks = []
+        self.order = []
+        for name, marker in markers:
+            head, data = data.split(marker, 1)
+            self.chunks.append(_Deflated(head))
+            self.order.append(name)
+        self.chunks.append(_Deflated(data, final=True))
+
+    def _serialize(self, element):
+        """序列化单个元素，命名空间声明由外层根元素提供"""
+        wrapper = etree.Element(self.root_tag, nsmap=self.nsmap)
+        wrapper.append(element)
+        data = etree.tostring(wrapper, encoding='UTF-8')
+        wrapper.remove(element)
+        return data[data.index(b'>') + 1:data.rindex(b'</')]
+
+    def render(self, modify):
+        """生成部件内容
+
+        Args:
+            modify: {槽位名称: 修改函数}，修改函数接收元素副本并就地修改
+
+        Returns:
+            tuple: (crc32, 原始大小, 压缩后的数据)
+        """
+        pieces = []
+        for chunk, name in zip(self.chunks, self.order):
+            pieces.append(chunk)
+            if name in modify:
+                element = copy.deepcopy(self.templates[name])
+                modify[name](element)
+                pieces.append(_Deflated(self._serialize(element)))
+            else:
+                pieces.append(self.originals[name])
+        pieces.append(self.chunks[-1])
+
+        crc = 0
+        size = 0
+        for piece in pieces:
+            crc = zlib.crc32(piece.data, crc)
+            size += len(piece.data)
+        return crc, size, b''.join(piece.compressed for piece in pieces)
+
+
+class OoxmlTemplateEngine:
+    """基于内置参考文档的模板生成器
+
+    只重新生成 styles.xml 中被配置修改的样式和 document.xml 中的分节属性，
+    其余zip成员按原始压缩数据直接复制。
+    """
+
+    def __init__(self, base_docx=None):
+        """
+        Args:
+            base_docx: 作为基础的docx文件内容（可选），默认使用内置参考文档
+        """
+        if base_docx is None:
+            from core.reference_docx_base import BASE_DOCX_BASE64
+            base_docx = base64.b64decode(BASE_DOCX_BASE64)
+
+        self.members = []
+        with zipfile.ZipFile(io.BytesIO(base_docx)) as archive:
+            for info in archive.infolist():
+                self.members.append((info, self._read_raw(base_docx, info)))
+            styles_xml = archive.read(STYLES_PART)
+            document_xml = archive.read(DOCUMENT_PART)
+
+        self.styles = _PartSkeleton(styles_xml, self._style_slots)
+        self.document = _PartSkeleton(document_xml, self._document_slots)
+        self.empty_document = _PartSkeleton(
+            self._strip_body(document_xml), self._document_slots
+        )
+
+    @staticmethod
+    def _strip_body(document_xml):
+        """去掉正文内容，只保留分节属性"""
+        root = etree.fromstring(document_xml)
+        body = root.find(_w('body'))
+        for child in list(body):
+            if child.tag != _w('sectPr'):
+                body.remove(child)
+        return etree.tostring(root, encoding='UTF-8', xml_declaration=True, standalone=True)
+
+    @staticmethod
+    def _read_raw(data, info):
+        """读取zip成员未解压的原始数据"""
+        header = _ZIP_LOCAL_HEADER.unpack_from(data, info.header_offset)
+        start = info.header_offset + _ZIP_LOCAL_HEADER.size + header[-2] + header[-1]
+        return data[start:start + info.compress_size]
+
+    @staticmethod
+    def _style_slots(root):
+        """正文样式和各级标题样式"""
+        slots = {}
+        for style in root.iterfind(_w('style')):
+            name = style.find(_w('name'))
+            if name is None or style.get(_w('type')) != 'paragraph':
+                continue
+            value = name.get(_w('val'))
+            if value == 'Normal' or (value.startswith('heading ') and value[8:].isdigit()):
+                slots[value] = style
+        missing = {'Normal'} | {f'heading {level}' for level in range(1, 10)}
+        missing.difference_update(slots)
+        if missing:
+            raise ValueError(f"基础文档缺少样式：{', '.join(sorted(missing))}")
+        return slots
+
+    @staticmethod
+    def _document_slots(root):
+        """正文末尾的分节属性，以及列宽随版心宽度变化的表格"""
+        body = root.find(_w('body'))
+        sectPr = body.find(_w('sectPr'))
+        if sectPr is None:
+            raise ValueError("基础文档缺少分节属性")
+        slots = {
+            f'table-{index}': tbl for index, tbl in enumerate(body.iterfind(_w('tbl')))
+        }
+        slots['sectPr'] = sectPr
+        return slots
+
+    def build(self, config, showcase=True):
+        """根据排版配置生成docx模板
+
+        Args:
+            config: ConfigManager.collect_config 返回的配置字典
+            showcase: 是否包含预置的示例内容，为False时正文为空，只包含样式和页面设置
+
+        Returns:
+            bytes: docx文件内容
+        """
+        style_changes = {}
+        basic_text = config.get('basic_text', {})
+        if basic_text:
+            style_changes['Normal'] = lambda style: apply_normal_style(style, basic_text)
+
+        headings = config.get('headings', {})
+        for level in range(1, 10):
+            heading_info = headings.get(f'标题{level}')
+            if heading_info is not None:
+                style_changes[f'heading {level}'] = (
+                    lambda style, info=heading_info: apply_heading_style(style, info)
+                )
+
+        document = self.document if showcase else self.empty_document
+        page_settings = config.get('page_settings', {})
+        document_changes = {
+            'sectPr': lambda sectPr: apply_page_settings(sectPr, page_settings)
+        }
+        table_slots = [name for name in document.templates if name.startswith('table-')]
+        if table_slots:
+            sectPr = copy.deepcopy(document.templates['sectPr'])
+            apply_page_settings(sectPr, page_settings)
+            block_width = get_block_width(sectPr)
+            for name in table_slots:
+                document_changes[name] = lambda tbl: apply_table_width(tbl, block_width)
+
+        parts = {
+            STYLES_PART: self.styles.render(style_changes),
+            DOCUMENT_PART: document.render(document_changes),
+        }
+        return self._write_zip(parts)
+
+    def _write_zip(self, parts):
+        """写出zip文件，parts中的成员使用新内容，其余成员复制原始数据"""
+        output = io.BytesIO()
+        central = []
+        for info, raw in self.members:
+            name = info.filename.encode('utf-8')
+            if info.filename in parts:
+                crc, size, raw = parts[info.filename]
+                method = zipfile.ZIP_DEFLATED
+            else:
+                crc, size, method = info.CRC, info.file_size, info.compress_type
+
+            year, month, day, hour, minute, second = info.date_time
+            dos_time = hour << 11 | minute << 5 | second // 2
+            dos_date = (year - 1980) << 9 | month << 5 | day
+            offset = output.tell()
+            output.write(_ZIP_LOCAL_HEADER.pack(
+                b'PK\x03\x04', 20, 0, method, dos_time, dos_date,
+                crc, len(raw), size, len(name), 0
+            ))
+            output.write(name)
+            output.write(raw)
+            central.append(_ZIP_CENTRAL_HEADER.pack(
+                b'PK\x01\x02', 20, 20, 0, method, dos_time, dos_date,
+                crc, len(raw), size, len(name), 0, 0, 0, 0, info.external_attr, offset
+            ) + name)
+
+        central_offset = output.tell()
+        for record in central:
+            output.write(record)
+        output.write(_ZIP_END_RECORD.pack(
+            b'PK\x05\x06', 0, 0, len(central), len(central),
+            output.tell() - central_offset, central_offset, 0
+        ))
+        return output.getvalue()
+
+
+def get_template_engine():
+    """获取默认的模板生成器，首次调用时解析内置参考文档"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = OoxmlTemplateEngine()
+        return _default_engine
+
+
+def build_template_bytes(config, showcase=True):
+    """根据排版配置生成docx模板
+
+    Args:
+        config: ConfigManager.collect_config 返回的配置字典
+        showcase: 是否包含预置的示例内容
+
+    Returns:
+        bytes: docx文件内容
+    """
+    return get_template_engine().build(config, showcase)
+
+
+def build_base_docx():
+    """使用python-docx生成内置参考文档：默认模板加上预置内容，不应用任何配置"""
+    from docx import Document
+    from core.config_manager import ConfigManager
+
+    doc = Document()
+    ConfigManager().add_preset_content(doc)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def regenerate_base_module(path=None):
+    """重新生成 core/reference_docx_base.py
+
+    修改 ConfigManager.add_preset_content 或升级python-docx后需要调用。
+
+    Args:
+        path: 输出文件路径（可选），默认覆盖当前的模块文件
+    """
+    import os
+    import textwrap
+
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reference_docx_base.py')
+
+    encoded = base64.b64encode(build_base_docx()).decode('ascii')
+    lines = '\n'.join(f"    '{line}'" for line in textwrap.wrap(encoded, 76))
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(
+            '"""\n'
+            '内置参考文档\n'
+            'python-docx默认模板加上预置内容生成的docx文件，以base64保存，\n'
+            '由 core.ooxml_template.regenerate_base_module 生成，请勿手工修改\n'
+            '"""\n\n'
+            f'BASE_DOCX_BASE64 = (\n{lines}\n)\n'
+        )
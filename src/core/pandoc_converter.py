@@ -5,20 +5,127 @@ Pandoc转换器模块
 
 import os
 import sys
+import io
+import shutil
+import time
+import signal
+import tempfile
+import threading
 import subprocess
-from PyQt5.QtWidgets import QMessageBox
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from core.conversion_cache import get_pandoc_version
+from core.pandoc_server import PandocServerPool, PandocServerError, PandocServerUnsupported
+from core.rts_profiles import get_rts_args, strip_rts_args, is_heap_exhausted
+from core.capabilities import get_output_formats, get_input_formats
+from core.reference_doc_cache import parse_config_hash, get_reference_doc_cache
+from core.conversion_metrics import ConversionResult, peak_rss_bytes
+from core.pandoc_log import StderrCapture
+
+
+# 批量转换的默认并发数
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+
+# 流式转换时每次读写的块大小
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 检查取消请求的时间间隔 (秒)
+CANCEL_POLL_INTERVAL = 0.1
+
+# 取消后等待标准错误输出读取结束的最长时间 (秒)，
+# 脱离进程组的子进程可能仍持有管道，超时后不再等待
+CANCEL_DRAIN_TIMEOUT = 2.0
+
+# 任务被取消时返回的提示信息
+CANCELLED_MESSAGE = "转换已取消"
+
+# 服务模式连续失败多少次后回退到子进程方式
+SERVER_MAX_FAILURES = 3
+
+# 使用这些选项时不缓存转换结果：前三个无法确认输出是否嵌入了本地文件，
+# --extract-media 和 --log 在输出文件之外还会写入其他文件，命中缓存时只能恢复输出文件
+UNCACHEABLE_OPTIONS = (
+    '--embed-resources', '--self-contained', '--quiet', '--extract-media', '--log',
+)
+
+# 图片保存在文件内部的输入格式，解析为AST时需要提取图片
+EMBEDDED_MEDIA_INPUT_EXTS = {'.docx', '.odt', '.epub'}
+
+# 输出文件本身包含图片的格式，其余格式需要把提取出的图片保存在输出文件旁边
+EMBEDDED_MEDIA_OUTPUT_FORMATS = {'docx', 'odt', 'epub', 'epub2', 'epub3', 'pptx', 'pdf'}
+
+
+def format_failure_message(returncode, stderr):
+    """
+    生成pandoc执行失败时的提示信息
+    
+    Args:
+        returncode: 进程退出码
+        stderr: 标准错误输出
+        
+    Returns:
+        str: 提示信息
+    """
+    if is_heap_exhausted(returncode, stderr):
+        return f"转换失败：超出pandoc最大内存限制，请调大内存上限或更换性能配置\n{stderr or ''}"
+    return f"转换失败：\n{stderr or f'pandoc退出码 {returncode}'}"
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except (OSError, TypeError):
+        return None
 
 
 class PandocConverter:
     """Pandoc转换器"""
     
-    def __init__(self, pandoc_path=None):
+    def __init__(self, pandoc_path=None, cache=None, backend='subprocess',
+                 server_pool_size=None, server_max_jobs=None,
+                 profile=None, memory_limit=None, reference_docs=None, metrics=None):
+        """
+        Args:
+            pandoc_path: Pandoc可执行文件路径
+            cache: 转换缓存（可选），为None时每次都调用pandoc
+            backend: 转换后端，'subprocess' 为每次转换启动一个pandoc进程，
+                     'server' 为使用常驻的 `pandoc server` 进程池，不可用时自动回退到子进程方式
+            server_pool_size: 服务进程数量（可选）
+            server_max_jobs: 每个服务进程处理多少个任务后重启（可选）
+            profile: 默认的性能配置名称（可选），见 core.rts_profiles.RTS_PROFILES
+            memory_limit: pandoc最大堆内存（可选），如 '2g'，超出时转换失败
+            reference_docs: 参考文档缓存（可选），模板以配置哈希给出时从中查找，
+                            默认使用全局的参考文档缓存
+            metrics: 转换指标的记录器或记录器列表（可选），如
+                     core.conversion_metrics.JsonlMetricsSink，每个任务结束后调用其 record 方法
+        """
         # 优先使用传入的路径，其次使用环境变量中的路径
         self.pandoc_path = pandoc_path or os.environ.get('PANDOC_PATH')
-        self.supported_formats = [
-            'markdown', 'docx', 'pdf', 'html', 'epub', 'odt', 
-            'txt', 'rst', 'json', 'latex', 'xml', 'pptx'
-        ]
+        self.cache = cache
+        self.backend = backend
+        self.server_pool_size = server_pool_size
+        self.server_max_jobs = server_max_jobs
+        self.server_pool = None
+        self._server_unavailable = False
+        self._server_failures = 0
+        self.profile = profile
+        self.memory_limit = memory_limit
+        self.reference_docs = reference_docs
+        if metrics is None:
+            metrics = []
+        elif not isinstance(metrics, (list, tuple)):
+            metrics = [metrics]
+        self.metrics = list(metrics)
+    
+    @property
+    def supported_formats(self):
+        """pandoc支持的输出格式，读取能力探测缓存，尚未探测时为常用格式列表"""
+        return get_output_formats(self.pandoc_path)
+    
+    @property
+    def supported_input_formats(self):
+        """pandoc支持的输入格式，读取能力探测缓存，尚未探测时为常用格式列表"""
+        return get_input_formats(self.pandoc_path)
     
     def set_pandoc_path(self, path):
         """设置Pandoc可执行文件路径"""
@@ -31,44 +138,708 @@ class PandocConverter:
                 if os.path.exists(alt_path):
                     self.pandoc_path = alt_path
     
-    def convert_file(self, input_file, output_file, template_file=None):
+    def convert_file(self, input_file, output_file, template_file=None,
+                     input_format=None, extra_args=None, profile=None, output_format=None,
+                     cancel_event=None):
         """
         转换文件格式
         
         Args:
             input_file: 输入文件路径
             output_file: 输出文件路径
-            template_file: 模板文件路径（可选）
+            template_file: 模板文件路径或排版配置哈希（可选）
+            input_format: 输入格式（可选），默认由pandoc根据扩展名判断
+            extra_args: 附加的pandoc命令行参数（可选）
+            profile: 性能配置名称（可选），默认使用构造时指定的配置
+            output_format: 输出格式（可选），默认由pandoc根据扩展名判断
+            cancel_event: threading.Event（可选），被设置时终止pandoc子进程并返回失败
+            
+        Returns:
+            ConversionResult: 可以按 (success, message) 解包，
+                              另带耗时、CPU时间、峰值内存、输入输出大小和警告等指标
+        """
+        start = time.perf_counter()
+        success, message, metrics = self._convert_file(
+            input_file, output_file, template_file, input_format, extra_args, profile,
+            output_format, cancel_event
+        )
+        return self.record_result(
+            success, message, start, input_file, output_file, output_format, **metrics
+        )
+    
+    def record_result(self, success, message, start, input_file=None, output_file=None,
+                      output_format=None, **metrics):
+        """
+        生成转换结果并交给指标记录器
+        
+        Args:
+            success: 是否成功
+            message: 提示信息
+            start: 转换开始时 time.perf_counter() 的值，metrics 中没有耗时时据此计算
+            input_file: 输入文件路径（可选），流式转换时为None
+            output_file: 输出文件路径（可选），流式转换时为None
+            output_format: 输出格式（可选），默认为输出文件的扩展名
+            **metrics: 其余传给 ConversionResult 的指标
+            
+        Returns:
+            ConversionResult: 转换结果
+        """
+        metrics.setdefault('wall_time', time.perf_counter() - start)
+        if not output_format and output_file:
+            output_format = os.path.splitext(output_file)[1].lstrip('.').lower() or None
+        if input_file is not None:
+            metrics.setdefault('input_bytes', _file_size(input_file))
+        if success and output_file is not None:
+            metrics.setdefault('output_bytes', _file_size(output_file))
+        
+        result = ConversionResult(
+            success, message,
+            input_file=input_file,
+            output_file=output_file,
+            output_format=output_format,
+            **metrics
+        )
+        self._record_metrics(result)
+        return result
+    
+    def _convert_file(self, input_file, output_file, template_file, input_format, extra_args,
+                      profile, output_format, cancel_event):
+        """
+        执行转换
+        
+        Returns:
+            tuple: (success, message, metrics)，metrics 为传给 ConversionResult 的指标字典
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            return False, CANCELLED_MESSAGE, {}
+        
+        error, cmd, reference_doc = self.build_command(
+            input_file, output_file, template_file, input_format, extra_args, profile,
+            output_format
+        )
+        if error:
+            return False, error, {}
+        
+        # 查询转换缓存，命中时直接生成输出文件，不再调用pandoc
+        cache_key = self.get_cache_key(cmd, input_file, output_file, reference_doc)
+        if cache_key and self.cache.fetch(cache_key, output_file):
+            return True, f"转换成功（缓存）：{os.path.basename(output_file)}", {'backend': 'cache'}
+        
+        # 服务进程无法应用附加命令行参数和每个任务的运行时参数，这类任务仍使用子进程方式
+        if self.backend == 'server' and not extra_args and strip_rts_args(cmd) == cmd:
+            result = self._convert_with_server(
+                input_file, output_file, input_format, reference_doc, output_format, cancel_event
+            )
+            if result is not None:
+                if result[0] and cache_key:
+                    self.cache.store(cache_key, output_file)
+                return result[0], result[1], {'backend': 'server'}
+        
+        try:
+            # 执行pandoc命令
+            if cache_key:
+                cmd = self.with_resource_log(cmd)
+            returncode, capture, usage = self._run_command(
+                cmd, cancel_event, keep_info=not cache_key or '--verbose' in (extra_args or [])
+            )
+            metrics = dict(usage, backend='subprocess', returncode=returncode,
+                           warnings=capture.warnings)
+            
+            if returncode is None:
+                return False, CANCELLED_MESSAGE, metrics
+            
+            if returncode != 0:
+                return False, format_failure_message(returncode, capture.format_message()), metrics
+            
+            if cache_key and not self.embeds_local_files(capture):
+                self.cache.store(cache_key, output_file)
+            
+            return True, f"转换成功：{os.path.basename(output_file)}", metrics
+            
+        except Exception as e:
+            return False, f"发生错误：\n{str(e)}", {'backend': 'subprocess'}
+    
+    def _record_metrics(self, result):
+        """把转换结果交给各个指标记录器，记录失败不影响转换结果"""
+        for sink in self.metrics:
+            try:
+                sink.record(result)
+            except OSError:
+                pass
+    
+    def _run_command(self, cmd, cancel_event=None, keep_info=True):
+        """
+        执行pandoc命令，可通过cancel_event终止
+        
+        标准错误输出由 StderrCapture 逐行解析，只保留有限的内容，
+        keep_info 为False时不把INFO级别的日志记为警告。
+        子进程由 _wait_process 回收，同时取得其CPU时间和峰值内存。
+        
+        Returns:
+            tuple: (returncode, capture, usage)，被取消时returncode为None；
+                   capture 为 StderrCapture；
+                   usage 为包含 wall_time、user_time、system_time、peak_rss 的字典，
+                   不支持 os.wait4 时只包含 wall_time
+        """
+        # 在POSIX上使用独立的进程组，取消时可以连同pdf引擎等子进程一起结束
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, encoding='utf-8', errors='replace',
+            start_new_session=(cancel_event is not None and os.name == 'posix')
+        )
+        
+        # 在线程中读取标准错误输出，避免管道写满导致阻塞；读到结尾说明pandoc即将退出。
+        # 管道由读取线程在读完后关闭，其他线程关闭正在读取的管道会一直等待读取返回
+        capture = StderrCapture(keep_info=keep_info)
+        
+        def drain_stderr():
+            try:
+                capture.consume(process.stderr)
+            finally:
+                process.stderr.close()
+        
+        reader = threading.Thread(target=drain_stderr, daemon=True)
+        reader.start()
+        
+        cancelled = False
+        while reader.is_alive():
+            reader.join(CANCEL_POLL_INTERVAL if cancel_event is not None else None)
+            if cancel_event is not None and cancel_event.is_set() and reader.is_alive():
+                self._signal_process(process)
+                cancelled = True
+                # pandoc已被终止，管道仍未结束时不再等待，由读取线程在结束后关闭
+                reader.join(CANCEL_DRAIN_TIMEOUT)
+                break
+        
+        usage = self._wait_process(process, start)
+        return (None if cancelled else process.returncode), capture, usage
+    
+    @staticmethod
+    def _wait_process(process, start):
+        """
+        等待pandoc子进程退出
+        
+        支持 os.wait4 的平台上由本方法回收子进程，同时取得其CPU时间和峰值内存。
+        
+        Args:
+            process: subprocess.Popen 对象
+            start: 启动子进程前 time.perf_counter() 的值
             
         Returns:
-            tuple: (success, message)
+            dict: 包含 wall_time、user_time、system_time、peak_rss 的字典，
+                  不支持 os.wait4 时只包含 wall_time
+        """
+        if hasattr(os, 'wait4'):
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return {
+                'wall_time': time.perf_counter() - start,
+                'user_time': rusage.ru_utime,
+                'system_time': rusage.ru_stime,
+                'peak_rss': peak_rss_bytes(rusage),
+            }
+        process.wait()
+        return {'wall_time': time.perf_counter() - start}
+    
+    def _signal_process(self, process):
+        """终止pandoc子进程（及其进程组），不等待其退出"""
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+    
+    def convert_stream(self, input_stream, output_stream, input_format, output_format,
+                       template_file=None, extra_args=None, chunk_size=STREAM_CHUNK_SIZE,
+                       profile=None):
+        """
+        流式转换
+        
+        从input_stream分块读取输入写入pandoc的标准输入，同时从标准输出分块读取转换结果
+        写入output_stream，全程使用二进制数据，不需要临时文件。
+        
+        Args:
+            input_stream: 可读的二进制文件对象
+            output_stream: 可写的二进制文件对象
+            input_format: 输入格式，如 'markdown'
+            output_format: 输出格式，如 'docx'
+            template_file: 模板文件路径或排版配置哈希（可选，仅对docx格式有效）
+            extra_args: 附加的pandoc命令行参数（可选）
+            chunk_size: 每次读写的块大小
+            profile: 性能配置名称（可选），默认使用构造时指定的配置
+            
+        Returns:
+            ConversionResult: 可以按 (success, message) 解包，输入输出大小为读写的字节数
+        """
+        start = time.perf_counter()
+        success, message, metrics = self._convert_stream(
+            input_stream, output_stream, input_format, output_format, template_file,
+            extra_args, chunk_size, profile
+        )
+        return self.record_result(success, message, start, output_format=output_format, **metrics)
+    
+    def _convert_stream(self, input_stream, output_stream, input_format, output_format,
+                        template_file, extra_args, chunk_size, profile):
+        """
+        执行流式转换
+        
+        Returns:
+            tuple: (success, message, metrics)，metrics 为传给 ConversionResult 的指标字典
         """
         if not self.pandoc_path:
-            return False, "未设置Pandoc路径"
+            return False, "未设置Pandoc路径", {}
             
         if not os.path.exists(self.pandoc_path):
-            return False, f"Pandoc可执行文件不存在: {self.pandoc_path}"
+            return False, f"Pandoc可执行文件不存在: {self.pandoc_path}", {}
+        
+        cmd = [self.pandoc_path, '-f', input_format, '-t', output_format, '-o', '-']
+        if extra_args:
+            cmd.extend(extra_args)
+        if template_file and output_format == 'docx':
+            reference_doc = self.resolve_reference_doc(template_file)
+            if reference_doc is None:
+                return False, f"模板配置不存在或已从缓存中移除: {template_file}", {}
+            cmd.extend(['--reference-doc', reference_doc])
+        
+        try:
+            cmd.extend(get_rts_args(self.pandoc_path, profile or self.profile, self.memory_limit))
+            start = time.perf_counter()
+            process = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except Exception as e:
+            return False, f"发生错误：\n{str(e)}", {'backend': 'subprocess'}
+        
+        capture = StderrCapture()
+        writer_errors = []
+        input_bytes = 0
+        output_bytes = 0
+        
+        def feed_stdin():
+            """将输入分块写入pandoc标准输入"""
+            nonlocal input_bytes
+            try:
+                for chunk in iter(lambda: input_stream.read(chunk_size), b''):
+                    process.stdin.write(chunk)
+                    input_bytes += len(chunk)
+            except BrokenPipeError:
+                # pandoc提前退出，错误信息由标准错误输出给出
+                pass
+            except Exception as e:
+                writer_errors.append(e)
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+        
+        def drain_stderr():
+            """逐行解析pandoc标准错误输出，避免管道写满导致阻塞"""
+            capture.consume(io.TextIOWrapper(process.stderr, encoding='utf-8', errors='replace'))
+        
+        writer = threading.Thread(target=feed_stdin, daemon=True)
+        reader = threading.Thread(target=drain_stderr, daemon=True)
+        writer.start()
+        reader.start()
+        
+        try:
+            for chunk in iter(lambda: process.stdout.read(chunk_size), b''):
+                output_stream.write(chunk)
+                output_bytes += len(chunk)
+        except Exception as e:
+            process.kill()
+            writer_errors.append(e)
+        finally:
+            process.stdout.close()
+            writer.join()
+            reader.join()
+            process.stderr.close()
+            usage = self._wait_process(process, start)
+        
+        metrics = dict(usage, backend='subprocess', returncode=process.returncode,
+                       warnings=capture.warnings, input_bytes=input_bytes)
+        
+        if writer_errors:
+            return False, f"发生错误：\n{str(writer_errors[0])}", metrics
+        
+        if process.returncode != 0:
+            return False, format_failure_message(process.returncode, capture.format_message()), metrics
+        
+        return True, f"转换成功：{output_format}", dict(metrics, output_bytes=output_bytes)
+    
+    def convert_bytes(self, data, input_format, output_format, template_file=None,
+                      extra_args=None, profile=None):
+        """
+        在内存中转换数据
+        
+        Args:
+            data: 输入数据（bytes，文本需先按UTF-8编码）
+            input_format: 输入格式，如 'markdown'
+            output_format: 输出格式，如 'docx'
+            template_file: 模板文件路径或排版配置哈希（可选，仅对docx格式有效）
+            extra_args: 附加的pandoc命令行参数（可选）
+            profile: 性能配置名称（可选）
+            
+        Returns:
+            tuple: (success, result)，成功时result为转换后的bytes，失败时为错误信息
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        output = io.BytesIO()
+        success, message = self.convert_stream(
+            io.BytesIO(data), output, input_format, output_format, template_file, extra_args,
+            profile=profile
+        )
+        if not success:
+            return False, message
+        return True, output.getvalue()
+    
+    def build_command(self, input_file, output_file, template_file=None,
+                      input_format=None, extra_args=None, profile=None, output_format=None):
+        """
+        检查路径并构建pandoc命令
+        
+        性能配置对应的 `+RTS ... -RTS` 参数附加在命令末尾。
+        
+        Returns:
+            tuple: (error, cmd, reference_doc)，检查失败时error为错误信息
+        """
+        if not self.pandoc_path:
+            return "未设置Pandoc路径", None, None
+            
+        if not os.path.exists(self.pandoc_path):
+            return f"Pandoc可执行文件不存在: {self.pandoc_path}", None, None
             
         if not os.path.exists(input_file):
-            return False, f"输入文件不存在: {input_file}"
+            return f"输入文件不存在: {input_file}", None, None
         
         # 构建pandoc命令
         cmd = [self.pandoc_path, input_file, '-o', output_file]
         
+        if input_format:
+            cmd.extend(['-f', input_format])
+        
+        if output_format:
+            cmd.extend(['-t', output_format])
+        
+        if extra_args:
+            cmd.extend(extra_args)
+        
         # 如果有模板文件，添加模板参数（仅对docx格式有效）
-        if template_file and output_file.lower().endswith('.docx'):
-            cmd.extend(['--reference-doc', template_file])
+        reference_doc = None
+        if template_file and (output_format == 'docx' or
+                              (not output_format and output_file.lower().endswith('.docx'))):
+            reference_doc = self.resolve_reference_doc(template_file)
+            if reference_doc is None:
+                return f"模板配置不存在或已从缓存中移除: {template_file}", None, None
+            cmd.extend(['--reference-doc', reference_doc])
         
         try:
-            # 执行pandoc命令
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True
+            cmd.extend(get_rts_args(self.pandoc_path, profile or self.profile, self.memory_limit))
+        except ValueError as e:
+            return str(e), None, None
+        
+        return None, cmd, reference_doc
+    
+    def resolve_reference_doc(self, template_file):
+        """
+        获取模板对应的参考文档路径
+        
+        Args:
+            template_file: 模板文件路径，或 "config:<哈希>" 及单独的配置哈希，
+                           配置哈希对应参考文档缓存中由 ConfigManager 生成的模板
+            
+        Returns:
+            str: 参考文档路径，配置哈希不在缓存中时返回None
+        """
+        if os.path.exists(template_file):
+            return template_file
+        
+        key = parse_config_hash(template_file)
+        if key is None:
+            # 不是配置哈希时原样交给pandoc，由pandoc报告文件不存在
+            return template_file
+        
+        cache = self.reference_docs or get_reference_doc_cache()
+        return cache.get_path(key)
+    
+    def _get_server_pool(self):
+        """获取服务进程池，首次使用时创建"""
+        if self.server_pool is None or self.server_pool.pandoc_path != self.pandoc_path:
+            if self.server_pool is not None:
+                self.server_pool.close()
+            kwargs = {}
+            if self.server_pool_size:
+                kwargs['size'] = self.server_pool_size
+            if self.server_max_jobs:
+                kwargs['max_jobs_per_worker'] = self.server_max_jobs
+            self.server_pool = PandocServerPool(self.pandoc_path, **kwargs)
+        return self.server_pool
+    
+    def _convert_with_server(self, input_file, output_file, input_format, reference_doc,
+                             output_format=None, cancel_event=None):
+        """
+        通过服务进程池转换文件
+        
+        只有服务进程无法启动或通信失败才计入失败次数；格式不支持、引用了本地资源等
+        单个任务无法使用服务模式的情况直接回退，不影响之后的任务。
+        
+        Returns:
+            tuple: (success, message)，无法使用服务模式时返回None，由调用方回退到子进程方式
+        """
+        if self._server_unavailable:
+            return None
+        
+        if PandocServerPool.resolve_formats(input_file, output_file, input_format,
+                                            output_format) is None:
+            return None
+        
+        pool = self._get_server_pool()
+        try:
+            result = pool.convert(input_file, output_file, input_format, reference_doc,
+                                  output_format, cancel_event)
+        except PandocServerUnsupported:
+            return None
+        except PandocServerError:
+            # 服务进程无法启动或连续通信失败时不再重试，之后的任务直接使用子进程方式
+            self._server_failures += 1
+            if not pool.is_running() or self._server_failures >= SERVER_MAX_FAILURES:
+                self._server_unavailable = True
+                pool.close()
+            return None
+        except OSError:
+            return None
+        
+        self._server_failures = 0
+        if result is None:
+            return False, CANCELLED_MESSAGE
+        return result
+    
+    def close(self):
+        """释放转换器占用的服务进程"""
+        if self.server_pool is not None:
+            self.server_pool.close()
+            self.server_pool = None
+    
+    def get_cache_key(self, cmd, input_file, output_file, reference_doc):
+        """
+        计算转换缓存键
+        
+        输入和输出路径本身不参与计算，只保留决定读写格式的扩展名；
+        运行时性能参数不影响转换结果，同样不参与计算。
+        选项中引用的文件（如CSS、参考文献、过滤器）按内容参与计算。
+        文档引用的图片等资源由pandoc在转换时读取，无法预先计算，
+        嵌入了这些资源的转换结果不会存入缓存，见 embeds_local_files。
+        
+        Returns:
+            str: 缓存键，未启用缓存、使用了无法缓存的选项或计算失败时返回None
+        """
+        if self.cache is None:
+            return None
+        
+        options = [
+            'input-ext=' + os.path.splitext(input_file)[1].lower(),
+            'output-ext=' + os.path.splitext(output_file)[1].lower(),
+        ]
+        option_files = []
+        for arg in strip_rts_args(cmd[1:]):
+            if arg.split('=', 1)[0] in UNCACHEABLE_OPTIONS:
+                return None
+            if arg == input_file:
+                options.append('<input>')
+            elif arg == output_file:
+                options.append('<output>')
+            elif arg == reference_doc:
+                options.append('<reference-doc>')
+            else:
+                options.append(arg)
+                value = arg.split('=', 1)[1] if arg.startswith('--') and '=' in arg else arg
+                if os.path.isfile(value):
+                    option_files.append(value)
+        
+        try:
+            return self.cache.make_key(
+                input_file, options, reference_doc, get_pandoc_version(self.pandoc_path),
+                option_files
             )
+        except OSError:
+            return None
+    
+    @staticmethod
+    def with_resource_log(cmd):
+        """
+        附加 --verbose 参数，使pandoc报告读取并嵌入到输出中的本地文件
+        
+        需要缓存转换结果时使用。
+        """
+        if '--verbose' in cmd:
+            return cmd
+        return cmd + ['--verbose']
+    
+    @staticmethod
+    def embeds_local_files(capture):
+        """
+        根据pandoc日志判断转换结果是否依赖文档引用的本地文件
+        
+        读取并嵌入了图片等文件，或有文件无法读取时，文件变化后结果也会变化，不能缓存。
+        
+        Args:
+            capture: 以 --verbose 运行的pandoc的 StderrCapture
+        """
+        if capture.loaded_resources:
+            return True
+        return any(warning.type == 'CouldNotFetchResource' for warning in capture.warnings)
+    
+    def convert_many(self, jobs, max_workers=None, profile=None, cancel_event=None,
+                     on_start=None, warning_summary=None):
+        """
+        并行批量转换文件
+        
+        每个任务在独立的pandoc子进程中执行，同时运行的子进程数不超过max_workers。
+        单个任务失败不会中断整个批次，结果按完成顺序逐个产出。
+        
+        Args:
+            jobs: 可迭代的转换任务，每个任务为 (input_file, output_file) 或
+                  (input_file, output_file, template_file) 元组，
+                  也可以是传给 convert_file 的关键字参数字典
+            max_workers: 最大并发子进程数，默认为CPU核心数
+            profile: 性能配置名称（可选），应用于未单独指定配置的任务
+            cancel_event: threading.Event（可选），被设置时终止正在运行的任务，
+                          并且不再开始新任务（未开始的任务不会产出结果）；
+                          调用方提前停止迭代时也会设置该事件
+            on_start: 任务开始执行时调用的函数（可选），参数为job，在工作线程中调用
+            warning_summary: core.pandoc_log.WarningSummary（可选），
+                             汇总批次中所有任务的pandoc警告
             
-            return True, f"转换成功：{os.path.basename(output_file)}"
+        Yields:
+            tuple: (job, success, message)
+        """
+        max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+        job_iter = iter(jobs)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        
+        def run_job(job):
+            """在工作线程中执行单个任务"""
+            if on_start is not None:
+                on_start(job)
+            if isinstance(job, dict):
+                kwargs = dict(job)
+                kwargs.setdefault('profile', profile)
+                kwargs.setdefault('cancel_event', cancel_event)
+                result = self.convert_file(**kwargs)
+            else:
+                result = self.convert_file(*job, profile=profile, cancel_event=cancel_event)
+            if warning_summary is not None:
+                warning_summary.record(result)
+            return result
+        
+        def submit_next():
+            """提交下一个任务，没有剩余任务时返回False"""
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            try:
+                job = next(job_iter)
+            except StopIteration:
+                return False
+            pending[executor.submit(run_job, job)] = job
+            return True
+        
+        finished = False
+        try:
+            # 只保持有限数量的任务在队列中，避免为海量任务一次性创建Future
+            for _ in range(max_workers * 2):
+                if not submit_next():
+                    break
             
-        except subprocess.CalledProcessError as e:
-            return False, f"转换失败：\n{e.stderr if e.stderr else str(e)}"
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    try:
+                        success, message = future.result()
+                    except Exception as e:
+                        success, message = False, f"发生错误：\n{str(e)}"
+                    submit_next()
+                    yield job, success, message
+            finished = True
+        finally:
+            # 调用方提前停止迭代（包括等待时按下Ctrl-C）时，先终止正在运行的任务，
+            # 否则要等这些pandoc进程自行结束；尚未开始的任务直接取消
+            if not finished and cancel_event is not None:
+                cancel_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def convert_to_formats(self, input_file, outputs, template_file=None, max_workers=None,
+                           profile=None, cancel_event=None):
+        """
+        一次解析，多格式输出
+        
+        先将输入文件解析为pandoc的JSON AST并保存到临时文件，
+        再以 `-f json` 从该AST并行写出所有目标格式，避免对同一输入重复解析。
+        docx、odt、epub输入中的图片在解析时提取到同一临时目录，临时目录在所有写出任务
+        结束后才删除；输出格式不能包含图片时（如html），图片保存到输出文件旁的
+        `<文件名>_media` 目录。
+        
+        Args:
+            input_file: 输入文件路径
+            outputs: 输出格式到输出文件路径的映射，如 {'docx': 'a.docx', 'html': 'a.html'}
+            template_file: 模板文件路径或排版配置哈希（可选，仅对docx输出有效）
+            max_workers: 写出阶段的最大并发子进程数
+            profile: 性能配置名称（可选）
+            cancel_event: threading.Event（可选），被设置时终止正在运行的pandoc子进程
             
-        except Exception as e:
-            return False, f"发生错误：\n{str(e)}"
\ No newline at end of file
+        Yields:
+            tuple: (output_format, output_file, success, message)，按完成顺序产出
+        """
+        if not outputs:
+            return
+        
+        ast_dir = tempfile.mkdtemp(prefix='pandoc-gui-ast-')
+        results = None
+        try:
+            ast_file = os.path.join(ast_dir, 'ast.json')
+            extract_media = os.path.splitext(input_file)[1].lower() in EMBEDDED_MEDIA_INPUT_EXTS
+            success, message = self.convert_file(
+                input_file, ast_file,
+                extra_args=['--extract-media', ast_dir] if extract_media else None,
+                profile=profile, cancel_event=cancel_event
+            )
+            if not success:
+                # 解析失败时，所有目标格式都视为失败
+                for output_format, output_file in outputs.items():
+                    yield output_format, output_file, False, message
+                return
+            
+            # AST位于临时目录，需要指定资源路径以便找到输入文件引用的图片和提取出的图片
+            resource_path = os.pathsep.join([os.path.dirname(os.path.abspath(input_file)), ast_dir])
+            formats_by_output = {}
+            jobs = []
+            for output_format, output_file in outputs.items():
+                formats_by_output[output_file] = output_format
+                extra_args = ['--resource-path', resource_path]
+                if extract_media and output_format not in EMBEDDED_MEDIA_OUTPUT_FORMATS:
+                    media_dir = os.path.splitext(os.path.abspath(output_file))[0] + '_media'
+                    extra_args.extend(['--extract-media', media_dir])
+                jobs.append({
+                    'input_file': ast_file,
+                    'output_file': output_file,
+                    'template_file': template_file,
+                    'input_format': 'json',
+                    'output_format': output_format,
+                    'extra_args': extra_args
+                })
+            
+            results = self.convert_many(jobs, max_workers, profile, cancel_event)
+            for job, success, message in results:
+                output_file = job['output_file']
+                yield formats_by_output[output_file], output_file, success, message
+        finally:
+            # 调用方提前停止迭代时，先等待正在运行的写出任务结束再删除临时目录
+            if results is not None:
+                results.close()
+            shutil.rmtree(ast_dir, ignore_errors=True)
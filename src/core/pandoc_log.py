@@ -0,0 +1,316 @@
+"""
+Pandoc日志模块
+逐行读取pandoc的标准错误输出，解析为按类型合并计数的警告，
+并只保留有限的其他输出，内存占用不随输入文件的大小增长
+"""
+
+import re
+import threading
+from collections import OrderedDict, deque
+
+
+# 单行最多保留的字符数，超出部分丢弃
+MAX_LINE_CHARS = 2000
+
+# 保留的非警告输出行数，开头和结尾各保留一半
+MAX_OUTPUT_LINES = 40
+
+# 最多记录的不同警告数，超出后只计数
+MAX_DISTINCT_WARNINGS = 100
+
+# 批次汇总中每种警告最多记录的文件数
+MAX_EXAMPLE_FILES = 3
+
+# 提示信息中最多列出的警告种类数
+MAX_LISTED_WARNINGS = 10
+
+# pandoc日志行的格式: "[WARNING] 内容"
+_LEVEL_PATTERN = re.compile(r'^\[(WARNING|INFO)\]\s*(.*)$')
+
+# --verbose 时pandoc读取本地文件并嵌入输出的日志: "[INFO] Loaded image.png from image.png"
+_LOADED_PATTERN = re.compile(r'^Loaded .+ from ')
+
+# 警告内容到类型的映射，类型名称与 pandoc --log 输出的 type 字段一致
+WARNING_TYPES = [
+    (re.compile(r'^Could not fetch resource'), 'CouldNotFetchResource'),
+    (re.compile(r'^Could not convert TeX math'), 'CouldNotConvertTeXMath'),
+    (re.compile(r'^Could not convert image'), 'CouldNotConvertImage'),
+    (re.compile(r'^Could not determine image size'), 'CouldNotDetermineImageSize'),
+    (re.compile(r'^Duplicate (note reference|link reference|identifier)'), 'DuplicateIdentifier'),
+    (re.compile(r'^Reference not found'), 'ReferenceNotFound'),
+    (re.compile(r'^Citeproc: citation .* not found'), 'CiteprocWarning'),
+    (re.compile(r'^Missing character'), 'MissingCharacter'),
+    (re.compile(r'^Skipped'), 'SkippedContent'),
+    (re.compile(r'^(Docx|Unusual|Ignoring|Unknown)'), 'IgnoredElement'),
+    (re.compile(r'^This document format requires a nonempty <title>'), 'NoTitleElement'),
+    (re.compile(r'^(The term|This document).* deprecated', re.IGNORECASE), 'Deprecated'),
+]
+
+
+def classify_warning(text):
+    """根据警告内容判断警告类型，无法识别时返回 'Other'"""
+    for pattern, warning_type in WARNING_TYPES:
+        if pattern.search(text):
+            return warning_type
+    return 'Other'
+
+
+class PandocWarning:
+    """一条pandoc警告
+
+    级别、类型和内容都相同的警告合并为一条，count 为出现次数。
+    """
+
+    __slots__ = ('level', 'type', 'text', 'detail', 'count')
+
+    def __init__(self, level, text, warning_type=None, detail=None, count=1):
+        """
+        Args:
+            level: 日志级别，'WARNING' 或 'INFO'
+            text: 警告内容（第一行）
+            warning_type: 警告类型（可选），默认根据内容判断
+            detail: 警告的后续行（可选）
+            count: 出现次数
+        """
+        self.level = level
+        self.text = text
+        self.type = warning_type or classify_warning(text)
+        self.detail = detail
+        self.count = count
+
+    @property
+    def key(self):
+        return (self.level, self.type, self.text)
+
+    def to_dict(self):
+        """转换为可序列化为JSON的字典"""
+        record = {'level': self.level, 'type': self.type, 'text': self.text, 'count': self.count}
+        if self.detail:
+            record['detail'] = self.detail
+        return record
+
+    def __eq__(self, other):
+        if isinstance(other, PandocWarning):
+            return self.key == other.key and self.count == other.count
+        return NotImplemented
+
+    def __str__(self):
+        return f'[{self.level}] {self.text}'
+
+    def __repr__(self):
+        return f'PandocWarning({self.level!r}, {self.text!r}, count={self.count})'
+
+
+def _format_warnings(warnings, dropped, limit, sources=None):
+    """把警告列表格式化为多行文本，次数多的在前"""
+    total = sum(warning.count for warning in warnings) + dropped
+    lines = [f"警告 {total} 条（{len(warnings) + (1 if dropped else 0)} 种）："]
+    ordered = sorted(warnings, key=lambda warning: -warning.count)
+    for warning in ordered[:limit]:
+        line = f"  {warning.count} × {warning}"
+        if sources is not None and sources.get(warning.key):
+            line += f"（{', '.join(sources[warning.key])}）"
+        lines.append(line)
+    hidden = len(ordered) - limit
+    if hidden > 0:
+        lines.append(f"  …… 另有 {hidden} 种警告")
+    if dropped:
+        lines.append(f"  …… 另有 {dropped} 条警告超出记录上限")
+    return '\n'.join(lines)
+
+
+class StderrCapture:
+    """逐行解析pandoc的标准错误输出
+
+    警告按内容合并计数，最多记录 MAX_DISTINCT_WARNINGS 种；
+    其他输出（如错误信息）只保留开头和结尾的若干行，中间的行只计数。
+    pandoc报告读取了本地文件（--verbose 时的 Loaded 日志）的次数记在 loaded_resources 中。
+    """
+
+    def __init__(self, max_lines=MAX_OUTPUT_LINES, max_distinct=MAX_DISTINCT_WARNINGS,
+                 keep_info=True):
+        """
+        Args:
+            max_lines: 保留的非警告输出行数
+            max_distinct: 最多记录的不同警告数
+            keep_info: 是否把INFO级别的日志记为警告，
+                       为了统计读取的本地文件而附加 --verbose 时应为False
+        """
+        self.max_distinct = max_distinct
+        self.keep_info = keep_info
+        self.loaded_resources = 0
+        self._skipping_info = False
+        self._warnings = OrderedDict()
+        self._head = []
+        self._head_size = max(1, max_lines // 2)
+        self._tail = deque(maxlen=max(1, max_lines - self._head_size))
+        self._last_warning = None
+        self.dropped_lines = 0
+        self.dropped_warnings = 0
+
+    def feed(self, line):
+        """处理一行输出"""
+        line = line.rstrip('\r\n')[:MAX_LINE_CHARS]
+        match = _LEVEL_PATTERN.match(line)
+        if match:
+            level, text = match.groups()
+            if level == 'INFO' and _LOADED_PATTERN.match(text):
+                self.loaded_resources += 1
+            self._skipping_info = level == 'INFO' and not self.keep_info
+            if self._skipping_info:
+                self._last_warning = None
+            else:
+                self._add_warning(level, text)
+            return
+
+        if line.startswith((' ', '\t')) and self._skipping_info:
+            return
+
+        if line.startswith((' ', '\t')) and self._last_warning is not None:
+            # 警告的后续行，只保留第一行作为说明
+            if self._last_warning.detail is None:
+                self._last_warning.detail = line.strip()
+            return
+
+        self._last_warning = None
+        self._skipping_info = False
+        if not line.strip():
+            return
+        if len(self._head) < self._head_size:
+            self._head.append(line)
+        else:
+            if len(self._tail) == self._tail.maxlen:
+                self.dropped_lines += 1
+            self._tail.append(line)
+
+    def _add_warning(self, level, text):
+        warning = PandocWarning(level, text)
+        existing = self._warnings.get(warning.key)
+        if existing is not None:
+            existing.count += 1
+            self._last_warning = existing
+        elif len(self._warnings) < self.max_distinct:
+            self._warnings[warning.key] = warning
+            self._last_warning = warning
+        else:
+            self.dropped_warnings += 1
+            self._last_warning = None
+
+    def consume(self, stream):
+        """从文本流中逐行读取直到结束，过长的行只保留开头部分"""
+        truncated = False
+        while True:
+            line = stream.readline(MAX_LINE_CHARS)
+            if not line:
+                break
+            if not truncated:
+                self.feed(line)
+            truncated = not line.endswith('\n')
+
+    @property
+    def warnings(self):
+        """合并后的警告列表"""
+        return list(self._warnings.values())
+
+    @property
+    def warning_count(self):
+        """警告总条数"""
+        return sum(warning.count for warning in self._warnings.values()) + self.dropped_warnings
+
+    def text(self):
+        """保留的非警告输出"""
+        lines = list(self._head)
+        if self.dropped_lines:
+            lines.append(f"…… 省略 {self.dropped_lines} 行 ……")
+        lines.extend(self._tail)
+        return '\n'.join(lines)
+
+    def format_message(self, limit=MAX_LISTED_WARNINGS):
+        """生成用于提示的文本：保留的输出和警告汇总"""
+        parts = []
+        output = self.text()
+        if output:
+            parts.append(output)
+        if self._warnings or self.dropped_warnings:
+            parts.append(_format_warnings(self.warnings, self.dropped_warnings, limit))
+        return '\n'.join(parts)
+
+
+class WarningSummary:
+    """批次级警告汇总
+
+    合并批次中所有任务的警告，记录每种警告的总次数和出现的文件，
+    内存占用只与警告种类的上限有关。可以作为 PandocConverter 的指标记录器使用。
+    """
+
+    def __init__(self, max_distinct=MAX_DISTINCT_WARNINGS):
+        """
+        Args:
+            max_distinct: 最多记录的不同警告数
+        """
+        self.max_distinct = max_distinct
+        self._warnings = OrderedDict()
+        self._sources = {}
+        self._lock = threading.Lock()
+        self.files_with_warnings = 0
+        self.dropped_warnings = 0
+
+    def add(self, warnings, source=None):
+        """加入一个任务的警告
+
+        Args:
+            warnings: PandocWarning 列表
+            source: 警告来自的文件（可选）
+        """
+        if not warnings:
+            return
+        with self._lock:
+            self.files_with_warnings += 1
+            for warning in warnings:
+                existing = self._warnings.get(warning.key)
+                if existing is None:
+                    if len(self._warnings) >= self.max_distinct:
+                        self.dropped_warnings += warning.count
+                        continue
+                    existing = PandocWarning(warning.level, warning.text, warning.type,
+                                             warning.detail, count=0)
+                    self._warnings[warning.key] = existing
+                    self._sources[warning.key] = []
+                existing.count += warning.count
+                sources = self._sources[warning.key]
+                if source and len(sources) < MAX_EXAMPLE_FILES and source not in sources:
+                    sources.append(source)
+
+    def record(self, result):
+        """加入一个转换结果的警告，与指标记录器的接口相同"""
+        self.add(result.warnings, result.input_file)
+
+    @property
+    def warnings(self):
+        """合并后的警告列表，次数多的在前"""
+        with self._lock:
+            return sorted(self._warnings.values(), key=lambda warning: -warning.count)
+
+    @property
+    def total(self):
+        """警告总条数"""
+        with self._lock:
+            return sum(warning.count for warning in self._warnings.values()) + self.dropped_warnings
+
+    def to_list(self):
+        """转换为可序列化为JSON的列表，每种警告附带出现的文件"""
+        with self._lock:
+            return [
+                dict(warning.to_dict(), files=list(self._sources[key]))
+                for key, warning in sorted(self._warnings.items(), key=lambda item: -item[1].count)
+            ]
+
+    def format(self, limit=MAX_LISTED_WARNINGS):
+        """格式化为多行文本，没有警告时返回空字符串"""
+        with self._lock:
+            if not self._warnings and not self.dropped_warnings:
+                return ''
+            sources = {key: [name.replace('\\', '/').rsplit('/', 1)[-1] for name in names]
+                       for key, names in self._sources.items()}
+            return _format_warnings(list(self._warnings.values()), self.dropped_warnings,
+                                    limit, sources)
@@ -0,0 +1,433 @@
+"""
+Pandoc服务模式模块
+维护常驻的 `pandoc server` 进程池，通过本地HTTP接口提交转换请求，
+避免每次转换都启动新的pandoc进程
+"""
+
+import os
+import json
+import time
+import queue
+import base64
+import socket
+import atexit
+import threading
+import subprocess
+import http.client
+
+
+# 服务进程默认数量
+DEFAULT_POOL_SIZE = 2
+
+# 每个服务进程处理多少个任务后重启，限制长期运行的内存占用
+DEFAULT_MAX_JOBS_PER_WORKER = 500
+
+# 等待服务进程就绪的超时时间 (秒)
+STARTUP_TIMEOUT = 5.0
+
+# 单个转换请求的超时时间 (秒)，同时作为服务进程的 --timeout 参数
+REQUEST_TIMEOUT = 120.0
+
+# 检查取消请求的时间间隔 (秒)
+CANCEL_POLL_INTERVAL = 0.1
+
+# 服务进程转换超时时返回的HTTP状态码
+TIMEOUT_STATUS = 503
+
+# 扩展名到pandoc读取格式的映射
+INPUT_FORMATS_BY_EXT = {
+    '.md': 'markdown', '.markdown': 'markdown', '.txt': 'markdown',
+    '.html': 'html', '.htm': 'html', '.tex': 'latex', '.latex': 'latex',
+    '.rst': 'rst', '.org': 'org', '.json': 'json', '.textile': 'textile',
+    '.docx': 'docx', '.odt': 'odt', '.epub': 'epub', '.ipynb': 'ipynb',
+    '.dbk': 'docbook', '.rtf': 'rtf', '.typ': 'typst',
+}
+
+# 扩展名到pandoc写出格式的映射，不在此表中的格式（如pdf）由子进程方式处理
+OUTPUT_FORMATS_BY_EXT = {
+    '.md': 'markdown', '.markdown': 'markdown', '.txt': 'markdown',
+    '.html': 'html', '.htm': 'html', '.tex': 'latex', '.latex': 'latex',
+    '.rst': 'rst', '.org': 'org', '.json': 'json', '.textile': 'textile',
+    '.docx': 'docx', '.odt': 'odt', '.epub': 'epub', '.pptx': 'pptx',
+    '.ipynb': 'ipynb', '.rtf': 'rtf', '.typ': 'typst',
+}
+
+# 服务模式无法生成的格式
+SUBPROCESS_ONLY_FORMATS = {'pdf', 'chunkedhtml'}
+
+# 需要以base64传输的二进制格式
+BINARY_FORMATS = {'docx', 'odt', 'epub', 'pptx', 'xlsx'}
+
+
+# 放入空闲队列的进程池关闭标记，唤醒正在等待服务进程的请求
+_POOL_CLOSED = object()
+
+# 已启动且尚未关闭的进程池，退出时统一停止其中的服务进程；关闭的进程池会被移除，
+# 转换器重建的进程池不会一直被引用
+_running_pools = set()
+_running_pools_lock = threading.Lock()
+
+
+def _close_running_pools():
+    """停止所有仍在运行的进程池，在解释器退出时调用"""
+    with _running_pools_lock:
+        pools = list(_running_pools)
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(_close_running_pools)
+
+
+class PandocServerError(Exception):
+    """服务进程不可用或通信失败"""
+
+
+class PandocServerUnsupported(Exception):
+    """任务不能通过服务模式转换，需要改用子进程方式
+
+    如格式不支持、输入不是UTF-8文本、文档引用了本地资源或转换超时，
+    与服务进程本身是否正常无关。
+    """
+
+
+def _find_free_port():
+    """获取一个空闲的本地端口"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class _ServerWorker:
+    """单个 `pandoc server` 进程"""
+
+    def __init__(self, pandoc_path):
+        self.pandoc_path = pandoc_path
+        self.port = None
+        self.process = None
+        self.jobs = 0
+
+    def start(self):
+        """启动服务进程并等待其就绪"""
+        self.port = _find_free_port()
+        creationflags = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        self.process = subprocess.Popen(
+            [self.pandoc_path, 'server', '--port', str(self.port),
+             '--timeout', str(int(REQUEST_TIMEOUT))],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            creationflags=creationflags
+        )
+        self.jobs = 0
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                status, _ = self._request('GET', '/version', timeout=1.0)
+                if status == 200:
+                    return
+            except (OSError, http.client.HTTPException):
+                time.sleep(0.05)
+
+        self.stop()
+        raise PandocServerError('pandoc server 启动失败')
+
+    def stop(self):
+        """停止服务进程"""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+    def _request(self, method, path, body=None, timeout=REQUEST_TIMEOUT):
+        """发送HTTP请求
+
+        Returns:
+            tuple: (HTTP状态码, 响应内容)
+        """
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=timeout)
+        try:
+            headers = {'Accept': 'application/json'}
+            if body is not None:
+                headers['Content-Type'] = 'application/json'
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.read()
+        finally:
+            connection.close()
+
+    def convert(self, payload, cancel_event=None):
+        """提交转换请求
+
+        Args:
+            payload: 转换参数字典
+            cancel_event: threading.Event（可选），被设置时停止服务进程并放弃请求
+
+        Returns:
+            tuple: (HTTP状态码, 响应内容)，被取消时返回None
+        """
+        self.jobs += 1
+        body = json.dumps(payload).encode('utf-8')
+        if cancel_event is None:
+            return self._send(body)
+
+        # 在线程中等待响应，取消时停止服务进程，使等待中的请求立即失败
+        outcome = []
+
+        def send():
+            """发送请求，结果或异常记入outcome"""
+            try:
+                outcome.append(self._send(body))
+            except PandocServerError as e:
+                outcome.append(e)
+
+        sender = threading.Thread(target=send, daemon=True)
+        sender.start()
+        while sender.is_alive():
+            sender.join(CANCEL_POLL_INTERVAL)
+            if cancel_event.is_set() and sender.is_alive():
+                self.stop()
+                sender.join(STARTUP_TIMEOUT)
+                return None
+        if isinstance(outcome[0], PandocServerError):
+            raise outcome[0]
+        return outcome[0]
+
+    def _send(self, body):
+        """发送转换请求，通信失败时抛出PandocServerError"""
+        try:
+            return self._request('POST', '/', body)
+        except (OSError, http.client.HTTPException) as e:
+            raise PandocServerError(f'与 pandoc server 通信失败：{e}') from e
+
+
+class PandocServerPool:
+    """`pandoc server` 进程池
+
+    每个请求独占一个服务进程；进程处理max_jobs_per_worker个任务后会被重启，
+    通信失败的进程也会被重启。关闭进程池时，正在等待服务进程的请求立即失败，
+    正在处理请求的服务进程在请求结束后不再放回空闲队列。
+    """
+
+    def __init__(self, pandoc_path, size=DEFAULT_POOL_SIZE,
+                 max_jobs_per_worker=DEFAULT_MAX_JOBS_PER_WORKER):
+        self.pandoc_path = pandoc_path
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        """启动所有服务进程
+
+        Raises:
+            PandocServerError: 服务进程无法启动（如pandoc版本不支持服务模式）
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._clear_idle()
+            try:
+                for _ in range(self.size):
+                    worker = _ServerWorker(self.pandoc_path)
+                    worker.start()
+                    self._workers.append(worker)
+                    self._idle.put(worker)
+            except PandocServerError:
+                self._stop_workers()
+                raise
+            self._started = True
+        with _running_pools_lock:
+            _running_pools.add(self)
+
+    def is_running(self):
+        """是否有可用的服务进程"""
+        with self._lock:
+            return self._started and bool(self._workers)
+
+    def close(self):
+        """停止所有服务进程"""
+        with self._lock:
+            self._stop_workers()
+            self._started = False
+        with _running_pools_lock:
+            _running_pools.discard(self)
+
+    def _stop_workers(self):
+        """停止并清空所有服务进程，唤醒正在等待服务进程的请求"""
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+        self._clear_idle()
+        self._idle.put(_POOL_CLOSED)
+
+    def _clear_idle(self):
+        """清空空闲队列，等待中的请求仍在同一个队列上等待"""
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+    def _acquire(self):
+        """取出一个空闲的服务进程
+
+        Raises:
+            PandocServerError: 等待超时，或进程池在等待期间被关闭
+        """
+        deadline = time.monotonic() + REQUEST_TIMEOUT
+        while True:
+            try:
+                worker = self._idle.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise PandocServerError('没有可用的 pandoc server 进程')
+            if worker is not _POOL_CLOSED:
+                return worker
+            with self._lock:
+                if not self._started:
+                    # 放回关闭标记，让其他等待的请求同样失败
+                    self._idle.put(_POOL_CLOSED)
+                    raise PandocServerError('pandoc server 进程池已关闭')
+            # 进程池已被重新启动，继续等待新的服务进程
+
+    def _release(self, worker):
+        """把服务进程放回空闲队列，进程池已关闭或已移除该进程时停止它"""
+        with self._lock:
+            if worker in self._workers:
+                self._idle.put(worker)
+                return
+        worker.stop()
+
+    @staticmethod
+    def resolve_formats(input_file, output_file, input_format=None, output_format=None):
+        """判断任务的读写格式能否通过服务模式处理
+
+        Returns:
+            tuple: (读取格式, 写出格式)，服务模式不支持时返回None
+        """
+        from_format = input_format or INPUT_FORMATS_BY_EXT.get(os.path.splitext(input_file)[1].lower())
+        to_format = output_format or OUTPUT_FORMATS_BY_EXT.get(os.path.splitext(output_file)[1].lower())
+        if not from_format or not to_format or to_format in SUBPROCESS_ONLY_FORMATS:
+            return None
+        return from_format, to_format
+
+    def convert(self, input_file, output_file, input_format=None, reference_doc=None,
+                output_format=None, cancel_event=None):
+        """通过服务进程转换文件
+
+        Args:
+            input_file: 输入文件路径
+            output_file: 输出文件路径
+            input_format: 输入格式（可选），默认根据扩展名判断
+            reference_doc: 参考文档路径（可选）
+            output_format: 输出格式（可选），默认根据扩展名判断
+            cancel_event: threading.Event（可选），被设置时放弃请求并重启处理该请求的服务进程
+
+        Returns:
+            tuple: (success, message)，被取消时返回None
+
+        Raises:
+            PandocServerUnsupported: 任务不能通过服务模式转换，如格式不支持、
+                                     输入不是UTF-8文本、文档引用了本地资源或转换超时
+            PandocServerError: 服务进程无法启动或通信失败
+        """
+        formats = self.resolve_formats(input_file, output_file, input_format, output_format)
+        if formats is None:
+            raise PandocServerUnsupported('服务模式不支持该格式')
+        from_format, to_format = formats
+
+        with open(input_file, 'rb') as f:
+            data = f.read()
+
+        if from_format in BINARY_FORMATS:
+            text = base64.b64encode(data).decode('ascii')
+        else:
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError as e:
+                raise PandocServerUnsupported('服务模式只支持UTF-8编码的文本输入') from e
+
+        payload = {'from': from_format, 'to': to_format, 'text': text}
+        if reference_doc:
+            with open(reference_doc, 'rb') as f:
+                payload['files'] = {'reference.docx': base64.b64encode(f.read()).decode('ascii')}
+            payload['reference-doc'] = 'reference.docx'
+
+        self.start()
+        worker = self._acquire()
+        try:
+            response = worker.convert(payload, cancel_event)
+        except PandocServerError:
+            self._recycle(worker)
+            raise
+        if response is None:
+            # 被取消的请求已停止服务进程，需要重启
+            self._recycle(worker)
+            return None
+        if worker.jobs >= self.max_jobs_per_worker:
+            self._recycle(worker)
+        else:
+            self._release(worker)
+
+        status, body = response
+        if status == TIMEOUT_STATUS:
+            raise PandocServerUnsupported('pandoc server 转换超时')
+        return self._handle_response(status, body, output_file)
+
+    def _recycle(self, worker):
+        """重启服务进程后放回空闲队列"""
+        worker.stop()
+        with self._lock:
+            if worker not in self._workers:
+                # 进程池已关闭
+                return
+        try:
+            worker.start()
+        except PandocServerError:
+            # 无法重启时从进程池中移除，进程池为空后所有请求都会失败并回退
+            with self._lock:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+                if not self._workers and self._started:
+                    self._started = False
+                    self._idle.put(_POOL_CLOSED)
+            return
+        self._release(worker)
+
+    def _handle_response(self, status, body, output_file):
+        """解析服务响应并写出输出文件"""
+        try:
+            result = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            result = None
+
+        if status != 200 or not isinstance(result, dict):
+            message = body.decode('utf-8', errors='replace') if body else f'HTTP {status}'
+            if isinstance(result, dict) and result.get('error'):
+                message = result['error']
+            return False, f"转换失败：\n{message}"
+
+        if result.get('error'):
+            return False, f"转换失败：\n{result['error']}"
+
+        # 服务模式无法读取本地文件，引用了外部资源的文档需要改用子进程转换
+        for message in result.get('messages', []):
+            if isinstance(message, dict) and message.get('type') == 'CouldNotFetchResource':
+                raise PandocServerUnsupported('文档引用了服务模式无法读取的外部资源')
+
+        output = result.get('output', '')
+        if result.get('base64'):
+            data = base64.b64decode(output)
+        else:
+            data = output.encode('utf-8')
+
+        with open(output_file, 'wb') as f:
+            f.write(data)
+
+        return True, f"转换成功：{os.path.basename(output_file)}"
@@ -0,0 +1,213 @@
+"""
+参考文档缓存模块
+按排版配置的哈希缓存生成的docx模板，配置不变时无需重新生成
+"""
+
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from core.app_dirs import get_cache_dir
+from core.conversion_cache import ConversionCache
+
+
+# 模板生成逻辑的版本，修改生成方式导致输出变化时需要递增
+TEMPLATE_VERSION = 1
+
+# 磁盘缓存默认容量上限 (字节)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 内存中最多保留的模板数
+DEFAULT_MEMORY_ENTRIES = 16
+
+# 作为 --reference-doc 传入配置哈希时可用的前缀，如 "config:<哈希>"
+CONFIG_HASH_PREFIX = 'config:'
+
+_CONFIG_HASH_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+# 默认的全局缓存实例
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def config_hash(config, **options):
+    """计算排版配置的规范哈希
+
+    配置字典按键排序后序列化，键的顺序和数值的书写方式不影响结果。
+
+    Args:
+        config: collect_config 返回的配置字典
+        **options: 其他影响生成结果的选项
+
+    Returns:
+        str: 十六进制的SHA-256哈希
+    """
+    canonical = json.dumps(
+        {'version': TEMPLATE_VERSION, 'config': config, 'options': options},
+        sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def parse_config_hash(value):
+    """判断参数是否为配置哈希
+
+    Args:
+        value: "config:<哈希>" 形式的字符串或64位十六进制哈希
+
+    Returns:
+        str: 配置哈希，不是配置哈希时返回None
+    """
+    if not isinstance(value, str):
+        return None
+    if value.startswith(CONFIG_HASH_PREFIX):
+        value = value[len(CONFIG_HASH_PREFIX):]
+    return value if _CONFIG_HASH_PATTERN.match(value) else None
+
+
+class ReferenceDocCache(ConversionCache):
+    """参考文档缓存
+
+    在转换缓存的磁盘LRU之上增加一层内存缓存，条目为完整的docx文件内容，
+    可以直接作为pandoc的 --reference-doc 使用。
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES,
+                 memory_entries=DEFAULT_MEMORY_ENTRIES):
+        """
+        Args:
+            cache_dir: 缓存目录，默认使用应用缓存目录下的 reference-docs 子目录
+            max_bytes: 磁盘缓存容量上限 (字节)
+            memory_entries: 内存中最多保留的模板数
+        """
+        super().__init__(cache_dir or get_cache_dir('reference-docs'), max_bytes)
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+
+    def get(self, key):
+        """获取缓存的模板内容
+
+        Args:
+            key: 配置哈希
+
+        Returns:
+            bytes: docx文件内容，未命中时返回None
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+            os.utime(entry_path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """保存模板内容到内存和磁盘缓存
+
+        Args:
+            key: 配置哈希
+            data: docx文件内容
+        """
+        self._remember(key, data)
+
+        entry_path = self._entry_path(key)
+        entry_dir = os.path.dirname(entry_path)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            with self._lock:
+                replaced = os.path.getsize(entry_path) if os.path.exists(entry_path) else 0
+                os.replace(temp_path, entry_path)
+                if self._total_bytes is not None:
+                    self._total_bytes += len(data) - replaced
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        self._evict()
+
+    def get_or_create(self, key, build):
+        """获取缓存的模板，未命中时生成并写入缓存
+
+        Args:
+            key: 配置哈希
+            build: 生成模板的函数，无参数，返回docx文件内容
+
+        Returns:
+            bytes: docx文件内容
+        """
+        data = self.get(key)
+        if data is None:
+            data = build()
+            self.put(key, data)
+        return data
+
+    def get_path(self, key):
+        """获取缓存条目在磁盘上的路径，可作为 --reference-doc 传给pandoc
+
+        内存中有而磁盘上已被淘汰的条目会重新写回磁盘。
+
+        Args:
+            key: 配置哈希
+
+        Returns:
+            str: 文件路径，未缓存时返回None
+        """
+        entry_path = self._entry_path(key)
+        if os.path.exists(entry_path):
+            try:
+                os.utime(entry_path)
+            except OSError:
+                pass
+            return entry_path
+
+        with self._lock:
+            data = self._memory.get(key)
+        if data is None:
+            return None
+        self.put(key, data)
+        return entry_path if os.path.exists(entry_path) else None
+
+    def _remember(self, key, data):
+        """加入内存缓存，超出数量时淘汰最久未使用的条目"""
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def clear(self):
+        """清空内存和磁盘缓存"""
+        with self._lock:
+            self._memory.clear()
+        super().clear()
+
+
+def get_reference_doc_cache():
+    """获取默认的参考文档缓存实例"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ReferenceDocCache()
+        return _default_cache
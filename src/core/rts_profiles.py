@@ -0,0 +1,140 @@
+"""
+Pandoc运行时性能配置模块
+pandoc是GHC编译的程序，可以通过 `+RTS ... -RTS` 参数调整其运行时的并行度和堆内存
+"""
+
+import os
+import re
+import threading
+import subprocess
+
+
+# 性能配置名称到RTS参数的映射
+RTS_PROFILES = {
+    # 使用pandoc自带的默认运行时参数
+    'default': [],
+    # 单个大文档：使用所有核心进行并行垃圾回收，并增大分配区减少GC次数
+    'large': ['-N', '-A64m', '-n4m'],
+    # 批量转换：每个子进程只使用一个核心和较小的堆，便于多个进程同时运行
+    'batch': ['-N1', '-A4m', '-H16m'],
+    # 内存受限：在批量配置的基础上限制最大堆内存
+    'capped': ['-N1', '-A4m', '-H16m', '-M2g'],
+}
+
+# 性能配置的显示名称
+RTS_PROFILE_LABELS = {
+    'default': '默认',
+    'large': '大文档（多核并行）',
+    'batch': '批量转换（单核小堆）',
+    'capped': '内存受限（最大2GB）',
+}
+
+# GHC运行时在堆内存耗尽时使用的退出码
+HEAP_EXHAUSTED_EXIT_CODE = 251
+
+# 多线程运行时检测结果缓存，键为 (路径, 大小, 修改时间)
+_threaded_rts = {}
+_threaded_rts_lock = threading.Lock()
+
+
+def is_threaded_rts(pandoc_path):
+    """检测pandoc是否使用多线程运行时编译
+
+    非多线程运行时不支持 -N 参数，传入会导致pandoc直接报错退出。
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+
+    Returns:
+        bool: 是否为多线程运行时，检测失败时返回False
+    """
+    try:
+        stat = os.stat(pandoc_path)
+    except OSError:
+        return False
+
+    signature = (os.path.abspath(pandoc_path), stat.st_size, stat.st_mtime_ns)
+    with _threaded_rts_lock:
+        if signature in _threaded_rts:
+            return _threaded_rts[signature]
+
+    try:
+        result = subprocess.run(
+            [pandoc_path, '+RTS', '--info', '-RTS'], capture_output=True, text=True
+        )
+        match = re.search(r'\("RTS way",\s*"([^"]*)"\)', result.stdout)
+        threaded = bool(match and '_thr' in match.group(1))
+    except OSError:
+        threaded = False
+
+    with _threaded_rts_lock:
+        _threaded_rts[signature] = threaded
+    return threaded
+
+
+def get_rts_args(pandoc_path, profile=None, memory_limit=None):
+    """获取性能配置对应的pandoc命令行参数
+
+    Args:
+        pandoc_path: pandoc可执行文件路径
+        profile: 性能配置名称，为None或'default'时不添加参数
+        memory_limit: 最大堆内存（可选），如 '512m'、'2g'，会覆盖配置中的 -M 参数
+
+    Returns:
+        list: `+RTS ... -RTS` 形式的参数列表，无需调整时返回空列表
+
+    Raises:
+        ValueError: 未知的性能配置名称
+    """
+    if profile and profile not in RTS_PROFILES:
+        raise ValueError(f"未知的性能配置：{profile}")
+
+    options = list(RTS_PROFILES.get(profile or 'default'))
+    if memory_limit:
+        options = [opt for opt in options if not opt.startswith('-M')]
+        options.append(f'-M{memory_limit}')
+
+    if not options:
+        return []
+
+    # 非多线程运行时不支持 -N，去掉后其余参数仍然有效
+    if any(opt.startswith('-N') for opt in options) and not is_threaded_rts(pandoc_path):
+        options = [opt for opt in options if not opt.startswith('-N')]
+
+    return ['+RTS'] + options + ['-RTS']
+
+
+def strip_rts_args(args):
+    """去除参数列表中的 `+RTS ... -RTS` 部分
+
+    运行时参数不影响转换结果，计算缓存键等场景需要忽略它们。
+
+    Args:
+        args: 命令行参数列表
+
+    Returns:
+        list: 去除运行时参数后的列表
+    """
+    stripped = []
+    in_rts = False
+    for arg in args:
+        if arg == '+RTS':
+            in_rts = True
+        elif arg == '-RTS' and in_rts:
+            in_rts = False
+        elif not in_rts:
+            stripped.append(arg)
+    return stripped
+
+
+def is_heap_exhausted(returncode, stderr):
+    """判断pandoc是否因超出最大堆内存而退出
+
+    Args:
+        returncode: 进程退出码
+        stderr: 标准错误输出
+
+    Returns:
+        bool: 是否为堆内存耗尽
+    """
+    return returncode == HEAP_EXHAUSTED_EXIT_CODE or 'Heap exhausted' in (stderr or '')
@@ -3,7 +3,112 @@
 处理预设模板的加载和应用
 """
 
-from PyQt5.QtGui import QFont
+
+# 预设模板的英文名称，供命令行使用
+PRESET_ALIASES = {
+    'academic': "学术论文模板",
+    'report': "报告模板",
+    'novel': "小说模板",
+    'resume': "简历模板",
+    'letter': "信函模板",
+    'default': "默认模板",
+}
+
+# 各预设模板相对默认配置的差异：
+# english_font 同时用于英文和数字字体；heading_sizes 依次为各级标题字号，
+# 最后一项用于其余级别；all_bold 为True时所有级别的标题都加粗，否则只加粗前三级；
+# table_size 为表格字号
+PRESET_SETTINGS = {
+    "学术论文模板": {'english_font': "Times New Roman", 'heading_sizes': (16, 14, 13, 12), 'all_bold': False},
+    "报告模板": {'english_font': "Arial", 'heading_sizes': (18, 16, 14), 'all_bold': True,
+                 'table_size': 11},
+    "小说模板": {'english_font': "Times New Roman", 'heading_sizes': (20, 16, 14), 'all_bold': True},
+    "简历模板": {'english_font': "Arial", 'heading_sizes': (18, 14), 'all_bold': True,
+                 'first_line_indent': 0.0, 'line_spacing': 1.15, 'paragraph_spacing': 3.0},
+    "信函模板": {'english_font': "Times New Roman", 'heading_sizes': (16, 14), 'all_bold': True},
+    "默认模板": {'english_font': "Times New Roman", 'heading_sizes': (16, 14, 13, 12), 'all_bold': False},
+}
+
+
+# 应用预设模板时加载的配置部分及对应的组件，页面设置通常不需要模板化
+PRESET_WIDGET_SECTIONS = {
+    'basic_text': 'basic_text',
+    'headings': 'heading',
+    'lists': 'list',
+    'references': 'reference',
+    'layout_elements': 'layout',
+}
+
+
+def _text_style(size, bold=False, italic=False, font="宋体"):
+    """生成字体、字号、粗体、斜体组成的样式字典"""
+    return {'font': font, 'size': size, 'bold': bold, 'italic': italic}
+
+
+def get_default_config():
+    """获取默认排版配置
+    
+    与排版配置对话框中各组件的默认值一致，结构同 ConfigManager.collect_config 的返回值，
+    不需要创建任何界面组件。
+    
+    Returns:
+        dict: 排版配置字典
+    """
+    headings = {}
+    for level in range(1, 10):
+        headings[f"标题{level}"] = dict(
+            _text_style({1: 16, 2: 14, 3: 13}.get(level, 12), bold=level <= 3),
+            underline=False, align="左对齐"
+        )
+    
+    return {
+        'basic_text': {
+            'paragraph': _text_style(12),
+            'body': _text_style(12),
+            'char': {
+                'chinese_font': "宋体",
+                'english_font': "Times New Roman",
+                'number_font': "Times New Roman",
+                'size': 12
+            },
+            'format': {
+                'first_line_indent': 2.0,
+                'line_spacing': 1.5,
+                'paragraph_spacing': 6.0,
+                'alignment': 0
+            }
+        },
+        'headings': headings,
+        'lists': {
+            'ordered': dict(_text_style(12), format="1, 2, 3..."),
+            'unordered': dict(_text_style(12), format="●")
+        },
+        'references': {
+            'link': dict(_text_style(12), underline=True, color='#0000FF'),
+            'footnote': dict(_text_style(9, italic=True), underline=False),
+            'footnote_ref': {'size': 9, 'superscript': True, 'bold': False, 'italic': False}
+        },
+        'layout_elements': {
+            'block_text': dict(_text_style(12), indent=2.0),
+            'horizontal_line': {'thickness': 1.0, 'width': 100, 'color': '#000000'},
+            'table_caption': dict(_text_style(12, bold=True), position="表格上方"),
+            'table': {'font': "宋体", 'size': 10, 'header_bold': True, 'border': True},
+            'figure_caption': dict(_text_style(10, italic=True), position="图片下方")
+        },
+        'page_settings': {
+            'size': 'A4',
+            'orientation': 0,
+            'margins': {'top': 2.54, 'bottom': 2.54, 'left': 3.17, 'right': 3.17},
+            'header_footer': {
+                'header_font': "宋体",
+                'header_size': 9,
+                'header_text': '',
+                'footer_font': "宋体",
+                'footer_size': 9,
+                'footer_text': ''
+            }
+        }
+    }
 
 
 class TemplateManager:
@@ -79,127 +184,58 @@ class TemplateManager:
         """获取模板预览文本"""
         return self.templates.get(template_name, "模板预览不可用")
     
-    def apply_template(self, template_name, widgets):
-        """应用指定模板到各个配置组件"""
-        if template_name == "学术论文模板":
-            self.apply_academic_template(widgets)
-        elif template_name == "报告模板":
-            self.apply_report_template(widgets)
-        elif template_name == "小说模板":
-            self.apply_novel_template(widgets)
-        elif template_name == "简历模板":
-            self.apply_resume_template(widgets)
-        elif template_name == "信函模板":
-            self.apply_letter_template(widgets)
-        elif template_name == "默认模板":
-            self.load_default_config(widgets)
-    
-    def apply_academic_template(self, widgets):
-        """应用学术论文模板"""
-        # 基础文本与段落样式
-        basic_text = widgets['basic_text']
-        basic_text.chinese_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.english_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.number_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.first_line_indent_spin.setValue(2.0)
-        basic_text.line_spacing_combo.setCurrentText("1.5")
-        basic_text.paragraph_spacing_spin.setValue(6)
-        basic_text.left_radio.setChecked(True)
+    def get_preset_config(self, template_name):
+        """获取预设模板对应的排版配置，不依赖界面组件
         
-        # 标题样式
-        widgets['heading'].apply_academic_template()
+        Args:
+            template_name: 模板名称，也可以是 PRESET_ALIASES 中的英文名称
+            
+        Returns:
+            dict: 排版配置字典，模板不存在时返回None
+        """
+        template_name = PRESET_ALIASES.get(template_name, template_name)
+        settings = PRESET_SETTINGS.get(template_name)
+        if settings is None:
+            return None
         
-        # 脚注样式
-        reference = widgets['reference']
-        reference.footnote_font_size_spin.setValue(9)
-        reference.footnote_italic_check.setChecked(True)
-        reference.footnote_ref_superscript_check.setChecked(True)
-    
-    def apply_report_template(self, widgets):
-        """应用报告模板"""
-        # 基础文本与段落样式
-        basic_text = widgets['basic_text']
-        basic_text.chinese_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.english_font_combo.setCurrentFont(QFont("Arial"))
-        basic_text.number_font_combo.setCurrentFont(QFont("Arial"))
-        basic_text.first_line_indent_spin.setValue(2.0)
-        basic_text.line_spacing_combo.setCurrentText("1.5")
-        basic_text.paragraph_spacing_spin.setValue(6)
-        basic_text.left_radio.setChecked(True)
+        config = get_default_config()
+        basic_text = config['basic_text']
+        basic_text['char']['english_font'] = settings['english_font']
+        basic_text['char']['number_font'] = settings['english_font']
+        for key in ('first_line_indent', 'line_spacing', 'paragraph_spacing'):
+            if key in settings:
+                basic_text['format'][key] = settings[key]
         
-        # 标题样式
-        widgets['heading'].apply_report_template()
+        sizes = settings['heading_sizes']
+        for level in range(1, 10):
+            heading = config['headings'][f"标题{level}"]
+            heading['size'] = sizes[min(level, len(sizes)) - 1]
+            heading['bold'] = settings['all_bold'] or level <= 3
         
-        # 表格样式
-        widgets['layout'].apply_report_template()
-    
-    def apply_novel_template(self, widgets):
-        """应用小说模板"""
-        # 基础文本与段落样式
-        basic_text = widgets['basic_text']
-        basic_text.chinese_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.english_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.number_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.first_line_indent_spin.setValue(2.0)
-        basic_text.line_spacing_combo.setCurrentText("1.5")
-        basic_text.paragraph_spacing_spin.setValue(6)
-        basic_text.left_radio.setChecked(True)
+        if 'table_size' in settings:
+            config['layout_elements']['table']['size'] = settings['table_size']
         
-        # 标题样式
-        widgets['heading'].apply_novel_template()
+        return config
     
-    def apply_resume_template(self, widgets):
-        """应用简历模板"""
-        # 基础文本与段落样式
-        basic_text = widgets['basic_text']
-        basic_text.chinese_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.english_font_combo.setCurrentFont(QFont("Arial"))
-        basic_text.number_font_combo.setCurrentFont(QFont("Arial"))
-        basic_text.first_line_indent_spin.setValue(0)  # 简历通常不首行缩进
-        basic_text.line_spacing_combo.setCurrentText("1.15")
-        basic_text.paragraph_spacing_spin.setValue(3)
-        basic_text.left_radio.setChecked(True)  # 左对齐
+    def apply_template(self, template_name, widgets):
+        """应用指定模板到各个配置组件
         
-        # 标题样式
-        widgets['heading'].apply_resume_template()
-    
-    def apply_letter_template(self, widgets):
-        """应用信函模板"""
-        # 基础文本与段落样式
-        basic_text = widgets['basic_text']
-        basic_text.chinese_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.english_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.number_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.first_line_indent_spin.setValue(2.0)
-        basic_text.line_spacing_combo.setCurrentText("1.5")
-        basic_text.paragraph_spacing_spin.setValue(6)
-        basic_text.left_radio.setChecked(True)  # 左对齐
+        加载 get_preset_config 生成的配置，与命令行使用同一预设模板得到的配置一致；
+        页面设置不随模板变化。
         
-        # 标题样式
-        widgets['heading'].apply_letter_template()
+        Args:
+            template_name: 模板名称，也可以是 PRESET_ALIASES 中的英文名称
+            widgets: 排版配置对话框中的组件字典
+        """
+        config = self.get_preset_config(template_name)
+        if config is not None:
+            self.load_config_to_widgets(config, widgets)
     
     def load_default_config(self, widgets):
-        """加载默认配置"""
-        # 基础文本与段落样式默认值
-        basic_text = widgets['basic_text']
-        basic_text.chinese_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.english_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.number_font_combo.setCurrentFont(QFont("Times New Roman"))
-        basic_text.paragraph_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.body_font_combo.setCurrentFont(QFont("宋体"))
-        basic_text.left_radio.setChecked(True)
-        
-        # 标题样式默认值
-        widgets['heading'].load_default_config()
-        
-        # 列表样式默认值
-        widgets['list'].load_default_config()
-        
-        # 引用与交互元素样式默认值
-        widgets['reference'].load_default_config()
-        
-        # 非文本与布局样式块默认值
-        widgets['layout'].load_default_config()
-        
-        # 页面设置默认值使用组件的默认值
-        # (因为页面设置通常不需要模板化)
\ No newline at end of file
+        """加载默认配置，页面设置保持组件的当前值"""
+        self.load_config_to_widgets(get_default_config(), widgets)
+    
+    def load_config_to_widgets(self, config, widgets):
+        """把排版配置中随模板变化的部分加载到各个组件"""
+        for section, widget_name in PRESET_WIDGET_SECTIONS.items():
+            widgets[widget_name].load_config(config[section])
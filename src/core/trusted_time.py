@@ -0,0 +1,159 @@
+"""
+可信时间缓存模块
+保存最近一次通过网络验证的时间及验证时的本地时钟锚点，
+在有效期内根据本地时钟推算当前时间，避免每次启动都查询网络时间
+"""
+
+import os
+import json
+import hmac
+import time
+import hashlib
+import tempfile
+from datetime import datetime, timezone
+
+from core.app_dirs import get_cache_dir
+
+
+# 缓存有效期 (秒)，超过后需要重新查询网络时间
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+# 两次启动之间推算的系统启动时间允许的误差 (秒)，在此范围内视为同一次开机
+BOOT_TOLERANCE = 120.0
+
+# 同一次开机期间本地时钟与单调时钟经过时间允许的误差 (秒)
+CLOCK_TOLERANCE = 300.0
+
+# 缓存文件名
+CACHE_FILE_NAME = 'trusted_time.json'
+
+# 校验和使用的密钥。密钥就在源代码中，任何人都能重新计算校验和，
+# 因此校验和只能发现意外损坏或随手编辑的缓存文件，不能防止有意的篡改
+_CHECKSUM_KEY = b'Pandoc-GUI trusted time v1'
+
+_FIELDS = ('network_time', 'wall_time', 'monotonic', 'boot_time')
+
+
+def _checksum(record):
+    """计算缓存记录的校验和"""
+    payload = json.dumps([record[field] for field in _FIELDS], separators=(',', ':'))
+    return hmac.new(_CHECKSUM_KEY, payload.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+class TrustedTimeCache:
+    """可信时间缓存
+
+    记录包含验证时的网络时间，以及同一时刻的本地时钟、单调时钟和推算的系统启动时间。
+    同一次开机期间使用单调时钟计算经过的时间，不受修改系统时间的影响；休眠后单调时钟
+    没有计入休眠时间，此时使用本地时钟，但经过的时间不能少于单调时钟经过的时间。
+    重新开机后无法得知关机期间经过的时间，本地时钟又可以随意设置，因此需要重新查询网络时间。
+    锚点之间不一致、记录损坏或超过有效期时，同样需要重新查询网络时间。
+
+    系统启动时间由本地时钟推算，缓存只能发现一般的时钟调整，不能防止有意的绕过。
+    """
+
+    def __init__(self, path=None, max_age=DEFAULT_MAX_AGE):
+        """
+        Args:
+            path: 缓存文件路径，默认使用应用缓存目录下的 trusted_time.json
+            max_age: 缓存有效期 (秒)
+        """
+        self.path = path or os.path.join(get_cache_dir(), CACHE_FILE_NAME)
+        self.max_age = max_age
+        # 时钟函数，测试时可以替换
+        self._wall_clock = time.time
+        self._monotonic_clock = time.monotonic
+
+    def save(self, network_time):
+        """保存刚通过网络验证的时间
+
+        Args:
+            network_time: 网络时间 (带时区的datetime)
+        """
+        wall_time = self._wall_clock()
+        monotonic = self._monotonic_clock()
+        record = {
+            'network_time': network_time.timestamp(),
+            'wall_time': wall_time,
+            'monotonic': monotonic,
+            'boot_time': wall_time - monotonic,
+        }
+        record['checksum'] = _checksum(record)
+
+        cache_dir = os.path.dirname(self.path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def load(self):
+        """读取缓存记录
+
+        Returns:
+            dict: 校验通过的记录，文件不存在或损坏时返回None
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(record, dict):
+            return None
+        if not all(isinstance(record.get(field), (int, float)) for field in _FIELDS):
+            return None
+        if not hmac.compare_digest(str(record.get('checksum', '')), _checksum(record)):
+            return None
+        return record
+
+    def get_time(self):
+        """根据缓存推算当前时间
+
+        Returns:
+            datetime: 推算的当前时间 (UTC)，缓存不存在、重新开机过、锚点不一致或超过有效期时返回None
+        """
+        record = self.load()
+        if record is None:
+            return None
+
+        wall_time = self._wall_clock()
+        monotonic = self._monotonic_clock()
+        wall_elapsed = wall_time - record['wall_time']
+        boot_time = wall_time - monotonic
+
+        if wall_elapsed < -BOOT_TOLERANCE:
+            # 本地时钟回拨到验证时间之前
+            return None
+
+        if abs(boot_time - record['boot_time']) <= BOOT_TOLERANCE:
+            # 同一次开机，以单调时钟为准，并要求本地时钟没有被调整
+            elapsed = monotonic - record['monotonic']
+            if elapsed < 0 or abs(wall_elapsed - elapsed) > CLOCK_TOLERANCE:
+                return None
+        elif boot_time > record['boot_time'] and monotonic >= record['monotonic']:
+            # 休眠过，单调时钟不包含休眠时间，只能使用本地时钟。
+            # 单调时钟走过的时间不会多于实际经过的时间
+            if wall_elapsed < monotonic - record['monotonic'] - BOOT_TOLERANCE:
+                return None
+            elapsed = max(wall_elapsed, 0.0)
+        else:
+            # 单调时钟小于记录说明重新开机过，关机期间经过的时间只能由本地时钟得出，
+            # 而每次开机后回拨本地时钟就能让缓存一直有效，因此重新查询网络时间；
+            # 推算的启动时间早于记录说明本地时钟被回拨
+            return None
+
+        if elapsed > self.max_age:
+            return None
+
+        return datetime.fromtimestamp(record['network_time'] + elapsed, tz=timezone.utc)
+
+    def clear(self):
+        """删除缓存记录"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
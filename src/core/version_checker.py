@@ -4,13 +4,17 @@
 """
 
 import sys
+import time
+import queue
+import statistics
+import threading
 from datetime import datetime, timezone, timedelta
 try:
     import ntplib
 except ImportError:
     ntplib = None
 
-from PyQt5.QtWidgets import QMessageBox
+from core.trusted_time import TrustedTimeCache
 
 # 北京时间时区 (UTC+8)
 BEIJING_TZ = timezone(timedelta(hours=8))
@@ -18,38 +22,121 @@ BEIJING_TZ = timezone(timedelta(hours=8))
 # 过期时间常量 (北京时间)
 EXPIRATION_DATE = datetime(2025, 12, 5, 0, 0, 0, tzinfo=BEIJING_TZ)
 
+# 网络时间查询的截止时间 (秒)，包含域名解析，所有服务器同时查询
+NETWORK_TIME_TIMEOUT = 0.8
 
-def check_network_time():
+# 默认查询的NTP服务器，可以是主机名或 (主机名, 端口) 元组
+NTP_SERVERS = (
+    'ntp.aliyun.com',
+    'ntp.tencent.com',
+    'pool.ntp.org',
+    'time.windows.com',
+    'time.apple.com',
+)
+NTP_PORT = 123
+
+# 取前几个服务器应答的中位数，为1时使用最先到达的应答
+NTP_QUORUM = 1
+
+
+def _query_ntp_server(server, timeout, results):
+    """在工作线程中查询单个NTP服务器，把本地时钟的偏差放入结果队列"""
+    host, port = server if isinstance(server, tuple) else (server, NTP_PORT)
+    try:
+        response = ntplib.NTPClient().request(host, version=3, port=port, timeout=timeout)
+        results.put(response.offset)
+    except Exception:
+        results.put(None)
+
+
+def check_network_time(timeout=NETWORK_TIME_TIMEOUT, servers=NTP_SERVERS, quorum=NTP_QUORUM):
     """查询网络时间
     
+    同时向所有服务器发出查询，收到quorum个有效应答后立即返回，不再等待其余服务器；
+    到截止时间仍不足quorum个时使用已收到的应答。多个应答取本地时钟偏差的中位数。
+    
+    Args:
+        timeout (float, optional): 截止时间 (秒)，整个查询最多耗时这么久
+        servers (list, optional): NTP服务器列表，元素为主机名或 (主机名, 端口) 元组，
+                                  测试时可以指向本地的模拟服务器
+        quorum (int, optional): 需要的有效应答数
+    
     Returns:
         datetime: 北京时间对象，如果失败则返回None
     """
-    if ntplib is None:
+    if ntplib is None or not servers:
         return None
-        
-    try:
-        # 查询网络时间
-        client = ntplib.NTPClient()
-        response = client.request('pool.ntp.org', version=3)
-        # 获取UTC时间并转换为北京时间
-        utc_time = datetime.fromtimestamp(response.tx_time, tz=timezone.utc)
-        return utc_time.astimezone(BEIJING_TZ)
-    except (ntplib.NTPException, OSError, Exception):
+    
+    deadline = time.monotonic() + timeout
+    results = queue.Queue()
+    for server in servers:
+        # 未完成的查询在截止时间后由其自身的超时结束，不影响返回
+        threading.Thread(
+            target=_query_ntp_server, args=(server, timeout, results), daemon=True
+        ).start()
+    
+    offsets = []
+    pending = len(servers)
+    quorum = max(1, min(quorum, pending))
+    while pending and len(offsets) < quorum:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            offset = results.get(timeout=remaining)
+        except queue.Empty:
+            break
+        pending -= 1
+        if offset is not None:
+            offsets.append(offset)
+    
+    if not offsets:
         return None
+    
+    # 获取UTC时间并转换为北京时间
+    utc_time = datetime.fromtimestamp(time.time() + statistics.median(offsets), tz=timezone.utc)
+    return utc_time.astimezone(BEIJING_TZ)
+
+
+def get_trusted_time(timeout=NETWORK_TIME_TIMEOUT, cache=None, servers=NTP_SERVERS,
+                     quorum=NTP_QUORUM):
+    """获取可信的当前时间
+    
+    优先根据可信时间缓存在本地推算，缓存不可用时查询网络时间并更新缓存。
+    
+    Args:
+        timeout (float, optional): 查询网络时间的截止时间 (秒)
+        cache (TrustedTimeCache, optional): 可信时间缓存，默认使用应用缓存目录中的缓存
+        servers (list, optional): NTP服务器列表
+        quorum (int, optional): 需要的有效应答数
+        
+    Returns:
+        datetime: 北京时间对象，如果失败则返回None
+    """
+    cache = cache or TrustedTimeCache()
+    cached_time = cache.get_time()
+    if cached_time is not None:
+        return cached_time.astimezone(BEIJING_TZ)
+    
+    current_time = check_network_time(timeout, servers, quorum)
+    if current_time is not None:
+        cache.save(current_time)
+    return current_time
 
 
-def is_expired(current_time=None):
+def is_expired(current_time=None, timeout=NETWORK_TIME_TIMEOUT, cache=None):
     """检查软件是否已过期
     
     Args:
-        current_time (datetime, optional): 当前时间，如果为None则查询网络时间
+        current_time (datetime, optional): 当前时间，如果为None则获取可信的当前时间
+        timeout (float, optional): 查询网络时间的超时时间 (秒)
+        cache (TrustedTimeCache, optional): 可信时间缓存
         
     Returns:
         tuple: (bool, datetime) - (是否过期, 当前时间)
     """
     if current_time is None:
-        current_time = check_network_time()
+        current_time = get_trusted_time(timeout, cache)
     
     if current_time is None:
         # 无法获取网络时间，假设已过期以强制用户联网
@@ -61,48 +148,6 @@ def is_expired(current_time=None):
     return current_time >= EXPIRATION_DATE, current_time
 
 
-def show_version_expired_dialog():
-    """显示版本过期对话框"""
-    QMessageBox.critical(
-        None,
-        "版本过期",
-        "当前版本已过期，请联系开发者获取最新版。",
-        QMessageBox.Ok
-    )
-
-
-def show_network_error_dialog():
-    """显示网络连接错误对话框"""
-    QMessageBox.critical(
-        None,
-        "网络连接失败",
-        "请连接网络以检查版本状态。",
-        QMessageBox.Ok
-    )
-
-
-def check_expiration():
-    """检查软件是否过期，并显示相应的对话框
-    
-    Returns:
-        bool: True表示未过期可继续使用，False表示已过期或网络错误
-    """
-    expired, current_time = is_expired()
-    
-    if current_time is None:
-        # 网络连接失败
-        show_network_error_dialog()
-        return False
-    
-    if expired:
-        # 已过期
-        show_version_expired_dialog()
-        return False
-    
-    # 未过期，可以正常使用
-    return True
-
-
 def is_expired_with_local_time():
     """使用本地时间检查软件是否已过期（用于调试）
     
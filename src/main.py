@@ -5,10 +5,17 @@ Pandoc GUI 应用程序入口
 
 import sys
 import os
+import time
+
+# 进程开始执行入口文件的时间，供启动耗时记录使用
+_START_TIME = time.time()
 
 # 添加当前目录到路径，以便导入模块
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from utils import startup_trace
+startup_trace.mark('main_start', _START_TIME)
+
 # 尝试导入PyQt5，如果失败则提供错误信息
 try:
     from PyQt5.QtWidgets import QApplication
@@ -28,25 +35,31 @@ except ImportError as e:
     input("按任意键退出...")
     sys.exit(1)
 
+startup_trace.mark('pyqt_imported')
+
 # 导入主窗口类
 from ui.main_window import PandocGUI
 
-# 导入版本检查模块
-from core.version_checker import check_expiration
+startup_trace.mark('modules_imported')
 
 
 def main():
     """主函数"""
     # 创建应用程序
     app = QApplication(sys.argv)
+    startup_trace.mark('qapplication_created')
     
-    # 执行过期检查
-    if not check_expiration():
-        sys.exit(1)
+    # 设置了 PANDOC_GUI_STALL_WATCHDOG 时检测主线程卡顿
+    if os.environ.get('PANDOC_GUI_STALL_WATCHDOG'):
+        from utils import stall_watchdog
+        stall_watchdog.install()
     
-    # 创建主窗口
+    # 创建主窗口，过期检查在主窗口中后台进行
     window = PandocGUI()
+    startup_trace.mark('window_created')
     window.show()
+    startup_trace.mark('window_shown')
+    startup_trace.watch_first_paint(window)
     
     # 运行应用程序
     sys.exit(app.exec_())
@@ -0,0 +1,101 @@
+"""
+后台转换任务
+在Qt线程池中执行转换，不阻塞界面，并支持取消正在运行的pandoc进程
+"""
+
+import time
+import threading
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+
+# 已用时间信号的发送间隔 (毫秒)
+ELAPSED_INTERVAL_MS = 100
+
+
+class _TaskRunnable(QRunnable):
+    """在线程池中运行转换函数的QRunnable"""
+
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+
+    def run(self):
+        self.task._run()
+
+
+class ConversionTask(QObject):
+    """可取消的后台转换任务
+
+    转换函数在线程池中执行，接收一个 threading.Event 作为取消标志，
+    返回 (success, message)。信号在主线程中发出，可以直接更新界面。
+
+    Signals:
+        started: 任务开始执行
+        elapsed: 已用时间 (秒)，执行期间定时发出
+        finished: 任务结束，参数为 (success, message, 总用时秒数)
+    """
+
+    started = pyqtSignal()
+    elapsed = pyqtSignal(float)
+    finished = pyqtSignal(bool, str, float)
+
+    # 从工作线程转发结果到主线程
+    _done = pyqtSignal(bool, str)
+
+    def __init__(self, func, parent=None):
+        """
+        Args:
+            func: 转换函数，签名为 func(cancel_event) -> (success, message)
+            parent: 父对象（可选）
+        """
+        super().__init__(parent)
+        self.func = func
+        self.cancel_event = threading.Event()
+        self._start_time = None
+        self._running = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(ELAPSED_INTERVAL_MS)
+        self._timer.timeout.connect(self._emit_elapsed)
+        self._done.connect(self._on_done)
+
+    def start(self, pool=None):
+        """提交到线程池开始执行
+
+        Args:
+            pool: QThreadPool（可选），默认使用全局线程池
+        """
+        self._start_time = time.monotonic()
+        self._running = True
+        self._timer.start()
+        self.started.emit()
+        (pool or QThreadPool.globalInstance()).start(_TaskRunnable(self))
+
+    def cancel(self):
+        """请求取消任务，正在运行的pandoc进程会被终止"""
+        self.cancel_event.set()
+
+    def is_running(self):
+        """任务是否正在执行"""
+        return self._running
+
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self.cancel_event.is_set()
+
+    def _run(self):
+        """在工作线程中执行转换函数"""
+        try:
+            success, message = self.func(self.cancel_event)
+        except Exception as e:
+            success, message = False, f"发生错误：\n{str(e)}"
+        self._done.emit(bool(success), str(message))
+
+    def _emit_elapsed(self):
+        self.elapsed.emit(time.monotonic() - self._start_time)
+
+    def _on_done(self, success, message):
+        """在主线程中处理任务结束"""
+        self._timer.stop()
+        self._running = False
+        self.finished.emit(success, message, time.monotonic() - self._start_time)
@@ -28,7 +28,7 @@ from ui.widgets.layout_widget import LayoutWidget
 from ui.widgets.page_widget import PageWidget
 
 # 导入核心模块
-from core.config_manager import ConfigManager
+from core.config_manager import ConfigManager, TEMPLATE_MODES, TEMPLATE_MODE_STYLES
 from core.template_manager import TemplateManager
 
 # 导入工具模块
@@ -150,7 +150,17 @@ class FormatConfigDialog(QDialog):
         export_template_button = QPushButton("导出模板")
         export_template_button.clicked.connect(self.export_template)
     
+        # 导出方式：仅样式或完整示例文档
+        self.export_mode_combo = QComboBox()
+        for mode, label in TEMPLATE_MODES.items():
+            self.export_mode_combo.addItem(label, mode)
+        self.export_mode_combo.setCurrentIndex(
+            self.export_mode_combo.findData(TEMPLATE_MODE_STYLES)
+        )
+        
         button_layout.addStretch()
+        button_layout.addWidget(QLabel("导出内容："))
+        button_layout.addWidget(self.export_mode_combo)
         button_layout.addWidget(export_template_button)
         button_layout.addWidget(cancel_button)
         button_layout.addStretch()
@@ -189,9 +199,6 @@ class FormatConfigDialog(QDialog):
         # 先收集当前配置
         self.config = self.config_manager.collect_config(self.widgets)
         
-        # 创建模板文档
-        doc = self.config_manager.create_template_file()
-        
         # 选择保存位置
         file_path = get_save_file_path(
             self, '保存模板文件', 'Word文档 (*.docx)', '.docx'
@@ -199,7 +206,12 @@ class FormatConfigDialog(QDialog):
         
         if file_path:
             try:
-                doc.save(file_path)
+                # 配置未变化时直接使用缓存的模板内容
+                data = self.config_manager.get_template_bytes(
+                    mode=self.export_mode_combo.currentData()
+                )
+                with open(file_path, 'wb') as f:
+                    f.write(data)
                 QMessageBox.information(self, '成功', f'模板文件已保存到：{file_path}')
             except Exception as e:
                 QMessageBox.critical(self, '错误', f'保存模板文件失败：\n{str(e)}')
\ No newline at end of file
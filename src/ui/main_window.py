@@ -8,19 +8,26 @@ import sys
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QFileDialog, QComboBox, QMessageBox,
-    QApplication
+    QApplication, QToolButton, QMenu, QGroupBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QThreadPool, pyqtSignal
 
 # 添加当前目录到路径，以便导入模块
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 导入自定义组件
-from ui.format_config import FormatConfigDialog
-from ui.about_dialog import AboutDialog
+from ui.conversion_worker import ConversionTask
+from ui.widgets.batch_queue_widget import BatchQueueWidget
+from ui.version_dialogs import (
+    ExpirationCheck, STATUS_VALID, STATUS_EXPIRED,
+    show_version_expired_dialog, show_network_error_dialog
+)
 
 # 导入核心模块
-from core.pandoc_converter import PandocConverter
+from core.pandoc_converter import PandocConverter, CANCELLED_MESSAGE
+from core.conversion_cache import ConversionCache
+from core.rts_profiles import RTS_PROFILE_LABELS
+from core.capabilities import probe_in_background, get_output_extension
 
 # 导入工具模块
 from utils.file_utils import (
@@ -31,13 +38,18 @@ from utils.file_utils import (
 from core.version_checker import get_expiration_message, get_test_version_message
 
 
+class CapabilitySignals(QObject):
+    """能力探测完成信号，用于从后台线程通知主线程"""
+    ready = pyqtSignal(object)
+
+
 class PandocGUI(QMainWindow):
     """主窗口类"""
     
     def __init__(self):
         super().__init__()
         self.setWindowTitle('Pandoc GUI')
-        self.setGeometry(100, 100, 800, 600)
+        self.setGeometry(100, 100, 800, 800)
         
         # 获取项目根目录 - 需要向上两级目录（从 src/ui/ 到项目根目录）
         self.root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -69,19 +81,31 @@ class PandocGUI(QMainWindow):
                     print(f"Error: Pandoc not found at {alt_path} either")
         
         # 初始化转换器
-        self.converter = PandocConverter(self.pandoc_path)
+        self.converter = PandocConverter(self.pandoc_path, cache=ConversionCache())
         
-        # 支持的文件格式
-        self.supported_formats = [
-            'markdown', 'docx', 'pdf', 'html', 'epub', 'odt', 
-            'txt', 'rst', 'json', 'latex', 'xml', 'pptx'
-        ]
+        # 支持的文件格式，来自能力探测缓存，首次启动时为常用格式列表
+        self.supported_formats = self.converter.supported_formats
         
         self.input_file = None
         self.template_file = None
         
+        # 当前正在执行的后台转换任务
+        self.conversion_task = None
+        self.thread_pool = QThreadPool(self)
+        
         self.init_ui()
         
+        # 在后台检查软件是否过期，只有转换操作需要等待检查结果
+        self.pending_action = None
+        self.expiration_check = ExpirationCheck(self)
+        self.expiration_check.finished.connect(self.on_expiration_checked)
+        self.expiration_check.start()
+        
+        # 在后台探测pandoc能力，已有缓存时不会启动pandoc
+        self.capability_signals = CapabilitySignals()
+        self.capability_signals.ready.connect(self.on_capabilities_ready)
+        probe_in_background(self.pandoc_path, self.capability_signals.ready.emit)
+        
     def create_menu_bar(self):
         """创建菜单栏"""
         menubar = self.menuBar()
@@ -145,6 +169,22 @@ class PandocGUI(QMainWindow):
         self.format_combo.addItems(self.supported_formats)
         self.format_combo.setCurrentText('docx')
         format_layout.addWidget(self.format_combo)
+        
+        # 额外输出格式（可多选），与上方格式一起从同一次解析结果中写出
+        self.extra_format_button = QToolButton()
+        self.extra_format_button.setText('额外输出格式')
+        self.extra_format_button.setPopupMode(QToolButton.InstantPopup)
+        self.extra_format_menu = QMenu(self.extra_format_button)
+        self.populate_extra_format_menu()
+        self.extra_format_button.setMenu(self.extra_format_menu)
+        format_layout.addWidget(self.extra_format_button)
+        
+        # 性能配置
+        format_layout.addWidget(QLabel('性能配置：'))
+        self.profile_combo = QComboBox()
+        for profile, label in RTS_PROFILE_LABELS.items():
+            self.profile_combo.addItem(label, profile)
+        format_layout.addWidget(self.profile_combo)
         format_layout.addStretch()
         
         # 按钮区域
@@ -152,16 +192,23 @@ class PandocGUI(QMainWindow):
         
         # 转换按钮
         self.convert_button = QPushButton('转换文件')
-        self.convert_button.clicked.connect(self.convert_file)
+        self.convert_button.clicked.connect(lambda: self.run_when_allowed(self.convert_file))
         self.convert_button.setFixedHeight(40)
         self.convert_button.setEnabled(False)
         
+        # 取消转换按钮，仅在转换进行时可用
+        self.cancel_button = QPushButton('取消转换')
+        self.cancel_button.clicked.connect(self.cancel_conversion)
+        self.cancel_button.setFixedHeight(40)
+        self.cancel_button.setEnabled(False)
+        
         # 创建模板文件按钮
         self.create_template_button = QPushButton('创建模板文件')
         self.create_template_button.clicked.connect(self.open_format_config_dialog)
         self.create_template_button.setFixedHeight(40)
         
         button_layout.addWidget(self.convert_button)
+        button_layout.addWidget(self.cancel_button)
         button_layout.addWidget(self.create_template_button)
         
         # 状态显示
@@ -181,11 +228,20 @@ class PandocGUI(QMainWindow):
         self.test_version_label.setWordWrap(True)
         self.test_version_label.setText(get_test_version_message())
         
+        # 批量转换队列，使用上方的输出格式、模板和性能配置
+        batch_group = QGroupBox('批量转换')
+        batch_layout = QVBoxLayout(batch_group)
+        self.batch_widget = BatchQueueWidget(
+            self.converter, self.get_conversion_settings, guard=self.run_when_allowed
+        )
+        batch_layout.addWidget(self.batch_widget)
+        
         # 添加所有布局到主布局
         main_layout.addLayout(file_layout)
         main_layout.addLayout(format_layout)
         main_layout.addLayout(button_layout)
         main_layout.addWidget(self.status_label)
+        main_layout.addWidget(batch_group, 1)
         main_layout.addWidget(self.expiration_label)
         main_layout.addWidget(self.test_version_label)
         main_layout.addStretch()
@@ -202,7 +258,7 @@ class PandocGUI(QMainWindow):
         if file_path:
             self.input_file = file_path
             self.input_label.setText(get_file_name(file_path))
-            self.convert_button.setEnabled(True)
+            self.convert_button.setEnabled(self.conversion_task is None)
             self.status_label.setText(f'已选择输入文件：{get_file_name(file_path)}')
     
     def select_template_file(self):
@@ -221,35 +277,210 @@ class PandocGUI(QMainWindow):
         
         output_format = self.format_combo.currentText()
         
+        # 勾选了额外输出格式时，使用多格式输出
+        output_formats = [output_format] + [
+            fmt for fmt in self.get_extra_formats() if fmt != output_format
+        ]
+        if len(output_formats) > 1:
+            self.convert_to_formats(output_formats)
+            return
+        
         # 生成输出文件名
-        output_file = generate_output_path(self.input_file, output_format)
+        output_file = generate_output_path(self.input_file, get_output_extension(output_format))
         
-        try:
-            self.status_label.setText('正在转换...')
-            QApplication.processEvents()
-            
-            # 执行转换
-            success, message = self.converter.convert_file(
-                self.input_file, output_file, self.template_file
+        input_file = self.input_file
+        template_file = self.template_file
+        profile = self.profile_combo.currentData()
+        
+        def run(cancel_event):
+            return self.converter.convert_file(
+                input_file, output_file, template_file,
+                profile=profile, output_format=output_format, cancel_event=cancel_event
             )
-            
-            if success:
-                self.status_label.setText(message)
-                QMessageBox.information(self, '成功', message)
-            else:
-                self.status_label.setText('转换失败')
-                QMessageBox.critical(self, '错误', message)
-                
-        except Exception as e:
+        
+        self.start_conversion(run, '正在转换')
+    
+    def run_when_allowed(self, action):
+        """在过期检查通过后执行转换操作
+        
+        检查尚未完成时，操作会在检查通过后执行；上次检查因网络问题失败时会重新检查。
+        
+        Args:
+            action: 需要执行的操作，无参数
+        """
+        status = self.expiration_check.status
+        if status == STATUS_VALID:
+            action()
+        elif status == STATUS_EXPIRED:
+            show_version_expired_dialog(self)
+        else:
+            self.pending_action = action
+            self.status_label.setText('正在检查版本状态...')
+            self.expiration_check.start()
+    
+    def on_expiration_checked(self, status):
+        """过期检查结束后执行等待中的操作或显示提示"""
+        action, self.pending_action = self.pending_action, None
+        
+        if status == STATUS_VALID:
+            if action is not None:
+                self.status_label.setText('就绪')
+                action()
+        elif status == STATUS_EXPIRED:
+            self.status_label.setText('当前版本已过期')
+            show_version_expired_dialog(self)
+        elif action is not None:
+            # 启动时网络不可用不打扰用户，等到需要转换时再提示
+            self.status_label.setText('网络连接失败，无法检查版本状态')
+            show_network_error_dialog(self)
+    
+    def start_conversion(self, func, status_text):
+        """在后台线程中执行转换
+        
+        Args:
+            func: 转换函数，签名为 func(cancel_event) -> (success, message)
+            status_text: 转换进行时状态栏显示的文字
+        """
+        task = ConversionTask(func, self)
+        task.elapsed.connect(lambda seconds: self.on_conversion_elapsed(status_text, seconds))
+        task.finished.connect(self.on_conversion_finished)
+        self.conversion_task = task
+        
+        self.convert_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.status_label.setText(f'{status_text}...')
+        task.start(self.thread_pool)
+    
+    def cancel_conversion(self):
+        """取消正在进行的转换"""
+        if self.conversion_task is not None:
+            self.conversion_task.cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText('正在取消...')
+    
+    def on_conversion_elapsed(self, status_text, seconds):
+        """在状态栏显示转换已用时间"""
+        if self.conversion_task is not None and not self.conversion_task.is_cancelled():
+            self.status_label.setText(f'{status_text}... 已用时 {seconds:.1f} 秒')
+    
+    def on_conversion_finished(self, success, message, seconds):
+        """后台转换结束后更新界面"""
+        cancelled = self.conversion_task.is_cancelled()
+        self.conversion_task.deleteLater()
+        self.conversion_task = None
+        self.convert_button.setEnabled(self.input_file is not None)
+        self.cancel_button.setEnabled(False)
+        
+        if cancelled:
+            self.status_label.setText(CANCELLED_MESSAGE)
+        elif success:
+            self.status_label.setText(f"{message.splitlines()[0].rstrip('：')}（用时 {seconds:.1f} 秒）")
+            QMessageBox.information(self, '成功', message)
+        else:
             self.status_label.setText('转换失败')
-            QMessageBox.critical(self, '错误', f'发生错误：\n{str(e)}')
+            QMessageBox.critical(self, '错误', message)
+    
+    def get_conversion_settings(self):
+        """获取当前的转换设置
+        
+        Returns:
+            tuple: (output_format, template_file, profile)
+        """
+        return (
+            self.format_combo.currentText(), self.template_file,
+            self.profile_combo.currentData()
+        )
+    
+    def populate_extra_format_menu(self, checked_formats=()):
+        """根据支持的格式填充额外输出格式菜单"""
+        self.extra_format_menu.clear()
+        for output_format in self.supported_formats:
+            action = self.extra_format_menu.addAction(output_format)
+            action.setCheckable(True)
+            action.setChecked(output_format in checked_formats)
+            action.toggled.connect(self.update_extra_format_button)
+        self.update_extra_format_button()
+    
+    def on_capabilities_ready(self, capabilities):
+        """能力探测完成后，用pandoc实际支持的格式更新格式列表"""
+        if not capabilities:
+            return
+        
+        supported_formats = self.converter.supported_formats
+        if supported_formats == self.supported_formats:
+            return
+        self.supported_formats = supported_formats
+        
+        current_format = self.format_combo.currentText()
+        self.format_combo.clear()
+        self.format_combo.addItems(self.supported_formats)
+        if current_format in self.supported_formats:
+            self.format_combo.setCurrentText(current_format)
+        
+        self.populate_extra_format_menu(self.get_extra_formats())
+    
+    def get_extra_formats(self):
+        """获取勾选的额外输出格式"""
+        return [
+            action.text() for action in self.extra_format_menu.actions()
+            if action.isChecked()
+        ]
+    
+    def update_extra_format_button(self):
+        """更新额外输出格式按钮上的已选数量"""
+        count = len(self.get_extra_formats())
+        self.extra_format_button.setText(
+            f'额外输出格式 ({count})' if count else '额外输出格式'
+        )
+    
+    def convert_to_formats(self, output_formats):
+        """将输入文件一次解析后转换为多种格式"""
+        outputs = {
+            fmt: generate_output_path(self.input_file, get_output_extension(fmt))
+            for fmt in output_formats
+        }
+        
+        input_file = self.input_file
+        template_file = self.template_file
+        profile = self.profile_combo.currentData()
+        
+        def run(cancel_event):
+            succeeded = []
+            failed = []
+            for output_format, output_file, success, message in self.converter.convert_to_formats(
+                input_file, outputs, template_file, profile=profile, cancel_event=cancel_event
+            ):
+                if success:
+                    succeeded.append(get_file_name(output_file))
+                else:
+                    failed.append(f'{output_format}：{message}')
+            
+            summary = f'转换成功 {len(succeeded)} 个，失败 {len(failed)} 个'
+            if failed:
+                return False, summary + '\n\n' + '\n\n'.join(failed)
+            return True, summary + '：\n' + '\n'.join(succeeded)
+        
+        self.start_conversion(run, f'正在转换为 {len(outputs)} 种格式')
     
     def open_format_config_dialog(self):
         """打开排版配置对话框"""
+        # 排版配置对话框依赖所有配置组件和模板生成模块，首次打开时才导入以加快启动
+        from ui.format_config import FormatConfigDialog
+        
         dialog = FormatConfigDialog(self)
         dialog.exec_()
     
     def show_about_dialog(self):
         """显示关于与鸣谢对话框"""
+        from ui.about_dialog import AboutDialog
+        
         dialog = AboutDialog(self)
-        dialog.exec_()
\ No newline at end of file
+        dialog.exec_()
+    
+    def closeEvent(self, event):
+        """关闭窗口时取消正在进行的转换并等待后台线程结束"""
+        if self.conversion_task is not None:
+            self.conversion_task.cancel()
+        self.batch_widget.shutdown()
+        self.thread_pool.waitForDone()
+        super().closeEvent(event)
@@ -0,0 +1,122 @@
+"""
+版本检查对话框模块
+在后台检查软件是否过期，并根据检查结果显示过期或网络错误提示
+"""
+
+import threading
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QMessageBox
+
+from core.version_checker import is_expired, NETWORK_TIME_TIMEOUT
+from utils import startup_trace
+
+
+# 检查结果
+STATUS_PENDING = 'pending'
+STATUS_VALID = 'valid'
+STATUS_EXPIRED = 'expired'
+STATUS_OFFLINE = 'offline'
+
+# 过期检查的最长等待时间 (毫秒)，超时按网络连接失败处理。
+# 在网络时间查询的截止时间之外留出读写可信时间缓存的余量
+EXPIRATION_CHECK_DEADLINE_MS = int(NETWORK_TIME_TIMEOUT * 1000) + 500
+
+
+def show_version_expired_dialog(parent=None):
+    """显示版本过期对话框"""
+    QMessageBox.critical(
+        parent,
+        "版本过期",
+        "当前版本已过期，请联系开发者获取最新版。",
+        QMessageBox.Ok
+    )
+
+
+def show_network_error_dialog(parent=None):
+    """显示网络连接错误对话框"""
+    QMessageBox.critical(
+        parent,
+        "网络连接失败",
+        "请连接网络以检查版本状态。",
+        QMessageBox.Ok
+    )
+
+
+class ExpirationCheck(QObject):
+    """后台过期检查
+
+    网络时间查询在独立线程中执行，不阻塞界面；超过截止时间仍未完成时
+    按网络连接失败处理，之后到达的结果会被忽略。
+
+    Signals:
+        finished: 检查结束，参数为检查结果 (STATUS_VALID / STATUS_EXPIRED / STATUS_OFFLINE)
+    """
+
+    finished = pyqtSignal(str)
+
+    # 从工作线程转发结果到主线程，参数为 (检查序号, 检查结果)
+    _done = pyqtSignal(int, str)
+
+    def __init__(self, parent=None, deadline_ms=EXPIRATION_CHECK_DEADLINE_MS):
+        """
+        Args:
+            parent: 父对象（可选）
+            deadline_ms: 最长等待时间 (毫秒)
+        """
+        super().__init__(parent)
+        self.status = STATUS_PENDING
+        self._generation = 0
+
+        self._deadline = QTimer(self)
+        self._deadline.setSingleShot(True)
+        self._deadline.setInterval(deadline_ms)
+        self._deadline.timeout.connect(self._on_deadline)
+        self._done.connect(self._on_done)
+
+    def start(self):
+        """开始检查，正在检查时不会重复开始"""
+        if self.status == STATUS_PENDING and self._deadline.isActive():
+            return
+        self._generation += 1
+        self.status = STATUS_PENDING
+        startup_trace.mark('expiry_check_started')
+        self._deadline.start()
+        threading.Thread(target=self._run, args=(self._generation,), daemon=True).start()
+
+    def is_pending(self):
+        """是否正在检查"""
+        return self.status == STATUS_PENDING
+
+    def is_valid(self):
+        """检查是否已通过"""
+        return self.status == STATUS_VALID
+
+    def _run(self, generation):
+        """在工作线程中查询网络时间"""
+        try:
+            expired, current_time = is_expired()
+        except Exception:
+            expired, current_time = True, None
+
+        if current_time is None:
+            status = STATUS_OFFLINE
+        elif expired:
+            status = STATUS_EXPIRED
+        else:
+            status = STATUS_VALID
+        self._done.emit(generation, status)
+
+    def _on_deadline(self):
+        """超过截止时间仍未完成"""
+        self._finish(STATUS_OFFLINE)
+
+    def _on_done(self, generation, status):
+        """在主线程中处理检查结果"""
+        if generation == self._generation and self.status == STATUS_PENDING:
+            self._finish(status)
+
+    def _finish(self, status):
+        startup_trace.mark('expiry_check_finished')
+        self._deadline.stop()
+        self.status = status
+        self.finished.emit(status)
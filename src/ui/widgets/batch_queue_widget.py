@@ -0,0 +1,521 @@
+"""
+批量转换队列组件
+包含队列表格模型、文件/文件夹添加（支持拖放和递归查找）以及并发数控制
+"""
+
+import os
+import time
+import queue
+import threading
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider,
+    QTableView, QHeaderView, QAbstractItemView, QFileDialog
+)
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer, QThreadPool, pyqtSignal
+)
+
+from core.pandoc_converter import DEFAULT_MAX_WORKERS
+from core.pandoc_log import WarningSummary
+from core.capabilities import get_output_extension
+from utils.file_utils import discover_input_files, find_output_conflicts, generate_output_path
+from ui.conversion_worker import ConversionTask
+
+
+# 队列状态及其显示名称
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+
+STATUS_LABELS = {
+    STATUS_PENDING: '等待',
+    STATUS_RUNNING: '转换中',
+    STATUS_DONE: '成功',
+    STATUS_FAILED: '失败',
+    STATUS_CANCELLED: '已取消',
+}
+
+# 后台线程向界面提交更新的检查间隔 (毫秒)
+UPDATE_INTERVAL_MS = 100
+
+# 每次检查处理更新的最长时间 (秒)，剩余的更新留到下一次处理，避免阻塞事件循环
+MAX_UPDATE_SECONDS = 0.05
+
+# 查找文件时每批添加到队列的文件数
+DISCOVER_BATCH_SIZE = 1000
+
+
+def format_size(size):
+    """格式化文件大小"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
+
+class BatchQueueModel(QAbstractTableModel):
+    """批量转换队列的表格模型
+
+    每行只保存文件路径、状态、用时和输出大小，视图按需读取，
+    队列中有大量文件时也不会创建对应数量的控件。
+    """
+
+    HEADERS = ['文件', '状态', '用时', '输出大小']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 每行为 [路径, 状态, 用时(秒), 输出大小(字节), 消息]
+        self._rows = []
+        self._row_by_path = {}
+        # 各状态的行数，随更新增量维护，统计时无需遍历所有行
+        self._counts = dict.fromkeys(STATUS_LABELS, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path, status, duration, size, message = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return path
+            if column == 1:
+                return STATUS_LABELS[status]
+            if column == 2:
+                return f'{duration:.2f} 秒' if duration is not None else ''
+            if column == 3:
+                return format_size(size) if size is not None else ''
+        elif role == Qt.ToolTipRole and message:
+            return message
+        elif role == Qt.TextAlignmentRole and column in (2, 3):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def add_files(self, paths):
+        """添加文件到队列末尾，已在队列中的文件会被忽略
+
+        Returns:
+            int: 实际添加的文件数
+        """
+        new_paths = []
+        for path in paths:
+            path = os.path.abspath(path)
+            if path not in self._row_by_path:
+                self._row_by_path[path] = len(self._rows) + len(new_paths)
+                new_paths.append(path)
+
+        if new_paths:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+            self._rows.extend([path, STATUS_PENDING, None, None, ''] for path in new_paths)
+            self._counts[STATUS_PENDING] += len(new_paths)
+            self.endInsertRows()
+        return len(new_paths)
+
+    def clear(self):
+        """清空队列"""
+        self.beginResetModel()
+        self._rows = []
+        self._row_by_path = {}
+        self._counts = dict.fromkeys(STATUS_LABELS, 0)
+        self.endResetModel()
+
+    def pending_rows(self):
+        """获取尚未成功转换的行
+
+        Returns:
+            list: [(行号, 路径), ...]
+        """
+        return [
+            (row, values[0]) for row, values in enumerate(self._rows)
+            if values[1] != STATUS_DONE
+        ]
+
+    def update_rows(self, updates):
+        """批量更新行状态
+
+        Args:
+            updates: [(行号, 状态, 用时, 输出大小, 消息), ...]
+        """
+        if not updates:
+            return
+        for row, status, duration, size, message in updates:
+            values = self._rows[row]
+            self._counts[values[1]] -= 1
+            self._counts[status] += 1
+            values[1:] = [status, duration, size, message]
+        rows = [update[0] for update in updates]
+        # 合并为一次数据变化通知，视图只重绘可见部分
+        self.dataChanged.emit(
+            self.index(min(rows), 1), self.index(max(rows), self.columnCount() - 1)
+        )
+
+    def set_status(self, rows, status):
+        """将指定行设为某一状态，并清空用时和大小"""
+        self.update_rows([(row, status, None, None, '') for row in rows])
+
+    def mark_unfinished(self, status):
+        """将等待中和转换中的行设为指定状态"""
+        self.set_status([
+            row for row, values in enumerate(self._rows)
+            if values[1] in (STATUS_PENDING, STATUS_RUNNING)
+        ], status)
+
+    def count_by_status(self):
+        """统计各状态的行数"""
+        return dict(self._counts)
+
+
+class BatchQueueWidget(QWidget):
+    """批量转换队列组件
+
+    文件和文件夹可以通过按钮添加，也可以直接拖放到队列中；
+    转换在后台线程池中执行，并发数由滑块控制。
+    """
+
+    # 批量转换开始和结束时发出
+    batch_started = pyqtSignal()
+    batch_finished = pyqtSignal()
+
+    def __init__(self, converter, get_settings, parent=None, guard=None):
+        """
+        Args:
+            converter: PandocConverter 实例
+            get_settings: 返回当前转换设置的函数，
+                          返回值为 (output_format, template_file, profile)
+            parent: 父窗口
+            guard: 开始转换前调用的函数（可选），参数为开始转换的函数，
+                   由其决定是否以及何时开始
+        """
+        super().__init__(parent)
+        self.converter = converter
+        self.get_settings = get_settings
+        self.guard = guard
+        self.task = None
+        self.thread_pool = QThreadPool(self)
+        self._start_times = {}
+        # 当前批次的pandoc警告汇总
+        self.warning_summary = WarningSummary()
+        # 后台线程的更新经由队列交给界面定时处理，避免逐条发送信号
+        self._updates = queue.SimpleQueue()
+        self._discovering = 0
+
+        self.setAcceptDrops(True)
+        self.init_ui()
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setInterval(UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self.process_updates)
+
+    def init_ui(self):
+        """初始化UI"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # 操作按钮
+        button_layout = QHBoxLayout()
+        self.add_files_button = QPushButton('添加文件')
+        self.add_files_button.clicked.connect(self.select_files)
+        self.add_folder_button = QPushButton('添加文件夹')
+        self.add_folder_button.clicked.connect(self.select_folder)
+        self.clear_button = QPushButton('清空队列')
+        self.clear_button.clicked.connect(self.clear_queue)
+        self.start_button = QPushButton('开始批量转换')
+        self.start_button.clicked.connect(self.request_start)
+        self.cancel_button = QPushButton('取消')
+        self.cancel_button.clicked.connect(self.cancel_batch)
+        self.cancel_button.setEnabled(False)
+
+        button_layout.addWidget(self.add_files_button)
+        button_layout.addWidget(self.add_folder_button)
+        button_layout.addWidget(self.clear_button)
+        button_layout.addStretch()
+        button_layout.addWidget(self.start_button)
+        button_layout.addWidget(self.cancel_button)
+        layout.addLayout(button_layout)
+
+        # 并发数
+        concurrency_layout = QHBoxLayout()
+        self.concurrency_slider = QSlider(Qt.Horizontal)
+        self.concurrency_slider.setRange(1, max(2, DEFAULT_MAX_WORKERS * 2))
+        self.concurrency_slider.setValue(DEFAULT_MAX_WORKERS)
+        self.concurrency_slider.setToolTip('同时运行的pandoc进程数，修改后从下一次批量转换开始生效')
+        self.concurrency_label = QLabel()
+        self.concurrency_slider.valueChanged.connect(self.update_concurrency_label)
+        self.update_concurrency_label(self.concurrency_slider.value())
+        concurrency_layout.addWidget(self.concurrency_label)
+        concurrency_layout.addWidget(self.concurrency_slider)
+        layout.addLayout(concurrency_layout)
+
+        # 队列表格
+        self.model = BatchQueueModel(self)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setWordWrap(False)
+        # 固定行高和列宽，避免按内容计算尺寸时遍历所有行
+        vertical_header = self.table_view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(22)
+        horizontal_header = self.table_view.horizontalHeader()
+        horizontal_header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, self.model.columnCount()):
+            horizontal_header.setSectionResizeMode(column, QHeaderView.Fixed)
+            horizontal_header.resizeSection(column, 90)
+        layout.addWidget(self.table_view)
+
+        # 汇总信息
+        self.summary_label = QLabel('将文件或文件夹拖放到此处添加到队列')
+        layout.addWidget(self.summary_label)
+
+    def update_concurrency_label(self, value):
+        """更新并发数显示"""
+        self.concurrency_label.setText(f'并发数：{value}')
+
+    def select_files(self):
+        """选择多个文件添加到队列"""
+        file_paths, _ = QFileDialog.getOpenFileNames(self, '选择输入文件', '', '所有文件 (*.*)')
+        if file_paths:
+            self.add_paths(file_paths)
+
+    def select_folder(self):
+        """选择文件夹，递归添加其中的文件"""
+        folder = QFileDialog.getExistingDirectory(self, '选择文件夹')
+        if folder:
+            self.add_paths([folder])
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        if paths:
+            self.add_paths(paths)
+            event.acceptProposedAction()
+
+    def add_paths(self, paths):
+        """添加文件或文件夹到队列
+
+        文件直接添加；文件夹在后台线程中递归查找，找到的文件分批加入队列。
+        """
+        files = [path for path in paths if not os.path.isdir(path)]
+        folders = [path for path in paths if os.path.isdir(path)]
+
+        if files:
+            self.model.add_files(files)
+            self.update_summary()
+
+        if folders:
+            self._discovering += 1
+            self._update_timer.start()
+            threading.Thread(
+                target=self._discover, args=(folders,), name='batch-discover', daemon=True
+            ).start()
+
+    def _discover(self, folders):
+        """在后台线程中递归查找文件"""
+        batch = []
+        # 跳过之前转换生成的输出文件
+        for path in discover_input_files(folders):
+            batch.append(path)
+            if len(batch) >= DISCOVER_BATCH_SIZE:
+                self._updates.put(('files', batch))
+                batch = []
+        self._updates.put(('files', batch))
+        self._updates.put(('discovered', None))
+
+    def clear_queue(self):
+        """清空队列"""
+        if self.task is None:
+            self.model.clear()
+            self.update_summary()
+
+    def request_start(self):
+        """点击开始按钮，设置了 guard 时由其决定何时开始"""
+        if self.guard is not None:
+            self.guard(self.start_batch)
+        else:
+            self.start_batch()
+
+    def start_batch(self):
+        """开始批量转换队列中尚未成功的文件"""
+        if self.task is not None:
+            return
+        pending = self.model.pending_rows()
+        if not pending:
+            self.summary_label.setText('队列中没有需要转换的文件')
+            return
+
+        output_format, template_file, profile = self.get_settings()
+        extension = get_output_extension(output_format)
+        max_workers = self.concurrency_slider.value()
+        rows_by_input = {path: row for row, path in pending}
+        self.model.set_status(rows_by_input.values(), STATUS_PENDING)
+
+        # 输出路径冲突的文件（如同一文件夹中的 a.md 和 a.rst）同时转换会互相覆盖，
+        # 标记为失败，不参与转换
+        outputs = {path: generate_output_path(path, extension) for _, path in pending}
+        conflicts = find_output_conflicts(list(outputs.items()))
+        if conflicts:
+            self.model.update_rows([
+                (rows_by_input[path], STATUS_FAILED, None, None, reason)
+                for path, reason in conflicts.items()
+            ])
+            pending = [(row, path) for row, path in pending if path not in conflicts]
+            if not pending:
+                self.update_summary()
+                self.summary_label.setText(
+                    f'{self.summary_label.text()}（输出路径冲突，请分别转换）'
+                )
+                return
+
+        def jobs():
+            for row, path in pending:
+                yield {
+                    'input_file': path,
+                    'output_file': outputs[path],
+                    'template_file': template_file,
+                    'output_format': output_format,
+                }
+
+        def on_start(job):
+            row = rows_by_input[job['input_file']]
+            self._updates.put(('start', (row, time.monotonic())))
+
+        warning_summary = self.warning_summary = WarningSummary()
+
+        def run(cancel_event):
+            succeeded = 0
+            failed = len(conflicts)
+            for job, success, message in self.converter.convert_many(
+                jobs(), max_workers, profile, cancel_event, on_start, warning_summary
+            ):
+                size = None
+                if success:
+                    succeeded += 1
+                    try:
+                        size = os.path.getsize(job['output_file'])
+                    except OSError:
+                        pass
+                else:
+                    failed += 1
+                row = rows_by_input[job['input_file']]
+                self._updates.put(('done', (row, success, message, size, time.monotonic())))
+            message = f'转换成功 {succeeded} 个，失败 {failed} 个'
+            if warning_summary.total:
+                message += f'，警告 {warning_summary.total} 条'
+            return failed == 0, message
+
+        self._start_times = {}
+        self.summary_label.setToolTip('')
+        self.task = ConversionTask(run, self)
+        self.task.finished.connect(self.on_batch_finished)
+        self.start_button.setEnabled(False)
+        self.clear_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self._update_timer.start()
+        self.task.start(self.thread_pool)
+        self.batch_started.emit()
+
+    def cancel_batch(self):
+        """取消批量转换"""
+        if self.task is not None:
+            self.task.cancel()
+            self.cancel_button.setEnabled(False)
+            self.summary_label.setText('正在取消...')
+
+    def process_updates(self, max_seconds=MAX_UPDATE_SECONDS):
+        """在主线程中处理后台线程提交的更新
+
+        Args:
+            max_seconds: 本次处理的最长时间 (秒)，为None时处理完所有更新
+        """
+        row_updates = []
+        deadline = None if max_seconds is None else time.monotonic() + max_seconds
+        while deadline is None or time.monotonic() < deadline:
+            try:
+                kind, value = self._updates.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'files':
+                self.model.add_files(value)
+            elif kind == 'discovered':
+                self._discovering -= 1
+            elif kind == 'start':
+                row, start_time = value
+                self._start_times[row] = start_time
+                row_updates.append((row, STATUS_RUNNING, None, None, ''))
+            elif kind == 'done':
+                row, success, message, size, end_time = value
+                start_time = self._start_times.pop(row, end_time)
+                if success:
+                    status = STATUS_DONE
+                elif self.task is not None and self.task.is_cancelled():
+                    status = STATUS_CANCELLED
+                else:
+                    status = STATUS_FAILED
+                row_updates.append((row, status, end_time - start_time, size, message))
+
+        self.model.update_rows(row_updates)
+        self.update_summary()
+
+        if self.task is None and not self._discovering and self._updates.empty():
+            self._update_timer.stop()
+
+    def on_batch_finished(self, success, message, seconds):
+        """批量转换结束"""
+        # 先处理完剩余的所有更新，再把未完成的行标记为已取消
+        self.process_updates(max_seconds=None)
+        cancelled = self.task.is_cancelled()
+        self.task.deleteLater()
+        self.task = None
+        # 停止定时刷新，避免之后的刷新覆盖下面写入的结果；仍在查找文件时继续刷新
+        if not self._discovering:
+            self._update_timer.stop()
+
+        if cancelled:
+            self.model.mark_unfinished(STATUS_CANCELLED)
+
+        self.start_button.setEnabled(True)
+        self.clear_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.update_summary()
+        result = '批量转换已取消' if cancelled else message
+        self.summary_label.setText(f'{self.summary_label.text()}（{result}，用时 {seconds:.1f} 秒）')
+        # 警告按内容合并计数后显示在提示中，不逐条列出
+        self.summary_label.setToolTip(self.warning_summary.format())
+        self.batch_finished.emit()
+
+    def update_summary(self):
+        """更新队列汇总信息"""
+        counts = self.model.count_by_status()
+        total = self.model.rowCount()
+        text = f'共 {total} 个文件：' + '，'.join(
+            f'{STATUS_LABELS[status]} {count}' for status, count in counts.items() if count
+        )
+        if self._discovering:
+            text += '（正在查找文件...）'
+        self.summary_label.setText(text)
+
+    def shutdown(self):
+        """取消批量转换并等待后台线程结束，关闭窗口时调用"""
+        if self.task is not None:
+            self.task.cancel()
+        self.thread_pool.waitForDone()
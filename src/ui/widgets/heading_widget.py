@@ -112,105 +112,3 @@ class HeadingWidget(QWidget):
                 controls['italic'].setChecked(heading_config.get('italic', False))
                 controls['underline'].setChecked(heading_config.get('underline', False))
                 controls['align'].setCurrentText(heading_config.get('align', '左对齐'))
-    
-    def apply_academic_template(self):
-        """应用学术论文模板"""
-        for level, controls in self.heading_configs.items():
-            level_num = int(level.replace("标题", ""))
-            if level_num == 1:
-                controls['size'].setValue(16)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            elif level_num == 2:
-                controls['size'].setValue(14)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            elif level_num == 3:
-                controls['size'].setValue(13)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            else:
-                controls['size'].setValue(12)
-                controls['bold'].setChecked(False)
-                controls['align'].setCurrentText("左对齐")
-    
-    def apply_report_template(self):
-        """应用报告模板"""
-        for level, controls in self.heading_configs.items():
-            level_num = int(level.replace("标题", ""))
-            if level_num == 1:
-                controls['size'].setValue(18)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            elif level_num == 2:
-                controls['size'].setValue(16)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            else:
-                controls['size'].setValue(14)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-    
-    def apply_novel_template(self):
-        """应用小说模板"""
-        for level, controls in self.heading_configs.items():
-            level_num = int(level.replace("标题", ""))
-            if level_num == 1:
-                controls['size'].setValue(20)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            elif level_num == 2:
-                controls['size'].setValue(16)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            else:
-                controls['size'].setValue(14)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-    
-    def apply_resume_template(self):
-        """应用简历模板"""
-        for level, controls in self.heading_configs.items():
-            level_num = int(level.replace("标题", ""))
-            if level_num == 1:
-                controls['size'].setValue(18)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            else:
-                controls['size'].setValue(14)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-    
-    def apply_letter_template(self):
-        """应用信函模板"""
-        for level, controls in self.heading_configs.items():
-            level_num = int(level.replace("标题", ""))
-            if level_num == 1:
-                controls['size'].setValue(16)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            else:
-                controls['size'].setValue(14)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-    
-    def load_default_config(self):
-        """加载默认配置"""
-        for level, controls in self.heading_configs.items():
-            level_num = int(level.replace("标题", ""))
-            if level_num == 1:
-                controls['size'].setValue(16)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            elif level_num == 2:
-                controls['size'].setValue(14)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            elif level_num == 3:
-                controls['size'].setValue(13)
-                controls['bold'].setChecked(True)
-                controls['align'].setCurrentText("左对齐")
-            else:
-                controls['size'].setValue(12)
-                controls['bold'].setChecked(False)
-                controls['align'].setCurrentText("左对齐")
\ No newline at end of file
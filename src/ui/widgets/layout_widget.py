@@ -254,24 +254,3 @@ class LayoutWidget(QWidget):
             self.figure_caption_bold_check.setChecked(figure_caption.get('bold', False))
             self.figure_caption_italic_check.setChecked(figure_caption.get('italic', True))
             self.figure_caption_position_combo.setCurrentText(figure_caption.get('position', '图片下方'))
-    
-    def load_default_config(self):
-        """加载默认配置"""
-        self.block_font_combo.setCurrentText('宋体')
-        self.table_caption_font_combo.setCurrentText('宋体')
-        self.table_caption_bold_check.setChecked(True)
-        self.table_font_combo.setCurrentText('宋体')
-        self.table_border_check.setChecked(True)
-        self.figure_caption_font_combo.setCurrentText('宋体')
-        self.figure_caption_italic_check.setChecked(True)
-        self.figure_caption_position_combo.setCurrentText('图片下方')
-        
-        # 设置默认水平线颜色
-        default_color = '#000000'
-        self.hr_color_button.setStyleSheet(f"background-color: {default_color}")
-        self.hr_color_button.setProperty('color', default_color)
-    
-    def apply_report_template(self):
-        """应用报告模板"""
-        self.table_caption_bold_check.setChecked(True)
-        self.table_font_size_spin.setValue(11)
\ No newline at end of file
@@ -123,8 +123,3 @@ class ListWidget(QWidget):
             self.unordered_bold_check.setChecked(unordered.get('bold', False))
             self.unordered_italic_check.setChecked(unordered.get('italic', False))
             self.unordered_format_combo.setCurrentText(unordered.get('format', '●'))
-    
-    def load_default_config(self):
-        """加载默认配置"""
-        self.ordered_font_combo.setCurrentText('宋体')
-        self.unordered_font_combo.setCurrentText('宋体')
\ No newline at end of file
@@ -172,16 +172,3 @@ class ReferenceWidget(QWidget):
             self.footnote_ref_superscript_check.setChecked(footnote_ref.get('superscript', True))
             self.footnote_ref_bold_check.setChecked(footnote_ref.get('bold', False))
             self.footnote_ref_italic_check.setChecked(footnote_ref.get('italic', False))
-    
-    def load_default_config(self):
-        """加载默认配置"""
-        self.link_font_combo.setCurrentText('宋体')
-        self.link_underline_check.setChecked(True)
-        self.footnote_font_combo.setCurrentText('宋体')
-        self.footnote_italic_check.setChecked(True)
-        self.footnote_ref_superscript_check.setChecked(True)
-        
-        # 设置默认链接颜色
-        default_color = '#0000FF'
-        self.link_color_button.setStyleSheet(f"background-color: {default_color}")
-        self.link_color_button.setProperty('color', default_color)
\ No newline at end of file
@@ -1,10 +1,24 @@
 """
 文件操作工具模块
-提供文件相关的辅助函数
+提供文件相关的辅助函数，文件对话框以外的函数不依赖Qt
 """
 
 import os
-from PyQt5.QtWidgets import QFileDialog
+import sys
+
+
+# 转换输出文件名的默认后缀；递归查找文件夹时跳过带此后缀的文件
+OUTPUT_SUFFIX = '_converted'
+
+# 递归查找文件夹时收录的输入文件扩展名。不包括 .json：文件夹中的json文件通常是
+# package.json 之类的配置文件而不是pandoc AST，需要转换时可以直接给出文件路径
+DISCOVER_EXTENSIONS = {
+    '.md', '.markdown', '.txt', '.html', '.htm', '.tex', '.latex', '.rst', '.org',
+    '.textile', '.docx', '.odt', '.epub', '.ipynb', '.dbk', '.rtf', '.typ',
+}
+
+# 文件名默认不区分大小写的平台：Windows，以及默认使用APFS/HFS+的macOS
+CASE_INSENSITIVE_PATHS = os.name == 'nt' or sys.platform == 'darwin'
 
 
 def get_file_path(parent, caption, file_filter="所有文件 (*.*)"):
@@ -18,6 +32,8 @@ def get_file_path(parent, caption, file_filter="所有文件 (*.*)"):
     Returns:
         str: 文件路径，如果取消则返回None
     """
+    from PyQt5.QtWidgets import QFileDialog
+    
     file_path, _ = QFileDialog.getOpenFileName(
         parent, caption, '', file_filter
     )
@@ -36,6 +52,8 @@ def get_save_file_path(parent, caption, file_filter="所有文件 (*.*)", defaul
     Returns:
         str: 文件路径，如果取消则返回None
     """
+    from PyQt5.QtWidgets import QFileDialog
+    
     file_path, _ = QFileDialog.getSaveFileName(
         parent, caption, '', file_filter
     )
@@ -95,7 +113,7 @@ def get_directory_path(file_path):
     return os.path.dirname(file_path)
 
 
-def generate_output_path(input_path, output_format, suffix="_converted"):
+def generate_output_path(input_path, output_format, suffix=OUTPUT_SUFFIX):
     """生成输出文件路径
     
     Args:
@@ -143,4 +161,97 @@ def get_project_root_dir(current_file):
         str: 项目根目录路径
     """
     # 获取当前文件所在目录的上一级目录
-    return os.path.dirname(os.path.dirname(os.path.abspath(current_file)))
\ No newline at end of file
+    return os.path.dirname(os.path.dirname(os.path.abspath(current_file)))
+
+
+def discover_files(paths, extensions=None):
+    """递归查找文件
+    
+    Args:
+        paths: 文件或目录路径列表，目录会被递归遍历
+        extensions: 允许的扩展名集合（包含点号，小写），为None时不过滤。
+                    直接给出的文件路径不受此限制
+        
+    Yields:
+        str: 找到的文件路径
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            if os.path.isfile(path):
+                yield path
+            continue
+        for dir_path, dir_names, file_names in os.walk(path):
+            # 跳过隐藏目录，并保持遍历顺序稳定
+            dir_names[:] = sorted(name for name in dir_names if not name.startswith('.'))
+            for file_name in sorted(file_names):
+                if extensions is None or get_file_extension(file_name) in extensions:
+                    yield os.path.join(dir_path, file_name)
+
+
+def discover_input_files(paths, extensions=DISCOVER_EXTENSIONS, output_suffix=OUTPUT_SUFFIX):
+    """递归查找待转换的输入文件
+    
+    文件夹中文件名以 output_suffix 结尾的文件是之前转换生成的输出，不会被收录，
+    重复转换同一文件夹时不会生成 *_converted_converted.* 文件。
+    
+    Args:
+        paths: 文件或目录路径列表，目录会被递归遍历
+        extensions: 允许的扩展名集合，直接给出的文件路径不受此限制
+        output_suffix: 输出文件名的后缀
+        
+    Yields:
+        str: 找到的文件路径
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield from discover_files([path])
+            continue
+        for file_path in discover_files([path], extensions):
+            if not get_file_name_without_extension(file_path).endswith(output_suffix):
+                yield file_path
+
+
+def path_key(path):
+    """获取用于判断两个路径是否为同一文件的键
+    
+    os.path.normcase 只在Windows上忽略大小写，macOS上默认的文件系统同样不区分大小写，
+    因此在 CASE_INSENSITIVE_PATHS 为True的平台上另外转为小写。
+    
+    Args:
+        path: 文件路径
+        
+    Returns:
+        str: 规范化的绝对路径
+    """
+    path = os.path.normcase(os.path.abspath(path))
+    return path.casefold() if CASE_INSENSITIVE_PATHS else path
+
+
+def find_output_conflicts(jobs):
+    """检查批量转换任务的输出路径冲突
+    
+    多个输入文件对应同一个输出文件（如 a.md 和 a.rst 都输出 a_converted.docx）时，
+    同时转换会互相覆盖；输出文件是本批次某个输入文件时，会覆盖尚未转换的输入。
+    在Windows和macOS上，只有大小写不同的路径视为同一个文件，见 path_key。
+    
+    Args:
+        jobs: [(input_file, output_file), ...]
+        
+    Returns:
+        dict: 有冲突的输入文件路径到冲突说明的映射，没有冲突时为空字典
+    """
+    inputs_by_output = {}
+    for input_file, output_file in jobs:
+        inputs_by_output.setdefault(path_key(output_file), []).append(input_file)
+    input_keys = {path_key(input_file) for input_file, _ in jobs}
+    
+    conflicts = {}
+    for input_file, output_file in jobs:
+        output_key = path_key(output_file)
+        sharing = inputs_by_output[output_key]
+        if len(sharing) > 1:
+            others = '、'.join(path for path in sharing if path != input_file)
+            conflicts[input_file] = f"输出文件 {output_file} 与 {others} 的输出相同"
+        elif output_key in input_keys:
+            conflicts[input_file] = f"输出文件 {output_file} 会覆盖输入文件"
+    return conflicts
@@ -0,0 +1,242 @@
+"""
+主线程卡顿检测模块
+环境变量 PANDOC_GUI_STALL_WATCHDOG 设置为毫秒数时启用：主线程的Qt事件循环
+超过该时间没有处理心跳定时器，就在后台线程中通过 sys._current_frames 采样主线程的
+Python调用栈，事件循环恢复后记录卡顿时长和造成卡顿的函数；未设置时不做任何事
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from collections import Counter, deque
+
+
+# 启用检测的环境变量，值为卡顿阈值 (毫秒)，非数字时使用默认阈值
+WATCHDOG_ENV = 'PANDOC_GUI_STALL_WATCHDOG'
+
+# 卡顿记录文件路径的环境变量（可选），每次卡顿追加一行JSON
+LOG_ENV = 'PANDOC_GUI_STALL_LOG'
+
+# 默认的卡顿阈值 (毫秒)
+DEFAULT_THRESHOLD_MS = 200
+
+# 主线程心跳间隔 (毫秒)，阈值较小时缩短为阈值的一半
+HEARTBEAT_INTERVAL_MS = 50
+
+# 内存中保留的卡顿记录数
+MAX_RECORDS = 100
+
+# 记录中保留的调用栈层数
+MAX_STACK_FRAMES = 30
+
+# 应用代码所在目录，调用栈中只有这些目录下的函数会被当作造成卡顿的函数
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_threshold_ms():
+    """读取环境变量中的卡顿阈值 (毫秒)，未启用时返回None"""
+    value = os.environ.get(WATCHDOG_ENV, '').strip()
+    if not value or value == '0':
+        return None
+    try:
+        return max(1.0, float(value))
+    except ValueError:
+        return float(DEFAULT_THRESHOLD_MS)
+
+
+def _frame_info(frame):
+    """返回 (函数限定名, 文件路径, 行号)"""
+    code = frame.f_code
+    return getattr(code, 'co_qualname', code.co_name), code.co_filename, frame.f_lineno
+
+
+class StallWatchdog:
+    """主线程卡顿检测
+
+    主线程中的定时器定期更新心跳时间，后台线程发现心跳比预定时间晚了超过阈值时，
+    对主线程的调用栈采样；心跳恢复后由主线程汇总采样结果并记录一次卡顿，
+    卡顿时长为心跳比预定时间晚的时间。
+    主线程在不释放GIL的扩展代码中卡住时无法采样，此时只记录卡顿时长。
+    """
+
+    def __init__(self, threshold_ms=DEFAULT_THRESHOLD_MS, log_path=None, roots=None):
+        """
+        Args:
+            threshold_ms: 卡顿阈值 (毫秒)
+            log_path: 卡顿记录文件路径（可选），每次卡顿追加一行JSON
+            roots: 应用代码所在目录列表（可选），默认为 src 目录
+        """
+        self.threshold = threshold_ms / 1000
+        self.interval = min(HEARTBEAT_INTERVAL_MS, max(10, threshold_ms / 2)) / 1000
+        self.log_path = log_path
+        self.roots = [os.path.abspath(root) for root in (roots or [SRC_DIR])]
+        self.records = deque(maxlen=MAX_RECORDS)
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._timer = None
+        self._main_ident = None
+        self._last_beat = time.monotonic()
+        self._samples = Counter()
+        self._first_stack = None
+        self._sample_count = 0
+
+    def start(self):
+        """开始检测，需要在主线程中调用"""
+        if self._thread is not None:
+            return
+        from PyQt5.QtCore import QTimer
+
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._timer = QTimer()
+        self._timer.setInterval(int(self.interval * 1000))
+        self._timer.timeout.connect(self._beat)
+        self._timer.start()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name='stall-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止检测"""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self):
+        """在主线程中更新心跳，比预定时间晚了超过阈值时记录一次卡顿"""
+        now = time.monotonic()
+        with self._lock:
+            delay = now - self._last_beat - self.interval
+            self._last_beat = now
+            samples, self._samples = self._samples, Counter()
+            first_stack, self._first_stack = self._first_stack, None
+            sample_count, self._sample_count = self._sample_count, 0
+
+        if delay >= self.threshold:
+            self._report(delay, samples, first_stack, sample_count)
+
+    def _watch(self):
+        """后台线程：心跳超时时采样主线程调用栈"""
+        while not self._stop.wait(self.interval / 2):
+            if not self._stalled():
+                continue
+
+            frame = sys._current_frames().get(self._main_ident)
+            if frame is None:
+                continue
+            stack = self._extract_stack(frame)
+            del frame
+            culprit = self._find_culprit(stack)
+
+            with self._lock:
+                # 采样期间主线程可能已经恢复，此时丢弃本次采样
+                if not self._stalled():
+                    continue
+                self._sample_count += 1
+                if culprit is not None:
+                    self._samples[culprit] += 1
+                if self._first_stack is None:
+                    self._first_stack = stack
+
+    def _stalled(self):
+        return time.monotonic() - self._last_beat - self.interval >= self.threshold
+
+    def _extract_stack(self, frame):
+        """提取调用栈，从外到内排列"""
+        stack = []
+        while frame is not None:
+            stack.append(_frame_info(frame))
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def _is_app_frame(self, filename):
+        path = os.path.abspath(filename)
+        if path == os.path.abspath(__file__):
+            return False
+        return any(path.startswith(root + os.sep) for root in self.roots)
+
+    def _find_culprit(self, stack):
+        """调用栈中最内层的应用函数，返回 (函数限定名, 位置) ，没有时返回None"""
+        for name, filename, lineno in reversed(stack):
+            if self._is_app_frame(filename):
+                return name, f'{self._relative(filename)}:{lineno}'
+        return None
+
+    def _entry_point(self, stack):
+        """调用栈中最外层的应用函数，跳过入口文件中调用 app.exec_() 的函数，
+        即事件循环直接调用的槽函数或事件处理函数"""
+        main_file = getattr(sys.modules.get('__main__'), '__file__', None)
+        main_file = os.path.abspath(main_file) if main_file else None
+        for name, filename, _ in stack:
+            if self._is_app_frame(filename) and os.path.abspath(filename) != main_file:
+                return name
+        return None
+
+    def _relative(self, filename):
+        for root in self.roots:
+            if os.path.abspath(filename).startswith(root + os.sep):
+                return os.path.relpath(filename, root).replace(os.sep, '/')
+        return filename
+
+    def _report(self, delay, samples, first_stack, sample_count):
+        """记录一次卡顿"""
+        record = {
+            'time': round(time.time(), 3),
+            'duration_ms': round(delay * 1000, 1),
+            'function': None,
+            'location': None,
+            'entry': None,
+            'samples': sample_count,
+        }
+        if samples:
+            (function, location), _ = samples.most_common(1)[0]
+            record['function'] = function
+            record['location'] = location
+        if first_stack:
+            record['entry'] = self._entry_point(first_stack)
+            record['stack'] = [
+                f'{self._relative(filename)}:{lineno} {name}'
+                for name, filename, lineno in first_stack[-MAX_STACK_FRAMES:]
+            ]
+        self.records.append(record)
+
+        where = record['function'] or '未知位置'
+        if record['location']:
+            where += f" ({record['location']})"
+        print(f"主线程卡顿 {record['duration_ms']:.0f} ms：{where}", file=sys.stderr)
+
+        if self.log_path:
+            try:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            except OSError:
+                pass
+
+
+_watchdog = None
+
+
+def install():
+    """按环境变量启用卡顿检测，需要在创建QApplication之后在主线程中调用
+
+    Returns:
+        StallWatchdog: 启用时返回检测器，未启用时返回None
+    """
+    global _watchdog
+    threshold_ms = get_threshold_ms()
+    if threshold_ms is None:
+        return None
+    if _watchdog is None:
+        _watchdog = StallWatchdog(threshold_ms, os.environ.get(LOG_ENV))
+        _watchdog.start()
+    return _watchdog
@@ -0,0 +1,86 @@
+"""
+启动耗时记录模块
+环境变量 PANDOC_GUI_STARTUP_TRACE 设置为文件路径时，记录启动各阶段的时间戳，
+供启动性能测试使用；未设置时所有函数都不做任何事
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+
+
+# 记录文件路径的环境变量
+TRACE_ENV = 'PANDOC_GUI_STARTUP_TRACE'
+
+# 设置后在主窗口首次绘制时退出程序，便于重复测量
+EXIT_ENV = 'PANDOC_GUI_STARTUP_EXIT'
+
+_trace_file = os.environ.get(TRACE_ENV)
+_marks = []
+
+
+def is_enabled():
+    """是否启用了启动耗时记录"""
+    return bool(_trace_file)
+
+
+def mark(phase, timestamp=None):
+    """记录启动阶段的时间戳
+
+    使用系统时间，便于与启动本进程的测试程序记录的时间比较。
+
+    Args:
+        phase: 阶段名称
+        timestamp: 时间戳（可选），默认为当前时间
+    """
+    if _trace_file:
+        _marks.append((phase, time.time() if timestamp is None else timestamp))
+
+
+def flush():
+    """把已记录的时间戳追加写入记录文件，每个进程一行JSON"""
+    if not _trace_file or not _marks:
+        return
+    record = {
+        'pid': os.getpid(),
+        'frozen': bool(getattr(sys, 'frozen', False)),
+        'marks': list(_marks),
+    }
+    try:
+        with open(_trace_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    except OSError:
+        return
+    _marks.clear()
+
+
+def watch_first_paint(window):
+    """在窗口首次绘制时记录 first_paint 并写入记录文件
+
+    设置了 PANDOC_GUI_STARTUP_EXIT 时随后退出程序。
+
+    Args:
+        window: 主窗口
+    """
+    if not _trace_file:
+        return
+
+    from PyQt5.QtCore import QObject, QEvent, QCoreApplication
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                mark('first_paint')
+                flush()
+                if os.environ.get(EXIT_ENV):
+                    QCoreApplication.exit(0)
+            return False
+
+    window.installEventFilter(FirstPaintFilter(window))
+
+
+if _trace_file:
+    atexit.register(flush)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+测试异步转换器的并发限制、批量转换和超时
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import os
+import sys
+import asyncio
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.async_converter import AsyncPandocConverter
+
+
+# 模拟的pandoc：运行期间在同目录下的 running 目录中留下以进程号命名的标记，并在 peak 文件中记录同时运行的进程数；
+# 输入内容为 fail 时失败，为 slow 时等待较长时间
+FAKE_PANDOC = '''import os, sys, time
+args = sys.argv[1:]
+if args == ['--version']:
+    print('pandoc 3.1.0')
+    sys.exit(0)
+here = os.path.dirname(os.path.abspath(__file__))
+running = os.path.join(here, 'running')
+os.makedirs(running, exist_ok=True)
+marker = os.path.join(running, str(os.getpid()))
+open(marker, 'w').close()
+with open(os.path.join(here, 'peak'), 'a') as f:
+    f.write(str(len(os.listdir(running))) + '\\n')
+source, target = args[0], args[args.index('-o') + 1]
+data = open(source, 'rb').read().strip()
+time.sleep(10 if data == b'slow' else 0.2)
+os.remove(marker)
+if data == b'fail':
+    sys.stderr.write('bad input\\n')
+    sys.exit(64)
+open(target, 'wb').write(data)
+'''
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def _peak(directory):
+    with open(os.path.join(directory, 'peak'), 'r', encoding='utf-8') as f:
+        return max(int(line) for line in f)
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_converter_created_outside_event_loop(fake_pandoc):
+    """转换器在事件循环外创建后，可以在多个事件循环中使用"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = AsyncPandocConverter(pandoc, max_concurrency=1)
+    input_file = _write(directory, 'a.md', 'text')
+
+    for name in ('a.html', 'b.html'):
+        success, message = asyncio.run(converter.convert_file(input_file, os.path.join(directory, name)))
+        assert success, message
+
+
+def test_convert_many_limits_concurrency(fake_pandoc):
+    """批量转换按需读取任务，同时运行的子进程数不超过上限，失败的任务不影响其他任务"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = AsyncPandocConverter(pandoc, max_concurrency=2)
+    input_file = _write(directory, 'a.md', 'text')
+    bad_file = _write(directory, 'bad.md', 'fail')
+    consumed = []
+
+    def jobs():
+        for index in range(6):
+            consumed.append(index)
+            source = bad_file if index == 3 else input_file
+            yield source, os.path.join(directory, f'{index}.html')
+
+    async def run():
+        results = []
+        async for result in converter.convert_many(jobs()):
+            if not results:
+                # 第一个结果产出时，只取出了正在运行和刚开始的任务
+                assert len(consumed) <= 4, consumed
+            results.append(result)
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(results) == 6
+    failed = [job for job, success, message in results if not success]
+    assert failed == [(bad_file, os.path.join(directory, '3.html'))]
+    assert _peak(directory) <= 2
+
+
+def test_timeout_and_early_stop(fake_pandoc):
+    """超时的任务返回失败；提前停止迭代时终止正在运行的子进程"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = AsyncPandocConverter(pandoc, max_concurrency=2)
+    slow_file = _write(directory, 'slow.md', 'slow')
+
+    success, message = asyncio.run(
+        converter.convert_file(slow_file, os.path.join(directory, 'slow.html'), timeout=0.5)
+    )
+    assert not success and '超时' in message
+
+    async def first_result():
+        jobs = [(slow_file, os.path.join(directory, f'{index}.html')) for index in range(4)]
+        jobs.insert(0, (_write(directory, 'a.md', 'text'), os.path.join(directory, 'a.html')))
+        async for result in converter.convert_many(jobs):
+            return result
+
+    assert asyncio.run(asyncio.wait_for(first_result(), 5))[1]
+    # 被终止的进程来不及删除标记，标记对应的进程都应已退出
+    for pid in os.listdir(os.path.join(directory, 'running')):
+        assert not _is_alive(int(pid)), pid
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+测试批量转换队列组件
+界面部分使用 offscreen 平台，不需要显示器；转换由模拟的转换器完成
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from PyQt5.QtWidgets import QApplication
+
+from ui.widgets import batch_queue_widget
+from ui.widgets.batch_queue_widget import BatchQueueWidget, STATUS_DONE, STATUS_FAILED
+
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class FakeConverter:
+    """立即完成所有任务的转换器，文件名中含有 bad 的任务失败"""
+
+    def __init__(self):
+        # 开始转换的输入文件
+        self.started = []
+
+    def convert_many(self, jobs, max_workers=None, profile=None, cancel_event=None,
+                     on_start=None, warning_summary=None):
+        for job in jobs:
+            on_start(job)
+            self.started.append(job['input_file'])
+            if 'bad' in job['input_file']:
+                yield job, False, '转换失败'
+            else:
+                yield job, True, '转换成功'
+
+
+def _run_batch(widget, timeout=30.0):
+    finished = []
+    widget.batch_finished.connect(lambda: finished.append(True))
+    widget.start_batch()
+    deadline = time.monotonic() + timeout
+    while not finished and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert finished, '批量转换没有结束'
+
+
+def test_finish_applies_all_updates():
+    """批量转换结束时处理完所有排队的更新，停止定时刷新后写入结果"""
+    interval = batch_queue_widget.UPDATE_INTERVAL_MS
+    # 定时刷新在测试期间不会触发，所有更新都留到结束时处理
+    batch_queue_widget.UPDATE_INTERVAL_MS = 60 * 60 * 1000
+    try:
+        widget = BatchQueueWidget(FakeConverter(), lambda: ('html', None, None))
+    finally:
+        batch_queue_widget.UPDATE_INTERVAL_MS = interval
+
+    paths = [f'/tmp/batch/{index}.md' for index in range(20000)] + ['/tmp/batch/bad.md']
+    widget.model.add_files(paths)
+    _run_batch(widget)
+
+    counts = widget.model.count_by_status()
+    assert counts[STATUS_DONE] == 20000 and counts[STATUS_FAILED] == 1, counts
+    assert not widget._update_timer.isActive()
+    assert '转换成功 20000 个，失败 1 个' in widget.summary_label.text()
+    assert widget._updates.empty()
+
+
+
+def test_output_collisions_are_marked_failed():
+    """输出路径冲突或会覆盖队列中其他输入的文件标记为失败，不参与转换"""
+    converter = FakeConverter()
+    widget = BatchQueueWidget(converter, lambda: ('markdown', None, None))
+    names = ['a.md', 'a.rst', 'b.txt', 'c.txt', 'c_converted.md']
+    paths = [os.path.abspath(f'/tmp/collide/{name}') for name in names]
+    widget.model.add_files(paths)
+
+    _run_batch(widget)
+
+    assert converter.started == [paths[2], paths[4]]
+    rows = {path: widget.model._rows[row] for row, path in enumerate(paths)}
+    for path in (paths[0], paths[1], paths[3]):
+        assert rows[path][1] == STATUS_FAILED
+    assert '与' in rows[paths[0]][4] and paths[1] in rows[paths[0]][4]
+    assert '覆盖' in rows[paths[3]][4]
+    assert '转换成功 2 个，失败 3 个' in widget.summary_label.text()
+
+
+def test_discover_skips_previous_outputs(tmp_path):
+    """添加文件夹时跳过之前转换生成的输出和不是文档的json文件"""
+    for name in ('a.md', 'a_converted.html', 'package.json', 'b.html'):
+        (tmp_path / name).write_text('x', encoding='utf-8')
+    widget = BatchQueueWidget(FakeConverter(), lambda: ('html', None, None))
+
+    widget.add_paths([str(tmp_path)])
+    deadline = time.monotonic() + 30
+    while widget._discovering and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+    paths = [path for _, path in widget.model.pending_rows()]
+    assert paths == [str(tmp_path / 'a.md'), str(tmp_path / 'b.html')]
+
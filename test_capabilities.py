@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+测试pandoc能力探测和缓存
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import os
+import sys
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core import capabilities
+from core.capabilities import (
+    get_capabilities, load_capabilities, get_output_formats, COMMON_OUTPUT_FORMATS
+)
+
+
+# 模拟的pandoc：每次调用在同目录下的 calls 文件中追加一行，输出格式列表末尾附加版本号
+FAKE_PANDOC = '''import os, sys
+here = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(here, 'calls'), 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+VERSION = '{version}'
+arg = sys.argv[1]
+if arg == '--version':
+    print('pandoc ' + VERSION)
+elif arg == '--list-extensions':
+    print('+smart')
+    print('-east_asian_line_breaks')
+elif arg == '--list-input-formats':
+    print('markdown')
+    print('docx')
+elif arg == '--list-output-formats':
+    print('html')
+    print('docx')
+    print('zz' + VERSION.replace('.', ''))
+'''
+
+
+def _pandoc_calls(directory):
+    try:
+        with open(os.path.join(directory, 'calls'), 'r', encoding='utf-8') as f:
+            return len(f.readlines())
+    except FileNotFoundError:
+        return 0
+
+
+def test_probe_and_disk_cache(fake_pandoc):
+    """探测结果写入磁盘缓存，清空内存后从磁盘读取，不再调用pandoc"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC.format(version='3.1'))
+    assert load_capabilities(pandoc) is None
+    assert get_output_formats(pandoc) == COMMON_OUTPUT_FORMATS
+
+    result = get_capabilities(pandoc)
+    assert result['version'] == 'pandoc 3.1'
+    assert result['extensions'] == {'smart': True, 'east_asian_line_breaks': False}
+    assert get_output_formats(pandoc) == ['docx', 'pdf', 'html', 'zz31']
+    calls = _pandoc_calls(directory)
+
+    capabilities._registry.clear()
+    assert load_capabilities(pandoc) == result
+    assert get_capabilities(pandoc) == result
+    assert _pandoc_calls(directory) == calls
+
+
+def test_replaced_pandoc_invalidates_cache(fake_pandoc):
+    """pandoc可执行文件被替换后缓存失效，重新探测"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC.format(version='3.1'))
+    get_capabilities(pandoc)
+
+    fake_pandoc(FAKE_PANDOC.format(version='3.2.1'), directory)
+    assert load_capabilities(pandoc) is None
+    assert get_capabilities(pandoc)['version'] == 'pandoc 3.2.1'
+    assert 'zz321' in get_output_formats(pandoc)
+
+
+def test_pdf_kept_as_pseudo_writer(fake_pandoc, monkeypatch):
+    """探测结果不列出pdf，但支持html或latex等格式时输出格式列表仍包含pdf"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC.format(version='3.1'))
+    assert 'pdf' not in get_capabilities(pandoc)['output_formats']
+    assert 'pdf' in get_output_formats(pandoc)
+
+    monkeypatch.setattr(capabilities, 'load_capabilities',
+                        lambda path: {'output_formats': ['latex', 'docx']})
+    assert get_output_formats(pandoc) == ['docx', 'pdf', 'latex']
+
+    monkeypatch.setattr(capabilities, 'load_capabilities',
+                        lambda path: {'output_formats': ['docx', 'plain']})
+    assert 'pdf' not in get_output_formats(pandoc)
+
+
+def test_missing_pandoc(fake_pandoc):
+    """pandoc不存在时不缓存，返回默认格式列表"""
+    directory, _ = fake_pandoc(FAKE_PANDOC.format(version='3.1'))
+    missing = os.path.join(directory, 'missing')
+
+    assert get_capabilities(missing) is None
+    assert get_output_formats(missing) == COMMON_OUTPUT_FORMATS
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+测试命令行入口
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import signal
+import zipfile
+import threading
+import contextlib
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import cli
+from utils import file_utils
+
+
+# 模拟的pandoc：把输入加上 "<输出格式>:" 前缀写入输出文件，输入内容为 fail 时失败，为 slow 时一直运行
+FAKE_PANDOC = '''import os, sys, time
+args = sys.argv[1:]
+if args == ['--version']:
+    print('pandoc 3.1.0')
+    sys.exit(0)
+source, target = args[0], args[args.index('-o') + 1]
+data = open(source, 'rb').read()
+if data.strip() == b'fail':
+    sys.stderr.write('bad input\\n')
+    sys.exit(64)
+if data.strip() == b'slow':
+    time.sleep(30)
+to = args[args.index('-t') + 1] if '-t' in args else os.path.splitext(target)[1].lstrip('.')
+open(target, 'wb').write(to.encode() + b':' + data)
+'''
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def _run(argv):
+    """运行命令行入口，返回 (退出码, 标准输出, 标准错误)"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        code = cli.main(argv)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_convert_directory_to_output_dir(fake_pandoc):
+    """递归转换目录，输出目录保持相对结构，--json 输出每个文件的结果"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    source = os.path.join(directory, 'docs')
+    _write(os.path.join(source, 'a.md'), 'a')
+    _write(os.path.join(source, 'sub', 'b.rst'), 'b')
+    _write(os.path.join(source, 'notes.xyz'), 'ignored')
+    output_dir = os.path.join(directory, 'out')
+
+    code, stdout, _ = _run(['convert', source, '-t', 'html', '-o', output_dir, '-j', '2',
+                            '--pandoc', pandoc, '--json'])
+
+    assert code == cli.EXIT_OK
+    summary = json.loads(stdout)
+    assert (summary['files'], summary['succeeded'], summary['failed']) == (2, 2, 0)
+    with open(os.path.join(output_dir, 'sub', 'b.html'), 'rb') as f:
+        assert f.read() == b'html:b'
+    assert os.path.exists(os.path.join(output_dir, 'a.html'))
+
+
+def test_convert_next_to_input_skips_previous_outputs(fake_pandoc):
+    """未指定输出目录时输出到输入文件旁边，遍历目录时跳过之前生成的输出"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    source = os.path.join(directory, 'docs')
+    _write(os.path.join(source, 'a.md'), 'a')
+    _write(os.path.join(source, 'old_converted.md'), 'old')
+
+    code, _, _ = _run(['convert', source, '-t', 'html', '--pandoc', pandoc, '-q', '--no-cache'])
+
+    assert code == cli.EXIT_OK
+    assert sorted(os.listdir(source)) == ['a.md', 'a_converted.html', 'old_converted.md']
+
+
+def test_repeated_runs_skip_outputs(fake_pandoc):
+    """重复转换同一目录时不会把上次的输出或package.json之类的文件当作输入"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    source = os.path.join(directory, 'docs')
+    _write(os.path.join(source, 'a.md'), 'a')
+    _write(os.path.join(source, 'package.json'), '{}')
+    for _ in range(2):
+        code, _, _ = _run(['convert', source, '-t', 'html', '--pandoc', pandoc, '-q', '--no-cache'])
+        assert code == cli.EXIT_OK
+    assert sorted(os.listdir(source)) == ['a.md', 'a_converted.html', 'package.json']
+
+    # 输出目录位于输入目录中时，其中的文件不作为输入
+    source = os.path.join(directory, 'site')
+    _write(os.path.join(source, 'a.md'), 'a')
+    output_dir = os.path.join(source, 'out')
+    for _ in range(2):
+        code, _, _ = _run(['convert', source, '-t', 'html', '-o', output_dir,
+                           '--pandoc', pandoc, '-q', '--no-cache'])
+        assert code == cli.EXIT_OK
+    assert os.listdir(output_dir) == ['a.html']
+
+    # 输出到输入目录本身时，上次的输出是本批次其他文件的输出，同样跳过
+    for _ in range(2):
+        code, _, _ = _run(['convert', source, '-t', 'html', '-o', source,
+                           '--pandoc', pandoc, '-q', '--no-cache'])
+        assert code == cli.EXIT_OK
+    assert sorted(os.listdir(source)) == ['a.html', 'a.md', 'out']
+
+
+def test_failed_file_sets_exit_code(fake_pandoc):
+    """有文件转换失败时退出码为1，其他文件照常转换"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    good = _write(os.path.join(directory, 'good.md'), 'ok')
+    bad = _write(os.path.join(directory, 'bad.md'), 'fail')
+
+    code, stdout, _ = _run(['convert', good, bad, '-t', 'html', '--pandoc', pandoc])
+
+    assert code == cli.EXIT_FAILED
+    assert 'bad input' in stdout
+    assert os.path.exists(os.path.join(directory, 'good_converted.html'))
+
+
+def test_output_name_collision_is_rejected(fake_pandoc):
+    """a.md 和 a.rst 对应同一个输出文件时报错，不转换任何文件"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    source = os.path.join(directory, 'docs')
+    _write(os.path.join(source, 'a.md'), 'md')
+    _write(os.path.join(source, 'a.rst'), 'rst')
+    output_dir = os.path.join(directory, 'out')
+
+    code, _, stderr = _run(['convert', source, '-o', output_dir, '--pandoc', pandoc])
+
+    assert code == cli.EXIT_USAGE
+    assert 'a.docx' in stderr
+    assert not os.path.exists(output_dir)
+
+    # 输出文件会覆盖输入文件时同样报错
+    code, _, stderr = _run(['convert', os.path.join(source, 'a.md'), '-t', 'markdown',
+                            '-o', source, '--pandoc', pandoc])
+    assert code == cli.EXIT_USAGE
+    assert '覆盖' in stderr
+
+
+def test_collision_ignores_case_on_case_insensitive_platforms(monkeypatch):
+    """Windows和macOS上只有大小写不同的输出路径视为冲突，其他平台上是不同的文件"""
+    jobs = [('/docs/A.md', '/out/A.docx'), ('/docs/sub/a.md', '/out/a.docx')]
+
+    monkeypatch.setattr(file_utils, 'CASE_INSENSITIVE_PATHS', True)
+    assert set(file_utils.find_output_conflicts(jobs)) == {'/docs/A.md', '/docs/sub/a.md'}
+
+    monkeypatch.setattr(file_utils, 'CASE_INSENSITIVE_PATHS', False)
+    if os.path.normcase('A') == 'A':
+        assert file_utils.find_output_conflicts(jobs) == {}
+
+
+def test_interrupt_cancels_running_conversions(fake_pandoc):
+    """按下Ctrl-C时终止正在运行的pandoc，不等待其自行结束"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    inputs = [_write(os.path.join(directory, f'{index}.md'), 'slow') for index in range(2)]
+    main_thread = threading.main_thread().ident
+    threading.Timer(0.5, signal.pthread_kill, (main_thread, signal.SIGINT)).start()
+
+    start = time.monotonic()
+    code, _, stderr = _run(['convert', *inputs, '-t', 'html', '-j', '2', '--pandoc', pandoc,
+                            '--no-cache'])
+    elapsed = time.monotonic() - start
+
+    assert code == cli.EXIT_INTERRUPTED
+    assert '已取消' in stderr
+    assert elapsed < 10, elapsed
+    assert not os.path.exists(os.path.join(directory, '0_converted.html'))
+
+
+def test_template_subcommand(fake_pandoc):
+    """template 子命令按预设模板导出参考文档，预设不存在时返回参数错误"""
+    directory, _ = fake_pandoc(FAKE_PANDOC)
+    output = os.path.join(directory, 'report.docx')
+
+    code, stdout, _ = _run(['template', '--preset', 'report', '-o', output])
+    assert code == cli.EXIT_OK
+    assert 'report.docx' in stdout
+    with zipfile.ZipFile(output) as archive:
+        assert 'word/styles.xml' in archive.namelist()
+
+    config = _write(os.path.join(directory, 'config.json'), '[1, 2]')
+    code, _, stderr = _run(['template', '--config', config, '-o', output])
+    assert code == cli.EXIT_USAGE
+    assert 'JSON对象' in stderr
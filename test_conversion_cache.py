@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+测试转换缓存
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import os
+import sys
+import time
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.pandoc_converter import PandocConverter
+from core.conversion_cache import ConversionCache
+
+
+# 模拟的pandoc：每次转换在同目录下的 calls 文件中追加一行，把输入和 --css 文件的内容写入输出；
+# 输出为docx且输入中含有图片引用时，按 --verbose 报告读取了图片
+FAKE_PANDOC = '''import os, sys
+args = sys.argv[1:]
+if args == ['--version']:
+    print('pandoc 3.1.0')
+    sys.exit(0)
+here = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(here, 'calls'), 'a') as f:
+    f.write(' '.join(args) + '\\n')
+source, target = args[0], args[args.index('-o') + 1]
+data = open(source, 'rb').read()
+if '--css' in args:
+    data += open(args[args.index('--css') + 1], 'rb').read()
+if b'![' in data and target.endswith('.docx') and '--verbose' in args:
+    sys.stderr.write('[INFO] Loaded image.png from image.png\\n')
+sys.stderr.write('[INFO] Not rendering RawBlock\\n')
+open(target, 'wb').write(data)
+'''
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def _pandoc_calls(directory):
+    try:
+        with open(os.path.join(directory, 'calls'), 'r', encoding='utf-8') as f:
+            return len(f.readlines())
+    except FileNotFoundError:
+        return 0
+
+
+def test_hit_and_miss(fake_pandoc):
+    """相同的输入和选项命中缓存，输入内容变化后重新转换"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    cache = ConversionCache(os.path.join(directory, 'cache'))
+    converter = PandocConverter(pandoc, cache=cache)
+    input_file = _write(directory, 'a.md', 'one')
+
+    first = converter.convert_file(input_file, os.path.join(directory, 'a.html'))
+    second = converter.convert_file(input_file, os.path.join(directory, 'b.html'))
+
+    assert first.backend == 'subprocess' and second.backend == 'cache'
+    assert first.warnings == []
+    with open(os.path.join(directory, 'b.html'), 'rb') as f:
+        assert f.read() == b'one'
+
+    _write(directory, 'a.md', 'two')
+    third = converter.convert_file(input_file, os.path.join(directory, 'c.html'))
+    assert third.backend == 'subprocess'
+    assert _pandoc_calls(directory) == 2
+    assert cache.stats()['hits'] == 1
+
+
+def test_embedded_local_files_are_not_cached(fake_pandoc):
+    """pandoc报告读取了本地图片的转换结果不存入缓存，只链接图片的html可以缓存"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, cache=ConversionCache(os.path.join(directory, 'cache')))
+    input_file = _write(directory, 'a.md', '![](image.png)')
+
+    for _ in range(2):
+        result = converter.convert_file(input_file, os.path.join(directory, 'a.docx'))
+        assert result.backend == 'subprocess'
+    for _ in range(2):
+        result = converter.convert_file(input_file, os.path.join(directory, 'a.html'))
+    assert result.backend == 'cache'
+    assert _pandoc_calls(directory) == 3
+
+
+def test_option_files_are_part_of_key(fake_pandoc):
+    """选项中引用的文件内容变化后不会命中旧的缓存"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, cache=ConversionCache(os.path.join(directory, 'cache')))
+    input_file = _write(directory, 'a.md', 'text')
+    css = _write(directory, 'style.css', 'red')
+    output_file = os.path.join(directory, 'a.html')
+
+    converter.convert_file(input_file, output_file, extra_args=['--css', css])
+    _write(directory, 'style.css', 'blue')
+    result = converter.convert_file(input_file, output_file, extra_args=['--css', css])
+
+    assert result.backend == 'subprocess'
+    with open(output_file, 'rb') as f:
+        assert f.read() == b'textblue'
+
+    result = converter.convert_file(input_file, output_file, extra_args=['--embed-resources'])
+    result = converter.convert_file(input_file, output_file, extra_args=['--embed-resources'])
+    assert result.backend == 'subprocess'
+
+
+def test_options_writing_extra_files_are_not_cached(fake_pandoc):
+    """--extract-media 和 --log 会在输出文件之外写入文件，使用时不缓存"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, cache=ConversionCache(os.path.join(directory, 'cache')))
+    input_file = _write(directory, 'a.docx', 'text')
+    output_file = os.path.join(directory, 'a.html')
+    media_dir = os.path.join(directory, 'media')
+
+    for extra_args in (['--extract-media', media_dir], [f'--extract-media={media_dir}'],
+                       ['--log', os.path.join(directory, 'log.json')]):
+        for _ in range(2):
+            result = converter.convert_file(input_file, output_file, extra_args=extra_args)
+            assert result.backend == 'subprocess', extra_args
+    assert _pandoc_calls(directory) == 6
+
+
+def test_lru_eviction(tmp_path):
+    """超出容量上限时淘汰最近最少使用的条目"""
+    directory = str(tmp_path)
+    cache = ConversionCache(os.path.join(directory, 'cache'), max_bytes=250)
+    keys = []
+    for index in range(3):
+        source = _write(directory, f'{index}.out', str(index) * 100)
+        key = f'{index:02d}' + 'a' * 62
+        cache.store(key, source)
+        keys.append(key)
+        # 修改时间作为最近使用时间，间隔一段时间以保证顺序
+        os.utime(cache._entry_path(key), (time.time() - 10 + index, time.time() - 10 + index))
+
+    target = os.path.join(directory, 'target')
+    assert not cache.fetch(keys[0], target)
+    assert cache.fetch(keys[1], target)
+    assert cache.fetch(keys[2], target)
+    assert cache.stats()['bytes'] <= 250
+
+
+def test_fetch_copies_entry(tmp_path):
+    """命中时复制缓存条目，之后改写输出文件不影响缓存内容"""
+    directory = str(tmp_path)
+    source = _write(directory, 'source', 'data')
+    key = 'ab' * 32
+
+    cache = ConversionCache(os.path.join(directory, 'cache'))
+    cache.store(key, source)
+    target = os.path.join(directory, 'target')
+    assert cache.fetch(key, target)
+    assert not os.path.samefile(target, cache._entry_path(key))
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write('edited')
+
+    assert cache.fetch(key, os.path.join(directory, 'again'))
+    with open(os.path.join(directory, 'again'), 'r', encoding='utf-8') as f:
+        assert f.read() == 'data'
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+测试转换结果的指标记录
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import io
+import os
+import sys
+import json
+import asyncio
+import threading
+
+import pytest
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.pandoc_converter import PandocConverter
+from core.async_converter import AsyncPandocConverter
+from core.conversion_metrics import ConversionResult, JsonlMetricsSink, PrometheusTextfileSink
+from core.pandoc_log import PandocWarning
+
+
+# 模拟的pandoc：把输入复制到输出，输出一条警告；输入内容为 fail 时失败，为 slow 时一直运行
+FAKE_PANDOC = '''import sys, time
+args = sys.argv[1:]
+source, target = args[0], args[args.index('-o') + 1]
+data = open(source, 'rb').read()
+if data.strip() == b'fail':
+    sys.stderr.write('bad input\\n')
+    sys.exit(64)
+if data.strip() == b'slow':
+    time.sleep(30)
+ballast = bytearray(32 * 1024 * 1024)
+sys.stderr.write('[WARNING] Could not fetch resource missing.png\\n')
+open(target, 'wb').write(data * 2)
+'''
+
+# 模拟的pandoc：输出为输入重复两次，输出文件为 - 时写入标准输出
+FAKE_STREAM_PANDOC = '''import sys
+args = sys.argv[1:]
+target = args[args.index('-o') + 1]
+if target == '-':
+    data = sys.stdin.buffer.read()
+    sys.stdout.buffer.write(data * 2)
+else:
+    data = open(args[0], 'rb').read()
+    open(target, 'wb').write(data * 2)
+'''
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def test_result_unpacks_like_tuple():
+    """转换结果可以像 (success, message) 元组一样使用"""
+    result = ConversionResult(True, 'ok', wall_time=0.5)
+    success, message = result
+    assert (success, message) == (True, 'ok')
+    assert result == (True, 'ok')
+    assert result.wall_time == 0.5
+    assert result.peak_rss is None
+    assert result.warnings == []
+
+
+def test_convert_file_records_process_metrics(fake_pandoc):
+    """子进程方式记录耗时、CPU时间、峰值内存、文件大小和警告"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', '# Title\n')
+    output_file = os.path.join(directory, 'output.html')
+
+    result = PandocConverter(pandoc).convert_file(input_file, output_file)
+
+    assert result.success, result.message
+    assert result.backend == 'subprocess'
+    assert result.returncode == 0
+    assert result.output_format == 'html'
+    assert result.input_bytes == 8
+    assert result.output_bytes == 16
+    assert result.wall_time > 0
+    if hasattr(os, 'wait4'):
+        assert result.user_time is not None and result.system_time is not None
+        assert result.peak_rss > 32 * 1024 * 1024
+    assert result.warnings == [PandocWarning('WARNING', 'Could not fetch resource missing.png')]
+    assert result.warnings[0].type == 'CouldNotFetchResource'
+
+
+def test_failed_conversion_keeps_metrics(fake_pandoc):
+    """转换失败时同样记录退出码和耗时"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'fail')
+
+    success, message = result = PandocConverter(pandoc).convert_file(
+        input_file, os.path.join(directory, 'output.html')
+    )
+
+    assert not success
+    assert 'bad input' in message
+    assert result.returncode == 64
+    assert result.output_bytes is None
+
+
+def test_cancelled_conversion_reaps_process(fake_pandoc):
+    """取消时终止pandoc并返回失败"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'slow')
+    cancel_event = threading.Event()
+    threading.Timer(0.3, cancel_event.set).start()
+
+    result = PandocConverter(pandoc).convert_file(
+        input_file, os.path.join(directory, 'output.html'), cancel_event=cancel_event
+    )
+
+    assert not result.success
+    assert result.returncode is None
+    assert result.wall_time < 10
+
+
+def test_metrics_sinks(fake_pandoc):
+    """指标写入JSONL日志和Prometheus textfile"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    jsonl_path = os.path.join(directory, 'metrics.jsonl')
+    prom_path = os.path.join(directory, 'metrics.prom')
+    converter = PandocConverter(
+        pandoc, metrics=[JsonlMetricsSink(jsonl_path), PrometheusTextfileSink(prom_path)]
+    )
+
+    converter.convert_file(_write(directory, 'a.md', 'a'), os.path.join(directory, 'a.html'))
+    converter.convert_file(_write(directory, 'b.md', 'fail'), os.path.join(directory, 'b.html'))
+
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert [record['success'] for record in records] == [True, False]
+    assert records[0]['output_bytes'] == 2
+
+    with open(prom_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    assert 'pandoc_gui_conversion_total{format="html",backend="subprocess",status="success"} 1' in text
+    assert 'pandoc_gui_conversion_total{format="html",backend="subprocess",status="failure"} 1' in text
+    assert ('pandoc_gui_conversion_warnings_total{format="html",backend="subprocess",'
+            'type="CouldNotFetchResource"} 1') in text
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='文件权限只在POSIX上检查')
+def test_prometheus_textfile_is_world_readable(tmp_path):
+    """textfile按umask设置权限，其他用户运行的collector可以读取"""
+    prom_path = str(tmp_path / 'metrics.prom')
+    umask = os.umask(0o022)
+    try:
+        PrometheusTextfileSink(prom_path).record(ConversionResult(True, 'ok', output_format='html'))
+    finally:
+        os.umask(umask)
+    assert os.stat(prom_path).st_mode & 0o777 == 0o644
+
+
+def test_stream_and_async_conversions_record_metrics(fake_pandoc):
+    """流式转换和异步转换同样返回带指标的转换结果并交给记录器"""
+    directory, pandoc = fake_pandoc(FAKE_STREAM_PANDOC)
+    records = []
+
+    class ListSink:
+        def record(self, result):
+            records.append(result)
+
+    output = io.BytesIO()
+    result = PandocConverter(pandoc, metrics=ListSink()).convert_stream(
+        io.BytesIO(b'abc'), output, 'markdown', 'html'
+    )
+    assert result.success, result.message
+    assert (result.backend, result.returncode, result.output_format) == ('subprocess', 0, 'html')
+    assert (result.input_bytes, result.output_bytes) == (3, 6)
+    if hasattr(os, 'wait4'):
+        assert result.peak_rss is not None
+
+    input_file = _write(directory, 'a.md', 'abc')
+    converter = AsyncPandocConverter(pandoc, metrics=ListSink())
+    result = asyncio.run(converter.convert_file(input_file, os.path.join(directory, 'a.html')))
+    assert isinstance(result, ConversionResult)
+    assert result.success, result.message
+    assert (result.backend, result.returncode, result.output_format) == ('subprocess', 0, 'html')
+    assert (result.input_bytes, result.output_bytes) == (3, 6)
+    assert result.wall_time > 0
+
+    assert records[0].input_file is None
+    assert records[1].input_file == input_file
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+测试核心模块不依赖PyQt5
+core 包中的转换、配置和模板生成逻辑应能在没有Qt的进程（命令行、后台进程）中使用，
+Qt相关代码只能放在 ui 包中
+"""
+
+import os
+import sys
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+
+# 在独立的解释器中导入 core 包的所有模块，输出被加载的Qt模块
+CHECK_SCRIPT = """
+import sys
+import pkgutil
+import importlib
+
+import core
+
+for module_info in pkgutil.iter_modules(core.__path__):
+    importlib.import_module('core.' + module_info.name)
+
+print('\\n'.join(sorted(name for name in sys.modules if name.split('.')[0] == 'PyQt5')))
+"""
+
+
+def test_core_does_not_import_qt():
+    """导入 core 的所有模块后不应加载PyQt5"""
+    result = subprocess.run(
+        [sys.executable, '-c', CHECK_SCRIPT],
+        cwd=SRC_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, f"导入 core 模块失败:\n{result.stderr}"
+
+    qt_modules = result.stdout.split()
+    assert not qt_modules, f"导入 core 时加载了Qt模块: {', '.join(qt_modules)}"
+
+
+if __name__ == '__main__':
+    try:
+        test_core_does_not_import_qt()
+    except AssertionError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print("✓ core 模块未加载PyQt5")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+测试后台过期检查
+界面部分使用 offscreen 平台，不需要显示器；网络时间查询由模拟函数代替
+"""
+
+import os
+import sys
+import time
+import threading
+from datetime import datetime
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from PyQt5.QtWidgets import QApplication
+
+from ui import version_dialogs
+from ui.version_dialogs import ExpirationCheck, STATUS_PENDING, STATUS_VALID, STATUS_EXPIRED, STATUS_OFFLINE
+
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _fake_is_expired(result, delay=0.0, release=None):
+    """生成模拟的 is_expired，可以延迟返回或等待 release 事件"""
+    def is_expired():
+        if release is not None:
+            release.wait(10)
+        time.sleep(delay)
+        return result
+    return is_expired
+
+
+def _wait(check, timeout=5.0):
+    """处理事件直到检查结束，返回检查过程中收到的结果"""
+    results = []
+    check.finished.connect(results.append)
+    deadline = time.monotonic() + timeout
+    while not results and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return results
+
+
+def _run(result, **kwargs):
+    original = version_dialogs.is_expired
+    version_dialogs.is_expired = _fake_is_expired(result, **kwargs.pop('fake', {}))
+    try:
+        check = ExpirationCheck(**kwargs)
+        start = time.monotonic()
+        check.start()
+        elapsed = time.monotonic() - start
+        return check, elapsed, _wait(check)
+    finally:
+        version_dialogs.is_expired = original
+
+
+def test_start_does_not_block():
+    """开始检查立即返回，网络时间查询在后台完成"""
+    check, elapsed, results = _run((False, datetime.now()), fake={'delay': 0.5})
+
+    assert elapsed < 0.2
+    assert results == [STATUS_VALID]
+    assert check.is_valid()
+
+
+def test_expired_and_offline_results():
+    """过期和无法获取网络时间分别得到对应的结果"""
+    assert _run((True, datetime.now()))[2] == [STATUS_EXPIRED]
+    assert _run((True, None))[2] == [STATUS_OFFLINE]
+
+
+def test_deadline_counts_as_offline():
+    """超过截止时间按网络连接失败处理，之后到达的结果被忽略；可以重新检查"""
+    release = threading.Event()
+    check, _, results = _run((False, datetime.now()), deadline_ms=100, fake={'release': release})
+    assert results == [STATUS_OFFLINE]
+
+    late = []
+    check.finished.connect(late.append)
+    release.set()
+    end = time.monotonic() + 0.3
+    while time.monotonic() < end:
+        app.processEvents()
+        time.sleep(0.01)
+    assert late == [] and check.status == STATUS_OFFLINE
+
+    original = version_dialogs.is_expired
+    version_dialogs.is_expired = _fake_is_expired((False, datetime.now()))
+    try:
+        check.start()
+        assert check.status == STATUS_PENDING
+        assert _wait(check) == [STATUS_VALID]
+    finally:
+        version_dialogs.is_expired = original
+
+
+if __name__ == '__main__':
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
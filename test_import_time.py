@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+测试启动时的模块导入耗时
+使用 python -X importtime 记录启动主窗口所需模块的导入耗时。
+耗时取决于机器和负载，默认预算留有较大余量，可以通过环境变量 PANDOC_GUI_IMPORT_BUDGET_MS
+调整；直接运行本文件时也可以通过 --budget 指定。
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+from test_imports import MODULES_TO_TEST
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+
+# 启动主窗口时导入的模块，与 src/main.py 一致
+STARTUP_MODULES = ['PyQt5.QtWidgets', 'PyQt5.QtCore', 'PyQt5.QtGui', 'ui.main_window']
+
+# 启动时不应导入的模块，在首次使用对应功能时才导入
+DEFERRED_MODULES = ['ui.format_config', 'ui.about_dialog', 'core.config_manager', 'docx']
+
+# 默认的启动导入耗时预算 (毫秒)，开发机上实测约为预算的五分之一，留出CI等慢速环境的余量
+DEFAULT_BUDGET_MS = 800
+
+# 重复测量的次数，取最小值以减少系统负载的影响
+MEASURE_RUNS = 3
+
+# -X importtime 输出的行格式: "import time: 自身耗时 | 累计耗时 | 缩进的模块名"，单位为微秒
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+
+def get_budget_ms():
+    """获取导入耗时预算 (毫秒)"""
+    return float(os.environ.get('PANDOC_GUI_IMPORT_BUDGET_MS', DEFAULT_BUDGET_MS))
+
+
+def parse_importtime(output):
+    """解析 -X importtime 的输出
+
+    Args:
+        output: 解释器的标准错误输出
+
+    Returns:
+        list: (模块名, 自身耗时微秒, 累计耗时微秒, 嵌套层级) 元组列表，按输出顺序排列
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def _run_importtime(code):
+    """在独立的解释器中执行代码并返回导入记录"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=SRC_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"导入失败:\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def measure_import_time(modules, runs=MEASURE_RUNS):
+    """测量导入模块的耗时
+
+    解释器自身启动时导入的模块不计入结果。
+
+    Args:
+        modules: 模块名列表
+        runs: 测量次数，取耗时最少的一次
+
+    Returns:
+        tuple: (总耗时毫秒, 导入记录列表)
+    """
+    baseline = {name for name, _, _, _ in _run_importtime('pass')}
+
+    best = None
+    for _ in range(max(1, runs)):
+        entries = _run_importtime('import ' + ', '.join(modules))
+        total_us = sum(
+            cumulative for name, _, cumulative, depth in entries
+            if depth == 0 and name not in baseline
+        )
+        if best is None or total_us < best[0]:
+            best = (total_us, entries)
+
+    return best[0] / 1000, best[1]
+
+
+def format_report(total_ms, entries, budget_ms, top=10):
+    """生成导入耗时报告，列出自身耗时最多的模块"""
+    lines = [f"启动导入耗时 {total_ms:.1f} ms（预算 {budget_ms:.0f} ms）"]
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: -e[1])[:top]:
+        lines.append(f"  {self_us / 1000:8.1f} ms  (累计 {cumulative_us / 1000:8.1f} ms)  {name}")
+    return '\n'.join(lines)
+
+
+def test_startup_import_budget():
+    """启动主窗口所需模块的导入耗时不超过预算"""
+    budget_ms = get_budget_ms()
+    total_ms, entries = measure_import_time(STARTUP_MODULES)
+    assert total_ms <= budget_ms, format_report(total_ms, entries, budget_ms)
+
+
+def test_startup_defers_dialog_imports():
+    """启动时不导入排版配置、关于对话框和模板生成相关的模块"""
+    entries = _run_importtime('import ' + ', '.join(STARTUP_MODULES))
+    imported = {name for name, _, _, _ in entries}
+    eager = [name for name in DEFERRED_MODULES if name in imported]
+    assert not eager, f"启动时导入了应延迟导入的模块: {', '.join(eager)}"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='检查启动时的模块导入耗时')
+    parser.add_argument('--budget', type=float, default=get_budget_ms(), help='导入耗时预算 (毫秒)')
+    args = parser.parse_args()
+
+    total_ms, entries = measure_import_time(STARTUP_MODULES)
+    print(format_report(total_ms, entries, args.budget))
+
+    print("-" * 50)
+    print("关键模块单独导入耗时:")
+    for module_name, _ in MODULES_TO_TEST:
+        module_ms, _ = measure_import_time([module_name], runs=1)
+        print(f"  {module_ms:8.1f} ms  {module_name}")
+
+    print("-" * 50)
+    imported = {name for name, _, _, _ in entries}
+    eager = [name for name in DEFERRED_MODULES if name in imported]
+    if eager:
+        print(f"✗ 启动时导入了应延迟导入的模块: {', '.join(eager)}")
+    if total_ms > args.budget:
+        print(f"✗ 启动导入耗时超出预算 {total_ms - args.budget:.1f} ms")
+    if eager or total_ms > args.budget:
+        sys.exit(1)
+    print("✓ 启动导入耗时在预算之内")
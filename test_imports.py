@@ -10,23 +10,24 @@ import os
 # 添加当前目录到路径，以便导入模块
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
+# 需要测试的关键模块
+MODULES_TO_TEST = [
+    ('core.pandoc_converter', 'PandocConverter'),
+    ('core.config_manager', 'ConfigManager'),
+    ('core.template_manager', 'TemplateManager'),
+    ('core.version_checker', 'get_expiration_message'),
+    ('ui.format_config', 'FormatConfigDialog'),
+    ('ui.about_dialog', 'AboutDialog'),  # 新添加的模块
+    ('utils.file_utils', 'get_file_path'),
+]
+
 def test_imports():
     """测试所有关键模块的导入"""
     success = True
     error_messages = []
     
     # 测试核心模块
-    modules_to_test = [
-        ('core.pandoc_converter', 'PandocConverter'),
-        ('core.config_manager', 'ConfigManager'),
-        ('core.template_manager', 'TemplateManager'),
-        ('core.version_checker', 'get_expiration_message'),
-        ('ui.format_config', 'FormatConfigDialog'),
-        ('ui.about_dialog', 'AboutDialog'),  # 新添加的模块
-        ('utils.file_utils', 'get_file_path'),
-    ]
-    
-    for module_name, class_name in modules_to_test:
+    for module_name, class_name in MODULES_TO_TEST:
         try:
             module = __import__(module_name, fromlist=[class_name])
             getattr(module, class_name)
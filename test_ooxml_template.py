@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+测试直接改写OOXML的模板生成器
+每个预设模板分别用OOXML改写和python-docx生成，比较样式和页面设置，并确认生成的文件能被python-docx读取
+"""
+
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.config_manager import ConfigManager, TEMPLATE_MODE_STYLES, TEMPLATE_MODE_SHOWCASE
+from core.ooxml_template import build_template_bytes, STYLES_PART, DOCUMENT_PART
+from core.template_manager import TemplateManager, PRESET_SETTINGS
+
+
+STYLE_NAMES = ['Normal'] + [f'Heading {level}' for level in range(1, 10)]
+FONT_ATTRIBUTES = ('ascii', 'hAnsi', 'eastAsia', 'cs')
+
+
+def _build_with_python_docx(config, mode):
+    manager = ConfigManager()
+    manager.config = config
+    buffer = io.BytesIO()
+    manager.create_template_file(mode).save(buffer)
+    return buffer.getvalue()
+
+
+def _style_properties(doc, name):
+    """读取样式中模板生成器会修改的属性"""
+    style = doc.styles[name]
+    rFonts = style.element.find(f"{qn('w:rPr')}/{qn('w:rFonts')}")
+    paragraph_format = style.paragraph_format
+    return {
+        'fonts': {attr: rFonts.get(qn(f'w:{attr}')) for attr in FONT_ATTRIBUTES}
+                 if rFonts is not None else None,
+        'size': style.font.size,
+        'bold': style.font.bold,
+        'italic': style.font.italic,
+        'alignment': paragraph_format.alignment,
+        'first_line_indent': paragraph_format.first_line_indent,
+        'line_spacing': paragraph_format.line_spacing,
+        'space_before': paragraph_format.space_before,
+    }
+
+
+def _section_properties(doc):
+    section = doc.sections[0]
+    return {
+        'page_width': section.page_width,
+        'page_height': section.page_height,
+        'top_margin': section.top_margin,
+        'bottom_margin': section.bottom_margin,
+        'left_margin': section.left_margin,
+        'right_margin': section.right_margin,
+    }
+
+
+@pytest.mark.parametrize('mode', [TEMPLATE_MODE_STYLES, TEMPLATE_MODE_SHOWCASE])
+@pytest.mark.parametrize('template_name', list(PRESET_SETTINGS))
+def test_presets_match_python_docx(template_name, mode):
+    """两种生成方式得到的样式、页面设置和正文内容一致"""
+    config = TemplateManager().get_preset_config(template_name)
+    data = build_template_bytes(config, mode == TEMPLATE_MODE_SHOWCASE)
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+    assert STYLES_PART in names
+    assert DOCUMENT_PART in names
+
+    # 用python-docx读回生成的文件
+    doc = Document(io.BytesIO(data))
+    expected = Document(io.BytesIO(_build_with_python_docx(config, mode)))
+
+    for name in STYLE_NAMES:
+        assert _style_properties(doc, name) == _style_properties(expected, name), name
+    assert _section_properties(doc) == _section_properties(expected)
+    assert [(p.style.name, p.text) for p in doc.paragraphs] == \
+        [(p.style.name, p.text) for p in expected.paragraphs]
+    assert len(doc.tables) == len(expected.tables)
+
+
+@pytest.mark.parametrize('body_alignment, heading_align', [
+    (0, '左对齐'), (1, '居中对齐'), (2, '右对齐'), (3, '两端对齐'),
+])
+def test_alignments_match_python_docx(body_alignment, heading_align):
+    """预设模板没有覆盖的对齐方式也与python-docx一致"""
+    config = TemplateManager().get_preset_config('默认模板')
+    config['basic_text']['format']['alignment'] = body_alignment
+    for heading_info in config['headings'].values():
+        heading_info['align'] = heading_align
+    doc = Document(io.BytesIO(build_template_bytes(config, showcase=False)))
+    expected = Document(io.BytesIO(_build_with_python_docx(config, TEMPLATE_MODE_STYLES)))
+    for name in STYLE_NAMES:
+        assert _style_properties(doc, name) == _style_properties(expected, name), name
+
+
+def test_styles_mode_has_no_content():
+    """仅样式模式不包含示例内容"""
+    config = TemplateManager().get_preset_config('默认模板')
+    doc = Document(io.BytesIO(build_template_bytes(config, showcase=False)))
+    assert not any(p.text for p in doc.paragraphs)
+    assert not doc.tables
+
+
+def test_landscape_swaps_page_size():
+    """横向页面交换宽高，与python-docx生成的结果一致"""
+    config = TemplateManager().get_preset_config('默认模板')
+    config['page_settings']['orientation'] = 1
+    doc = Document(io.BytesIO(build_template_bytes(config, showcase=False)))
+    expected = Document(io.BytesIO(_build_with_python_docx(config, TEMPLATE_MODE_STYLES)))
+    section = doc.sections[0]
+    assert section.page_width > section.page_height
+    assert _section_properties(doc) == _section_properties(expected)
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+测试PandocConverter的批量转换、多格式输出、内存转换和性能配置
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import signal
+import threading
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.pandoc_converter import PandocConverter, CANCELLED_MESSAGE, CANCEL_DRAIN_TIMEOUT
+
+
+# 模拟的pandoc：每次调用的参数追加写入同目录下的 calls.jsonl；
+# 把输入加上 "<输出格式>:" 前缀写入输出文件，没有输入文件或输出为 - 时使用标准输入输出。
+# 指定了 --extract-media 且输入为docx时在该目录下生成 media/image.png；
+# 读取json输入时在输出中附加资源路径下是否存在提取出的图片；
+# 输入内容为 detach 时启动一个脱离进程组、继承标准错误输出的子进程后等待
+FAKE_PANDOC = '''import os, sys, json
+here = os.path.dirname(os.path.abspath(__file__))
+args = sys.argv[1:]
+with open(os.path.join(here, 'calls.jsonl'), 'a') as f:
+    f.write(json.dumps(args) + '\\n')
+if args == ['--version']:
+    print('pandoc 3.1.0')
+    sys.exit(0)
+if args[:1] == ['+RTS']:
+    if os.path.exists(os.path.join(here, 'threaded')):
+        print(' ,("RTS way", "rts_thr")')
+    sys.exit(0)
+if '+RTS' in args:
+    args = args[:args.index('+RTS')] + args[args.index('-RTS') + 1:]
+options, positional = {}, []
+i = 0
+while i < len(args):
+    if args[i].startswith('-') and len(args[i]) > 1:
+        options[args[i]] = args[i + 1] if i + 1 < len(args) else None
+        i += 2
+    else:
+        positional.append(args[i])
+        i += 1
+source = positional[0] if positional else None
+target = options.get('-o', '-')
+data = open(source, 'rb').read() if source else sys.stdin.buffer.read()
+if data.strip() == b'fail':
+    sys.stderr.write('bad input\\n')
+    sys.exit(64)
+if data.strip() == b'heap':
+    sys.stderr.write('pandoc: Heap exhausted;\\n')
+    sys.exit(251)
+if data.strip() == b'detach':
+    import subprocess, time
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'], start_new_session=True)
+    open(os.path.join(here, 'detached.pid'), 'w').write(str(child.pid))
+    time.sleep(30)
+to = options.get('-t') or os.path.splitext(target)[1].lstrip('.') or 'html'
+output = to.encode() + b':' + data
+media = options.get('--extract-media')
+if media and source and source.endswith('.docx'):
+    os.makedirs(os.path.join(media, 'media'), exist_ok=True)
+    open(os.path.join(media, 'media', 'image.png'), 'wb').write(b'png')
+if options.get('-f') == 'json':
+    found = any(os.path.exists(os.path.join(p, 'media', 'image.png'))
+                for p in options.get('--resource-path', '').split(os.pathsep))
+    output += b' media=' + str(found).encode()
+if target == '-':
+    sys.stdout.buffer.write(output)
+else:
+    open(target, 'wb').write(output)
+'''
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(content.encode('utf-8') if isinstance(content, str) else content)
+    return path
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _calls(directory):
+    """模拟pandoc的调用记录，不包括查询版本和运行时信息的调用"""
+    with open(os.path.join(directory, 'calls.jsonl'), 'r', encoding='utf-8') as f:
+        calls = [json.loads(line) for line in f]
+    return [args for args in calls if args != ['--version'] and args[:1] != ['+RTS']]
+
+
+def test_convert_many_bounded_window(fake_pandoc):
+    """批量转换只从任务迭代器中按需取出有限数量的任务"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'text')
+    consumed = []
+
+    def jobs():
+        for index in range(20):
+            consumed.append(index)
+            yield input_file, os.path.join(directory, f'{index}.html')
+
+    results = PandocConverter(pandoc).convert_many(jobs(), max_workers=1)
+    next(results)
+    assert len(consumed) <= 3
+    results.close()
+    assert len(consumed) <= 3
+
+
+def test_convert_many_isolates_failures(fake_pandoc):
+    """单个任务失败不影响其他任务，每个任务产出 (job, success, message)"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    jobs = [
+        (_write(directory, 'a.md', 'a'), os.path.join(directory, 'a.html')),
+        (_write(directory, 'bad.md', 'fail'), os.path.join(directory, 'bad.html')),
+        (os.path.join(directory, 'missing.md'), os.path.join(directory, 'missing.html')),
+        {'input_file': _write(directory, 'c.md', 'c'), 'output_file': os.path.join(directory, 'c.txt'),
+         'output_format': 'plain'},
+    ]
+
+    results = list(PandocConverter(pandoc).convert_many(jobs, max_workers=2))
+
+    assert len(results) == len(jobs)
+    outcome = {(job['input_file'] if isinstance(job, dict) else job[0]): (success, message)
+               for job, success, message in results}
+    assert outcome[jobs[0][0]][0] and outcome[jobs[3]['input_file']][0]
+    assert not outcome[jobs[1][0]][0] and 'bad input' in outcome[jobs[1][0]][1]
+    assert not outcome[jobs[2][0]][0] and '输入文件不存在' in outcome[jobs[2][0]][1]
+    assert _read(os.path.join(directory, 'c.txt')) == b'plain:c'
+
+
+def test_convert_many_cancel_stops_new_jobs(fake_pandoc):
+    """设置取消事件后不再开始新任务"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'text')
+    jobs = [(input_file, os.path.join(directory, f'{index}.html')) for index in range(10)]
+    cancel_event = threading.Event()
+
+    results = []
+    for result in PandocConverter(pandoc).convert_many(jobs, max_workers=1, cancel_event=cancel_event):
+        results.append(result)
+        cancel_event.set()
+
+    assert len(results) < len(jobs)
+
+
+def test_convert_bytes_and_stream(fake_pandoc):
+    """内存转换通过标准输入输出传递数据，失败时返回错误信息"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc)
+
+    assert converter.convert_bytes('你好', 'markdown', 'html') == (True, 'html:你好'.encode('utf-8'))
+    success, message = converter.convert_bytes(b'fail', 'markdown', 'html')
+    assert not success and 'bad input' in message
+
+    data = b'x' * 100000
+    output = io.BytesIO()
+    success, _ = converter.convert_stream(io.BytesIO(data), output, 'markdown', 'plain', chunk_size=1024)
+    assert success
+    assert output.getvalue() == b'plain:' + data
+    assert _calls(directory)[-1][:6] == ['-f', 'markdown', '-t', 'plain', '-o', '-']
+
+
+def test_rts_args_follow_runtime(fake_pandoc):
+    """非多线程运行时去掉 -N 参数，多线程运行时保留"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'text')
+
+    PandocConverter(pandoc, profile='large').convert_file(input_file, os.path.join(directory, 'a.html'))
+    args = _calls(directory)[-1]
+    rts = args[args.index('+RTS') + 1:args.index('-RTS')]
+    assert '-A64m' in rts and not any(opt.startswith('-N') for opt in rts)
+
+    # 换一个多线程运行时的pandoc（检测结果按文件缓存，需要新的可执行文件）
+    threaded_dir, threaded_pandoc = fake_pandoc(FAKE_PANDOC)
+    open(os.path.join(threaded_dir, 'threaded'), 'w').close()
+    PandocConverter(threaded_pandoc, profile='large', memory_limit='1g').convert_file(
+        input_file, os.path.join(directory, 'b.html')
+    )
+    args = _calls(threaded_dir)[-1]
+    assert args[args.index('+RTS') + 1:args.index('-RTS')] == ['-N', '-A64m', '-n4m', '-M1g']
+
+
+def test_heap_exhausted_message(fake_pandoc):
+    """退出码251提示超出内存限制"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'heap')
+
+    result = PandocConverter(pandoc, memory_limit='1m').convert_file(
+        input_file, os.path.join(directory, 'a.html')
+    )
+
+    assert not result.success
+    assert '超出pandoc最大内存限制' in result.message
+
+
+def test_cancel_does_not_wait_for_detached_child(fake_pandoc):
+    """取消时终止pandoc，不会因脱离进程组的子进程仍持有标准错误输出而一直等待"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'detach')
+    cancel_event = threading.Event()
+    threading.Timer(0.5, cancel_event.set).start()
+
+    start = time.monotonic()
+    result = PandocConverter(pandoc).convert_file(
+        input_file, os.path.join(directory, 'a.html'), cancel_event=cancel_event
+    )
+    elapsed = time.monotonic() - start
+
+    with open(os.path.join(directory, 'detached.pid'), 'r') as f:
+        os.kill(int(f.read()), signal.SIGKILL)
+    assert (result.success, result.message) == (False, CANCELLED_MESSAGE)
+    assert elapsed < CANCEL_DRAIN_TIMEOUT + 5, elapsed
+
+
+def test_convert_to_formats_extracts_embedded_media(fake_pandoc):
+    """docx输入解析时提取图片，写出阶段可以找到图片，不能包含图片的格式把图片保存在输出旁边"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.docx', 'doc')
+    outputs = {
+        'docx': os.path.join(directory, 'out.docx'),
+        'html': os.path.join(directory, 'out.html'),
+    }
+
+    results = list(PandocConverter(pandoc).convert_to_formats(input_file, outputs))
+
+    assert sorted((r[0], r[2]) for r in results) == [('docx', True), ('html', True)]
+    assert _read(outputs['docx']) == b'docx:json:doc media=True'
+    assert _read(outputs['html']) == b'html:json:doc media=True'
+
+    parse, *writes = _calls(directory)
+    ast_dir = parse[parse.index('--extract-media') + 1]
+    assert parse[parse.index('-o') + 1] == os.path.join(ast_dir, 'ast.json')
+    for args in writes:
+        assert ast_dir in args[args.index('--resource-path') + 1].split(os.pathsep)
+    html_args = next(args for args in writes if args[args.index('-t') + 1] == 'html')
+    assert html_args[html_args.index('--extract-media') + 1] == os.path.join(directory, 'out_media')
+    assert not os.path.exists(ast_dir)
+
+
+def test_convert_to_formats_text_input_keeps_relative_media(fake_pandoc):
+    """文本输入不提取图片，图片仍按输入文件所在目录查找"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', '![](image.png)')
+
+    results = list(PandocConverter(pandoc).convert_to_formats(
+        input_file, {'html': os.path.join(directory, 'out.html')}
+    ))
+
+    assert results[0][2], results[0][3]
+    for args in _calls(directory):
+        assert '--extract-media' not in args
+    write = _calls(directory)[-1]
+    assert write[write.index('--resource-path') + 1].split(os.pathsep)[0] == directory
+
+
+def test_convert_to_formats_parse_failure(fake_pandoc):
+    """解析失败时所有目标格式都返回失败"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    input_file = _write(directory, 'input.md', 'fail')
+    outputs = {'html': os.path.join(directory, 'a.html'), 'docx': os.path.join(directory, 'a.docx')}
+
+    results = list(PandocConverter(pandoc).convert_to_formats(input_file, outputs))
+
+    assert sorted(r[0] for r in results) == ['docx', 'html']
+    assert all(not r[2] and 'bad input' in r[3] for r in results)
+    assert len(_calls(directory)) == 1
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+测试pandoc日志的解析和警告汇总
+"""
+
+import io
+import os
+import sys
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.pandoc_log import StderrCapture, WarningSummary, PandocWarning, MAX_LINE_CHARS
+
+
+def _stderr(lines):
+    return io.StringIO(''.join(line + '\n' for line in lines))
+
+
+def test_warnings_are_typed_and_merged():
+    """相同的警告合并计数，并识别警告类型"""
+    capture = StderrCapture()
+    capture.consume(_stderr([
+        "[WARNING] Could not fetch resource a.png",
+        "[WARNING] Could not fetch resource a.png",
+        "[WARNING] Could not convert TeX math \\frac{1}{, rendering as TeX:",
+        "  \\frac{1}{",
+        "[WARNING] Duplicate identifier 'intro' at line 3 column 1",
+    ]))
+
+    warnings = capture.warnings
+    assert [(w.type, w.count) for w in warnings] == [
+        ('CouldNotFetchResource', 2), ('CouldNotConvertTeXMath', 1), ('DuplicateIdentifier', 1)
+    ]
+    assert warnings[1].detail == '\\frac{1}{'
+    assert capture.warning_count == 4
+    assert capture.text() == ''
+
+
+def test_verbose_info_counts_loaded_files():
+    """只为统计读取的本地文件而附加 --verbose 时，INFO日志不记为警告"""
+    capture = StderrCapture(keep_info=False)
+    capture.consume(_stderr([
+        "[INFO] Loaded image.png from image.png",
+        "[INFO] This document format requires a nonempty <title> element.",
+        "  Defaulting to 'a' as the title.",
+        "[WARNING] Could not fetch resource b.png",
+        "pandoc: error",
+    ]))
+
+    assert capture.loaded_resources == 1
+    assert [w.type for w in capture.warnings] == ['CouldNotFetchResource']
+    assert capture.text() == 'pandoc: error'
+
+
+def test_capture_memory_is_bounded():
+    """大量输出只保留有限的行和警告种类"""
+    capture = StderrCapture(max_lines=10, max_distinct=5)
+    lines = [f"[WARNING] Could not fetch resource image{i}.png" for i in range(10000)]
+    lines += [f"error line {i}" for i in range(10000)]
+    lines.append('x' * (MAX_LINE_CHARS * 3))
+    capture.consume(_stderr(lines))
+
+    assert len(capture.warnings) == 5
+    assert capture.warning_count == 10000
+    assert capture.dropped_warnings == 9995
+    text = capture.text()
+    assert text.splitlines()[0] == 'error line 0'
+    assert text.splitlines()[-1] == 'x' * MAX_LINE_CHARS
+    assert len(text.splitlines()) == 11
+    assert '省略' in text
+
+    message = capture.format_message(limit=3)
+    assert '警告 10000 条' in message
+    assert len(message) < 5000
+
+
+def test_batch_summary_deduplicates_across_files():
+    """批次汇总合并各文件的相同警告，并记录出现的文件"""
+    summary = WarningSummary()
+    warning = PandocWarning('WARNING', 'Could not fetch resource logo.png')
+    for index in range(50):
+        summary.add([PandocWarning(warning.level, warning.text, count=2)], f'doc{index}.md')
+    summary.add([PandocWarning('WARNING', 'Missing character: There is no 中 in font')], 'zh.md')
+
+    assert summary.total == 101
+    assert summary.files_with_warnings == 51
+    entries = summary.to_list()
+    assert entries[0]['count'] == 100
+    assert entries[0]['files'] == ['doc0.md', 'doc1.md', 'doc2.md']
+    assert entries[1]['type'] == 'MissingCharacter'
+    assert '100 × [WARNING] Could not fetch resource logo.png' in summary.format()
+
+
+if __name__ == '__main__':
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
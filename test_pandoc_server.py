@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+测试服务模式转换和回退到子进程方式
+使用模拟的pandoc脚本（包括 `pandoc server`），不需要安装pandoc
+"""
+
+import os
+import sys
+import time
+import threading
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core import pandoc_server
+from core.pandoc_converter import PandocConverter, CANCELLED_MESSAGE
+
+
+# 模拟的pandoc：`pandoc server` 启动一个HTTP服务，把输入文本加上 "server:" 前缀返回；
+# 子进程方式把输入加上 "cli:" 前缀写入输出文件。同目录下存在 no-server 文件时服务无法启动。
+# 服务请求的文本中含有 timeout 时返回超时，含有 hang 时一直不返回，含有 image.png 时报告无法读取资源
+FAKE_PANDOC = '''import os, sys, json, time
+args = sys.argv[1:]
+here = os.path.dirname(os.path.abspath(__file__))
+if args[:1] == ['server']:
+    if os.path.exists(os.path.join(here, 'no-server')):
+        sys.exit(1)
+    with open(os.path.join(here, 'server-args'), 'w') as f:
+        f.write(' '.join(args))
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *a):
+            pass
+
+        def reply(self, status, body):
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self.reply(200, b'"3.1"')
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            text = payload['text']
+            if 'timeout' in text:
+                return self.reply(503, b'Conversion timed out.')
+            if 'hang' in text:
+                time.sleep(30)
+            messages = []
+            if 'image.png' in text:
+                messages.append({'type': 'CouldNotFetchResource', 'verbosity': 'WARNING'})
+            result = {'output': 'server:' + text, 'base64': False, 'messages': messages}
+            self.reply(200, json.dumps(result).encode('utf-8'))
+
+    HTTPServer(('127.0.0.1', int(args[args.index('--port') + 1])), Handler).serve_forever()
+if args[:1] == ['+RTS']:
+    sys.exit(0)
+source, target = args[0], args[args.index('-o') + 1]
+data = open(source, 'rb').read()
+open(target, 'wb').write(b'cli:' + data)
+'''
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(content.encode('utf-8') if isinstance(content, str) else content)
+    return path
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_server_backend_converts_with_timeout(fake_pandoc):
+    """服务模式通过服务进程转换，服务进程以与请求超时一致的 --timeout 启动"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1)
+    try:
+        output_file = os.path.join(directory, 'a.html')
+        result = converter.convert_file(_write(directory, 'a.md', 'hello'), output_file)
+    finally:
+        converter.close()
+
+    assert result.success, result.message
+    assert result.backend == 'server'
+    assert _read(output_file) == b'server:hello'
+    with open(os.path.join(directory, 'server-args'), 'r') as f:
+        assert '--timeout 120' in f.read()
+
+
+def test_closed_pool_is_released(fake_pandoc):
+    """关闭的进程池不再被退出时的清理函数引用"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1)
+    try:
+        converter.convert_file(_write(directory, 'a.md', 'hello'), os.path.join(directory, 'a.html'))
+        pool = converter.server_pool
+        assert pool in pandoc_server._running_pools
+    finally:
+        converter.close()
+
+    assert pool not in pandoc_server._running_pools
+
+
+def test_close_wakes_waiting_requests(fake_pandoc):
+    """关闭进程池时，等待空闲服务进程的请求立即失败，正在处理的服务进程不会放回队列"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    pool = pandoc_server.PandocServerPool(pandoc, size=1)
+    pool.start()
+    errors = {}
+
+    def convert(name, content):
+        try:
+            pool.convert(_write(directory, f'{name}.md', content), os.path.join(directory, f'{name}.html'))
+        except pandoc_server.PandocServerError as e:
+            errors[name] = (str(e), time.monotonic())
+
+    busy = threading.Thread(target=convert, args=('busy', 'hang'))
+    busy.start()
+    time.sleep(0.3)
+    waiting = threading.Thread(target=convert, args=('waiting', 'hello'))
+    waiting.start()
+    time.sleep(0.3)
+
+    closed_at = time.monotonic()
+    pool.close()
+    waiting.join(10)
+    busy.join(10)
+
+    assert not waiting.is_alive() and not busy.is_alive()
+    message, failed_at = errors['waiting']
+    assert '已关闭' in message
+    assert failed_at - closed_at < 5
+    assert 'busy' in errors
+    assert pool._workers == []
+    assert pool._idle.get_nowait() is pandoc_server._POOL_CLOSED
+    assert pool._idle.empty()
+
+
+def test_ineligible_jobs_do_not_disable_server(fake_pandoc):
+    """pdf输出、非UTF-8输入和引用本地资源的文档改用子进程方式，但不会停用服务模式"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1)
+    try:
+        jobs = [
+            (_write(directory, 'pdf.md', 'text'), os.path.join(directory, 'pdf.pdf')),
+            (_write(directory, 'latin.md', 'caf\xe9'.encode('latin-1')), os.path.join(directory, 'latin.html')),
+            (_write(directory, 'image.md', '![](image.png)'), os.path.join(directory, 'image.html')),
+            (_write(directory, 'image2.md', '![](image.png)'), os.path.join(directory, 'image2.html')),
+        ]
+        for input_file, output_file in jobs:
+            result = converter.convert_file(input_file, output_file)
+            assert result.success, result.message
+            assert result.backend == 'subprocess'
+            assert _read(output_file).startswith(b'cli:')
+
+        result = converter.convert_file(_write(directory, 'b.md', 'ok'), os.path.join(directory, 'b.html'))
+    finally:
+        converter.close()
+
+    assert result.backend == 'server'
+    assert not converter._server_unavailable
+
+
+def test_server_timeout_falls_back_to_subprocess(fake_pandoc):
+    """服务进程转换超时时改用子进程方式重新转换"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1)
+    try:
+        output_file = os.path.join(directory, 'slow.html')
+        result = converter.convert_file(_write(directory, 'slow.md', 'timeout'), output_file)
+    finally:
+        converter.close()
+
+    assert result.success, result.message
+    assert result.backend == 'subprocess'
+    assert _read(output_file) == b'cli:timeout'
+
+
+def test_rts_profile_and_extra_args_use_subprocess(fake_pandoc):
+    """指定了运行时参数或附加命令行参数的任务使用子进程方式"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1, memory_limit='1g')
+    try:
+        input_file = _write(directory, 'a.md', 'hello')
+        result = converter.convert_file(input_file, os.path.join(directory, 'a.html'))
+        assert result.backend == 'subprocess'
+
+        converter.memory_limit = None
+        result = converter.convert_file(input_file, os.path.join(directory, 'b.html'), profile='batch')
+        assert result.backend == 'subprocess'
+
+        result = converter.convert_file(input_file, os.path.join(directory, 'c.html'),
+                                        extra_args=['--standalone'])
+        assert result.backend == 'subprocess'
+    finally:
+        converter.close()
+    assert converter.server_pool is None
+
+
+def test_cancel_server_request(fake_pandoc):
+    """取消服务模式中的任务时放弃请求，重启的服务进程可以继续转换"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1)
+    cancel_event = threading.Event()
+    threading.Timer(0.3, cancel_event.set).start()
+    try:
+        start = time.monotonic()
+        result = converter.convert_file(
+            _write(directory, 'hang.md', 'hang'), os.path.join(directory, 'hang.html'),
+            cancel_event=cancel_event
+        )
+        assert (result.success, result.message) == (False, CANCELLED_MESSAGE)
+        assert time.monotonic() - start < 10
+
+        result = converter.convert_file(_write(directory, 'b.md', 'ok'), os.path.join(directory, 'b.html'))
+    finally:
+        converter.close()
+    assert result.backend == 'server'
+
+
+def test_unavailable_server_falls_back(fake_pandoc):
+    """服务进程无法启动时回退到子进程方式，之后不再尝试服务模式"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    open(os.path.join(directory, 'no-server'), 'w').close()
+    converter = PandocConverter(pandoc, backend='server', server_pool_size=1)
+    try:
+        result = converter.convert_file(_write(directory, 'a.md', 'hello'), os.path.join(directory, 'a.html'))
+    finally:
+        converter.close()
+
+    assert result.success, result.message
+    assert result.backend == 'subprocess'
+    assert converter._server_unavailable
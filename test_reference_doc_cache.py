@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+测试参考文档缓存和以配置哈希指定模板
+使用模拟的pandoc脚本，不需要安装pandoc
+"""
+
+import os
+import sys
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.pandoc_converter import PandocConverter
+from core.reference_doc_cache import (
+    ReferenceDocCache, config_hash, parse_config_hash, CONFIG_HASH_PREFIX
+)
+
+
+# 模拟的pandoc：把 --reference-doc 文件的内容写入输出文件
+FAKE_PANDOC = '''import sys
+args = sys.argv[1:]
+if args == ['--version']:
+    print('pandoc 3.1.0')
+    sys.exit(0)
+target = args[args.index('-o') + 1]
+reference = open(args[args.index('--reference-doc') + 1], 'rb').read() if '--reference-doc' in args else b''
+open(target, 'wb').write(reference)
+'''
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def test_config_hash_is_canonical():
+    """配置的键顺序不影响哈希，配置或选项变化时哈希随之变化"""
+    first = config_hash({'a': 1, 'b': {'x': 1, 'y': 2}}, mode='styles')
+    second = config_hash({'b': {'y': 2, 'x': 1}, 'a': 1}, mode='styles')
+
+    assert first == second
+    assert config_hash({'a': 2, 'b': {'x': 1, 'y': 2}}, mode='styles') != first
+    assert config_hash({'a': 1, 'b': {'x': 1, 'y': 2}}, mode='showcase') != first
+    assert parse_config_hash(CONFIG_HASH_PREFIX + first) == first
+    assert parse_config_hash(first) == first
+    assert parse_config_hash('template.docx') is None
+
+
+def test_get_or_create_builds_once(tmp_path):
+    """相同的哈希只生成一次模板，新的缓存实例可以从磁盘读取"""
+    directory = str(tmp_path)
+    cache = ReferenceDocCache(os.path.join(directory, 'cache'))
+    key = config_hash({'font': 'A'})
+    builds = []
+
+    def build():
+        builds.append(key)
+        return b'docx'
+
+    assert cache.get_or_create(key, build) == b'docx'
+    assert cache.get_or_create(key, build) == b'docx'
+    assert len(builds) == 1
+
+    reopened = ReferenceDocCache(os.path.join(directory, 'cache'))
+    assert reopened.get(key) == b'docx'
+    assert reopened.get(config_hash({'font': 'B'})) is None
+
+
+def test_converter_resolves_config_hash(fake_pandoc):
+    """转换时 "config:<哈希>" 解析为缓存中的参考文档，不在缓存中时转换失败"""
+    directory, pandoc = fake_pandoc(FAKE_PANDOC)
+    cache = ReferenceDocCache(os.path.join(directory, 'cache'))
+    key = config_hash({'font': 'A'})
+    cache.put(key, b'reference')
+    converter = PandocConverter(pandoc, reference_docs=cache)
+    input_file = _write(directory, 'a.md', 'text')
+    output_file = os.path.join(directory, 'a.docx')
+
+    result = converter.convert_file(input_file, output_file, CONFIG_HASH_PREFIX + key)
+
+    assert result.success, result.message
+    with open(output_file, 'rb') as f:
+        assert f.read() == b'reference'
+
+    missing = CONFIG_HASH_PREFIX + config_hash({'font': 'B'})
+    result = converter.convert_file(input_file, output_file, missing)
+    assert not result.success
+    assert '模板配置不存在' in result.message
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+测试主线程卡顿检测
+使用 offscreen 平台，不需要显示器
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from PyQt5.QtCore import QTimer, QEventLoop
+from PyQt5.QtWidgets import QApplication
+
+from utils.stall_watchdog import StallWatchdog, get_threshold_ms, WATCHDOG_ENV, DEFAULT_THRESHOLD_MS
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+app = QApplication.instance() or QApplication([])
+
+
+class SlowHandler:
+    """在主线程中执行耗时操作的槽函数"""
+
+    def on_click(self, seconds):
+        self.busy_wait(seconds)
+
+    def busy_wait(self, seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            pass
+
+
+def _run_event_loop(seconds, *actions):
+    """运行事件循环，按 (延迟毫秒, 函数) 依次执行操作"""
+    loop = QEventLoop()
+    for delay_ms, action in actions:
+        QTimer.singleShot(delay_ms, action)
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def test_threshold_from_environment():
+    """环境变量未设置时不启用，非数字时使用默认阈值"""
+    saved = os.environ.pop(WATCHDOG_ENV, None)
+    try:
+        assert get_threshold_ms() is None
+        os.environ[WATCHDOG_ENV] = '150'
+        assert get_threshold_ms() == 150
+        os.environ[WATCHDOG_ENV] = 'on'
+        assert get_threshold_ms() == DEFAULT_THRESHOLD_MS
+    finally:
+        os.environ.pop(WATCHDOG_ENV, None)
+        if saved is not None:
+            os.environ[WATCHDOG_ENV] = saved
+
+
+def test_reports_blocking_slot():
+    """主线程被槽函数阻塞时，记录卡顿时长、所在函数和调用栈"""
+    log_path = os.path.join(tempfile.mkdtemp(), 'stalls.jsonl')
+    watchdog = StallWatchdog(100, log_path, roots=[TEST_DIR])
+    handler = SlowHandler()
+    watchdog.start()
+    try:
+        _run_event_loop(1.0, (200, lambda: handler.on_click(0.4)))
+    finally:
+        watchdog.stop()
+
+    assert len(watchdog.records) == 1
+    record = watchdog.records[0]
+    assert 350 < record['duration_ms'] < 1000
+    assert record['function'] == 'SlowHandler.busy_wait'
+    assert record['location'].startswith('test_stall_watchdog.py:')
+    assert record['samples'] > 0
+    assert 'SlowHandler.on_click' in ' '.join(record['stack'])
+
+    with open(log_path, 'r', encoding='utf-8') as f:
+        logged = [json.loads(line) for line in f]
+    assert logged == [record]
+
+
+def test_idle_event_loop_has_no_stalls():
+    """事件循环正常处理事件时不记录卡顿"""
+    watchdog = StallWatchdog(150, roots=[TEST_DIR])
+    watchdog.start()
+    try:
+        _run_event_loop(0.6, (100, lambda: SlowHandler().busy_wait(0.02)))
+    finally:
+        watchdog.stop()
+    assert list(watchdog.records) == []
+
+
+if __name__ == '__main__':
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+测试启动耗时记录和启动性能测试的统计
+记录功能在子进程中通过环境变量启用，界面部分使用 offscreen 平台
+"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+
+sys.path.insert(0, ROOT_DIR)
+
+from benchmark_startup import percentile, summarize
+
+
+# 在子进程中记录两个阶段，并在窗口首次绘制时退出
+TRACE_SCRIPT = '''
+import sys
+sys.path.insert(0, {src!r})
+from utils import startup_trace
+startup_trace.mark('main_start', 1.0)
+from PyQt5.QtWidgets import QApplication, QWidget
+app = QApplication(sys.argv)
+startup_trace.mark('qapplication_created')
+window = QWidget()
+window.show()
+startup_trace.watch_first_paint(window)
+sys.exit(app.exec_())
+'''
+
+
+def _run_script(env_overrides):
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    env.pop('PANDOC_GUI_STARTUP_TRACE', None)
+    env.pop('PANDOC_GUI_STARTUP_EXIT', None)
+    env.update(env_overrides)
+    return subprocess.run(
+        [sys.executable, '-c', TRACE_SCRIPT.format(src=SRC_DIR)],
+        env=env, capture_output=True, timeout=60
+    )
+
+
+def test_trace_records_phases_until_first_paint():
+    """启用记录时每个阶段写入记录文件，首次绘制后退出程序"""
+    trace_path = os.path.join(tempfile.mkdtemp(), 'trace.jsonl')
+
+    result = _run_script({'PANDOC_GUI_STARTUP_TRACE': trace_path, 'PANDOC_GUI_STARTUP_EXIT': '1'})
+
+    assert result.returncode == 0, result.stderr
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 1
+    phases = [phase for phase, _ in records[0]['marks']]
+    assert phases == ['main_start', 'qapplication_created', 'first_paint']
+    assert records[0]['marks'][0][1] == 1.0
+
+
+def test_trace_disabled_by_default():
+    """未设置环境变量时不记录，也不会在首次绘制时退出"""
+    sys.path.insert(0, SRC_DIR)
+    from utils import startup_trace
+
+    assert not startup_trace.is_enabled()
+    startup_trace.mark('main_start')
+    assert startup_trace._marks == []
+
+
+def test_percentile_and_summary():
+    """p95使用最近秩法，汇总结果包含中位数和p95"""
+    values = list(range(1, 21))
+
+    assert percentile(values, 95) == 19
+    assert percentile(values, 100) == 20
+    assert percentile([5], 95) == 5
+    assert percentile([], 95) is None
+    assert summarize(values) == {'median': 10.5, 'p95': 19, 'min': 1, 'max': 20, 'runs': 20}
+
+
+if __name__ == '__main__':
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+测试预设模板
+界面部分使用 offscreen 平台，不需要显示器
+"""
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.template_manager import TemplateManager, PRESET_ALIASES, PRESET_SETTINGS, get_default_config
+
+
+# 改为从 PRESET_SETTINGS 加载之前，各预设模板的 apply_*_template 方法在新建的对话框中设置的值：
+# (1-4级标题字号, 1-4级标题是否加粗, 首行缩进, 行距, 段后间距, 表格字号)
+LEGACY_PRESET_VALUES = {
+    "学术论文模板": ((16, 14, 13, 12), (True, True, True, False), 2.0, 1.5, 6.0, 10),
+    "报告模板": ((18, 16, 14, 14), (True, True, True, True), 2.0, 1.5, 6.0, 11),
+    "小说模板": ((20, 16, 14, 14), (True, True, True, True), 2.0, 1.5, 6.0, 10),
+    "简历模板": ((18, 14, 14, 14), (True, True, True, True), 0.0, 1.15, 3.0, 10),
+    "信函模板": ((16, 14, 14, 14), (True, True, True, True), 2.0, 1.5, 6.0, 10),
+    "默认模板": ((16, 14, 13, 12), (True, True, True, False), 2.0, 1.5, 6.0, 10),
+}
+
+
+_app = None
+
+
+def _differences(expected, actual, path=''):
+    """比较两个配置字典，返回不同的项；字体名称取决于系统安装的字体，不参与比较"""
+    differences = []
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            differences.extend(_differences(value, actual.get(key, {}), f'{path}/{key}'))
+        elif not str(key).endswith('font') and actual.get(key) != value:
+            differences.append((f'{path}/{key}', value, actual.get(key)))
+    return differences
+
+
+def _preset_values(config):
+    """取出 LEGACY_PRESET_VALUES 中记录的各项"""
+    headings = [config['headings'][f'标题{level}'] for level in range(1, 5)]
+    text_format = config['basic_text']['format']
+    return (
+        tuple(heading['size'] for heading in headings),
+        tuple(heading['bold'] for heading in headings),
+        text_format['first_line_indent'],
+        text_format['line_spacing'],
+        text_format['paragraph_spacing'],
+        config['layout_elements']['table']['size'],
+    )
+
+
+def _create_dialog():
+    """新建排版配置对话框，QApplication在第一次调用时创建并一直保留"""
+    global _app
+    from PyQt5.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+    from ui.format_config import FormatConfigDialog
+    return FormatConfigDialog()
+
+
+def test_preset_config_without_widgets():
+    """预设模板的配置只在默认配置上修改差异项"""
+    manager = TemplateManager()
+    config = manager.get_preset_config('report')
+
+    assert config['basic_text']['char']['english_font'] == 'Arial'
+    assert [config['headings'][f'标题{level}']['size'] for level in (1, 2, 3, 9)] == [18, 16, 14, 14]
+    assert config['layout_elements']['table']['size'] == 11
+    assert config['page_settings'] == get_default_config()['page_settings']
+    assert manager.get_preset_config('unknown') is None
+    assert set(PRESET_ALIASES.values()) == set(PRESET_SETTINGS)
+
+
+def test_dialog_applies_each_preset():
+    """在新建的排版配置对话框中应用预设模板，结果与原来的实现和 get_preset_config 一致"""
+    assert set(LEGACY_PRESET_VALUES) == set(PRESET_SETTINGS)
+    for name in PRESET_SETTINGS:
+        dialog = _create_dialog()
+        dialog.template_manager.apply_template(name, dialog.widgets)
+        collected = dialog.config_manager.collect_config(dialog.widgets)
+
+        assert _preset_values(collected) == LEGACY_PRESET_VALUES[name], name
+        expected = dialog.template_manager.get_preset_config(name)
+        del expected['page_settings']
+        assert _differences(expected, collected) == [], name
+
+
+def test_dialog_preset_replaces_previous_preset():
+    """依次应用多个预设模板时，不保留前一个模板修改的项；加载默认配置时恢复所有项"""
+    dialog = _create_dialog()
+    manager = dialog.template_manager
+    manager.apply_template("报告模板", dialog.widgets)
+    manager.apply_template("小说模板", dialog.widgets)
+    collected = dialog.config_manager.collect_config(dialog.widgets)
+    assert _preset_values(collected) == LEGACY_PRESET_VALUES["小说模板"]
+
+    manager.apply_template("简历模板", dialog.widgets)
+    manager.load_default_config(dialog.widgets)
+    expected = get_default_config()
+    del expected['page_settings']
+    assert _differences(expected, dialog.config_manager.collect_config(dialog.widgets)) == []
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+测试网络时间查询和可信时间缓存
+使用本地的模拟NTP服务器，不访问外部网络
+"""
+
+import os
+import sys
+import json
+import socket
+import contextlib
+import time
+import tempfile
+import threading
+from datetime import datetime, timezone
+
+# 添加src目录到路径，以便导入模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import ntplib
+
+from core.version_checker import check_network_time, get_trusted_time
+from core.trusted_time import TrustedTimeCache
+
+
+# 模拟服务器返回的时间
+SERVER_TIME = datetime(2025, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeNtpServer:
+    """在本地UDP端口上应答NTP请求的模拟服务器
+
+    server_time 为None时只接收请求不应答，用于模拟无响应的服务器。
+    """
+
+    def __init__(self, server_time=SERVER_TIME, delay=0.0):
+        self.server_time = server_time
+        self.delay = delay
+        self.requests = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.sock.close()
+
+    @property
+    def address(self):
+        return ('127.0.0.1', self.port)
+
+    def _serve(self):
+        while True:
+            try:
+                data, address = self.sock.recvfrom(1024)
+            except OSError:
+                return
+            self.requests += 1
+            if self.server_time is None:
+                continue
+            time.sleep(self.delay)
+
+            request = ntplib.NTPPacket()
+            request.from_data(data)
+            packet = ntplib.NTPPacket(mode=4, version=3)
+            packet.stratum = 2
+            packet.orig_timestamp = request.tx_timestamp
+            packet.recv_timestamp = ntplib.system_to_ntp_time(self.server_time.timestamp())
+            packet.tx_timestamp = packet.recv_timestamp
+            try:
+                self.sock.sendto(packet.to_data(), address)
+            except OSError:
+                return
+
+
+class FakeClock:
+    """可手动调整的本地时钟和单调时钟"""
+
+    def __init__(self, wall=1_750_000_000.0, monotonic=10_000.0):
+        self.wall = wall
+        self.monotonic = monotonic
+
+    def advance(self, seconds):
+        self.wall += seconds
+        self.monotonic += seconds
+
+    def install(self, cache):
+        cache._wall_clock = lambda: self.wall
+        cache._monotonic_clock = lambda: self.monotonic
+        return cache
+
+
+def _make_cache(clock, max_age=3600):
+    path = os.path.join(tempfile.mkdtemp(), 'trusted_time.json')
+    return clock.install(TrustedTimeCache(path, max_age=max_age))
+
+
+def test_check_network_time_uses_local_server():
+    """可以向指定的服务器查询时间"""
+    with FakeNtpServer() as server:
+        current_time = check_network_time(timeout=1.0, servers=[server.address])
+    assert current_time is not None
+    assert abs(current_time.timestamp() - SERVER_TIME.timestamp()) < 1
+    assert server.requests == 1
+
+
+def test_check_network_time_takes_first_answer():
+    """不等待无响应或较慢的服务器，使用最先到达的应答"""
+    with FakeNtpServer(None) as silent, FakeNtpServer(delay=0.5) as slow, FakeNtpServer() as fast:
+        start = time.monotonic()
+        current_time = check_network_time(
+            timeout=2.0, servers=[silent.address, slow.address, fast.address]
+        )
+        elapsed = time.monotonic() - start
+    assert current_time is not None
+    assert abs(current_time.timestamp() - SERVER_TIME.timestamp()) < 1
+    assert elapsed < 0.4
+
+
+def test_check_network_time_stops_at_deadline():
+    """所有服务器都没有应答时，在截止时间返回None"""
+    with FakeNtpServer(None) as first, FakeNtpServer(None) as second:
+        start = time.monotonic()
+        current_time = check_network_time(timeout=0.3, servers=[first.address, second.address])
+        elapsed = time.monotonic() - start
+    assert current_time is None
+    assert 0.25 < elapsed < 0.6
+
+
+def test_check_network_time_uses_median_of_quorum():
+    """需要多个应答时取中位数，排除个别服务器的错误时间"""
+    times = [SERVER_TIME, SERVER_TIME.replace(hour=13), SERVER_TIME.replace(year=2030)]
+    with contextlib.ExitStack() as stack:
+        servers = [stack.enter_context(FakeNtpServer(server_time)) for server_time in times]
+        current_time = check_network_time(
+            timeout=1.0, servers=[server.address for server in servers], quorum=3
+        )
+    assert current_time is not None
+    assert abs(current_time.timestamp() - times[1].timestamp()) < 1
+
+
+def test_trusted_time_skips_network_within_window():
+    """有效期内的再次检查不访问网络，并按单调时钟推算当前时间"""
+    clock = FakeClock()
+    cache = _make_cache(clock)
+    with FakeNtpServer() as server:
+        first = get_trusted_time(1.0, cache, [server.address])
+        clock.advance(600)
+        second = get_trusted_time(1.0, cache, [server.address])
+        assert server.requests == 1
+    assert abs((second - first).total_seconds() - 600) < 1
+
+
+def test_trusted_time_requeries_after_window():
+    """超过有效期后重新查询网络时间"""
+    clock = FakeClock()
+    cache = _make_cache(clock, max_age=60)
+    with FakeNtpServer() as server:
+        get_trusted_time(1.0, cache, [server.address])
+        clock.advance(120)
+        get_trusted_time(1.0, cache, [server.address])
+        assert server.requests == 2
+
+
+def test_trusted_time_rejects_clock_changes():
+    """同一次开机期间修改系统时间后，缓存失效"""
+    clock = FakeClock()
+    cache = _make_cache(clock)
+    cache.save(SERVER_TIME)
+
+    clock.wall -= 3 * 24 * 3600
+    assert cache.get_time() is None
+
+    clock.wall += 6 * 24 * 3600
+    assert cache.get_time() is None
+
+
+def test_trusted_time_after_sleep_uses_wall_clock():
+    """休眠后使用本地时钟推算，本地时钟少于单调时钟经过的时间时缓存失效"""
+    clock = FakeClock()
+    cache = _make_cache(clock)
+    cache.save(SERVER_TIME)
+
+    clock.advance(600)
+    clock.wall += 1800
+    estimated = cache.get_time()
+    assert estimated is not None
+    assert abs(estimated.timestamp() - SERVER_TIME.timestamp() - 2400) < 1
+
+    clock.wall -= 2400
+    assert cache.get_time() is None
+
+
+def test_trusted_time_requeries_after_reboot():
+    """重新开机后无论本地时钟如何都重新查询网络时间"""
+    clock = FakeClock()
+    cache = _make_cache(clock)
+    with FakeNtpServer() as server:
+        get_trusted_time(1.0, cache, [server.address])
+
+        # 重新开机后把本地时钟设置为刚过验证时间
+        clock.wall += 60
+        clock.monotonic = 30.0
+        assert cache.get_time() is None
+        get_trusted_time(1.0, cache, [server.address])
+        assert server.requests == 2
+
+
+def test_trusted_time_rejects_tampered_cache():
+    """缓存文件被修改后校验失败"""
+    clock = FakeClock()
+    cache = _make_cache(clock)
+    cache.save(SERVER_TIME)
+
+    with open(cache.path, 'r', encoding='utf-8') as f:
+        record = json.load(f)
+    record['network_time'] -= 365 * 24 * 3600
+    with open(cache.path, 'w', encoding='utf-8') as f:
+        json.dump(record, f)
+
+    assert cache.load() is None
+    assert cache.get_time() is None
+
+
+if __name__ == '__main__':
+    tests = [value for name, value in list(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)